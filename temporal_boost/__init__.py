@@ -1,6 +1,11 @@
-from temporal_boost.boost_app import BoostApp
-from temporal_boost.workers.asgi_registry import ASGIWorkerType
-from temporal_boost.workers.base import BaseAsgiWorker, BaseBoostWorker
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from temporal_boost.boost_app import BoostApp
+    from temporal_boost.workers.asgi_registry import ASGIWorkerType
+    from temporal_boost.workers.base import BaseAsgiWorker, BaseBoostWorker
 
 
 __all__ = (
@@ -9,3 +14,25 @@ __all__ = (
     "BaseBoostWorker",
     "BoostApp",
 )
+
+# Resolved on first access, so importing a submodule such as temporal_boost.temporal.config
+# does not load the CLI, the worker adapters and the whole Temporal SDK
+_LAZY_IMPORTS = {
+    "ASGIWorkerType": "temporal_boost.workers.asgi_registry",
+    "BaseAsgiWorker": "temporal_boost.workers.base",
+    "BaseBoostWorker": "temporal_boost.workers.base",
+    "BoostApp": "temporal_boost.boost_app",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,241 @@
+import itertools
+import math
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from temporalio.client import (
+    Interceptor,
+    OutboundInterceptor,
+    QueryWorkflowInput,
+    SignalWorkflowInput,
+    StartWorkflowInput,
+    StartWorkflowUpdateInput,
+    StartWorkflowUpdateWithStartInput,
+    WorkflowHandle,
+    WorkflowUpdateHandle,
+    WorkflowUpdateStage,
+)
+
+from temporal_boost.asgi.http import Receive, Scope, Send, send_json
+from temporal_boost.cli.importer import import_app_object
+from temporal_boost.temporal import config
+
+
+@dataclass(frozen=True)
+class AdmissionOptions:
+    """Settings of ``AdmissionControl``; ``None`` values fall back to the ``TEMPORAL_ADMISSION_*`` settings.
+
+    ``max_in_flight`` bounds the Temporal RPCs in flight and ``max_latency`` their recent
+    latency in seconds; ``0`` disables a limit. ``paths`` restricts the check to requests
+    whose path starts with one of the prefixes, so health checks and docs stay reachable.
+    """
+
+    max_in_flight: int | None = None
+    max_latency: float | None = None
+    retry_after: float | None = None
+    window: float | None = None
+    paths: tuple[str, ...] | None = None
+
+
+@dataclass
+class AdmissionStats:
+    admitted: int = 0
+    rejected_in_flight: int = 0
+    rejected_latency: int = 0
+
+    @property
+    def rejected(self) -> int:
+        return self.rejected_in_flight + self.rejected_latency
+
+
+class RpcLoadTracker:
+    """In-flight count and recent latency of the calls timed with ``track()``.
+
+    Latency is an exponentially weighted moving average that is forgotten once no call
+    finished for ``window`` seconds, so a process shedding all of its load recovers on its
+    own. When at least half of the timed calls in flight are older than the average, the
+    median age counts instead, which reports a stalled frontend before any of the stalled
+    calls return without letting one stuck call shed everything. Calls tracked with
+    ``timed=False`` only count as in flight.
+    """
+
+    def __init__(self, *, window: float | None = None, smoothing: float = 0.2) -> None:
+        self._window = window if window is not None else config.ADMISSION_WINDOW
+        self._smoothing = smoothing
+        self._started: dict[int, float] = {}
+        self._untimed = 0
+        self._tokens = itertools.count()
+        self._average = 0.0
+        self._observed_at: float | None = None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._started) + self._untimed
+
+    @property
+    def latency(self) -> float:
+        now = time.monotonic()
+        average = 0.0
+        if self._observed_at is not None and now - self._observed_at <= self._window:
+            average = self._average
+        if not self._started:
+            return average
+        # Start time of the median call, rounding towards the younger half
+        starts = sorted(self._started.values())
+        return max(average, now - starts[len(starts) // 2])
+
+    @contextmanager
+    def track(self, *, timed: bool = True) -> Iterator[None]:
+        if not timed:
+            self._untimed += 1
+            try:
+                yield
+            finally:
+                self._untimed -= 1
+            return
+
+        token = next(self._tokens)
+        started = self._started[token] = time.monotonic()
+        try:
+            yield
+        finally:
+            del self._started[token]
+            self.observe(time.monotonic() - started)
+
+    def observe(self, duration: float) -> None:
+        now = time.monotonic()
+        if self._observed_at is None or now - self._observed_at > self._window:
+            self._average = duration
+        else:
+            self._average += self._smoothing * (duration - self._average)
+        self._observed_at = now
+
+
+class AdmissionInterceptor(Interceptor):
+    """Client interceptor timing start, signal and update RPCs with a ``RpcLoadTracker``.
+
+    Result long-polls are left out on purpose: they are slow by design and would hide the
+    latency of the calls that reflect frontend health. Queries count as in flight but are not
+    timed, since they wait for a workflow task and a single busy workflow would stall them.
+    """
+
+    def __init__(self, tracker: RpcLoadTracker) -> None:
+        self._tracker = tracker
+
+    def intercept_client(self, next: OutboundInterceptor) -> OutboundInterceptor:  # noqa: A002
+        return _AdmissionOutboundInterceptor(next, self._tracker)
+
+
+class _AdmissionOutboundInterceptor(OutboundInterceptor):
+    def __init__(self, next: OutboundInterceptor, tracker: RpcLoadTracker) -> None:  # noqa: A002
+        super().__init__(next)
+        self._tracker = tracker
+
+    async def start_workflow(self, input: StartWorkflowInput) -> WorkflowHandle[Any, Any]:  # noqa: A002
+        with self._tracker.track():
+            return await super().start_workflow(input)
+
+    async def signal_workflow(self, input: SignalWorkflowInput) -> None:  # noqa: A002
+        with self._tracker.track():
+            await super().signal_workflow(input)
+
+    async def query_workflow(self, input: QueryWorkflowInput) -> Any:  # noqa: A002
+        with self._tracker.track(timed=False):
+            return await super().query_workflow(input)
+
+    async def start_workflow_update(self, input: StartWorkflowUpdateInput) -> WorkflowUpdateHandle[Any]:  # noqa: A002
+        # Waiting for completion long-polls for as long as the update handler runs,
+        # so like result long-polls it says nothing about the load on the frontend
+        if input.wait_for_stage == WorkflowUpdateStage.COMPLETED:
+            return await super().start_workflow_update(input)
+        with self._tracker.track():
+            return await super().start_workflow_update(input)
+
+    async def start_update_with_start_workflow(
+        self,
+        input: StartWorkflowUpdateWithStartInput,  # noqa: A002
+    ) -> WorkflowUpdateHandle[Any]:
+        if input.update_workflow_input.wait_for_stage == WorkflowUpdateStage.COMPLETED:
+            return await super().start_update_with_start_workflow(input)
+        with self._tracker.track():
+            return await super().start_update_with_start_workflow(input)
+
+
+class AdmissionControl:
+    """ASGI middleware answering ``429 Too Many Requests`` while Temporal is overloaded.
+
+    A request is rejected with a ``Retry-After`` header when the tracked calls in flight
+    reach ``max_in_flight`` or their latency exceeds ``max_latency``, before the app does any
+    work for it. Pass the ``interceptor`` to the Temporal client so the tracker sees its RPCs;
+    without a shared ``tracker`` the middleware times the requests it admits instead.
+    Lifespan and WebSocket traffic pass through untouched.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        options: AdmissionOptions | None = None,
+        *,
+        tracker: RpcLoadTracker | None = None,
+    ) -> None:
+        options = options or AdmissionOptions()
+        self._app = app
+        self._max_in_flight = (
+            options.max_in_flight if options.max_in_flight is not None else config.ADMISSION_MAX_IN_FLIGHT
+        )
+        self._max_latency = options.max_latency if options.max_latency is not None else config.ADMISSION_MAX_LATENCY
+        retry_after = options.retry_after if options.retry_after is not None else config.ADMISSION_RETRY_AFTER
+        self._retry_after = str(max(1, math.ceil(retry_after))).encode()
+        self._paths = options.paths
+        self._track_requests = tracker is None
+        self.tracker = tracker or RpcLoadTracker(window=options.window)
+        self.stats = AdmissionStats()
+
+    @property
+    def app(self) -> Any:
+        if isinstance(self._app, str):
+            self._app = import_app_object(self._app)
+        return self._app
+
+    @property
+    def interceptor(self) -> AdmissionInterceptor:
+        return AdmissionInterceptor(self.tracker)
+
+    def overload_reason(self) -> str | None:
+        if self._max_in_flight and self.tracker.in_flight >= self._max_in_flight:
+            return "in_flight"
+        if self._max_latency and self.tracker.latency > self._max_latency:
+            return "latency"
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._guards(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        reason = self.overload_reason()
+        if reason is not None:
+            if reason == "in_flight":
+                self.stats.rejected_in_flight += 1
+            else:
+                self.stats.rejected_latency += 1
+            await send_json(
+                send,
+                429,
+                {"error": "Temporal is overloaded, retry later", "reason": reason},
+                headers=[(b"retry-after", self._retry_after)],
+            )
+            return
+
+        self.stats.admitted += 1
+        if not self._track_requests:
+            await self.app(scope, receive, send)
+            return
+        with self.tracker.track():
+            await self.app(scope, receive, send)
+
+    def _guards(self, path: str) -> bool:
+        return self._paths is None or any(path.startswith(prefix) for prefix in self._paths)
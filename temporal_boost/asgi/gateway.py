@@ -0,0 +1,409 @@
+import asyncio
+import contextlib
+import uuid
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+import temporalio.workflow
+from pydantic import ValidationError
+from temporalio.client import (
+    Client,
+    WorkflowFailureError,
+    WorkflowQueryFailedError,
+    WorkflowQueryRejectedError,
+    WorkflowUpdateFailedError,
+    WorkflowUpdateRPCTimeoutOrCancelledError,
+)
+from temporalio.exceptions import WorkflowAlreadyStartedError
+from temporalio.service import RPCError, RPCStatusCode
+
+from temporal_boost.asgi.http import (
+    HTTPError,
+    Receive,
+    Scope,
+    Send,
+    dump_json,
+    query_params,
+    read_json,
+    send_error,
+    send_json,
+    send_stream,
+    serve_lifespan,
+)
+from temporal_boost.asgi.lifespan import get_query_cache, get_result_waiter, get_temporal_client
+from temporal_boost.temporal import config
+from temporal_boost.temporal.bulk import BulkStartItem, BulkWorkflowStarter
+from temporal_boost.temporal.converter import to_type
+from temporal_boost.temporal.update import UpdateWithStartCaller
+
+
+@dataclass(frozen=True)
+class GatewayWorkflow:
+    """Workflow type exposed by ``WorkflowGateway``, with the type hints used to validate requests."""
+
+    name: str
+    task_queue: str
+    arg_types: list[Any] | None = None
+    ret_type: Any = None
+    signals: dict[str, list[Any] | None] = field(default_factory=dict)
+    queries: dict[str, tuple[list[Any] | None, Any]] = field(default_factory=dict)
+    updates: dict[str, tuple[list[Any] | None, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_class(cls, workflow: type, task_queue: str) -> "GatewayWorkflow":
+        definition = temporalio.workflow._Definition.must_from_class(workflow)  # noqa: SLF001
+        if definition.name is None:
+            raise ValueError(f"Dynamic workflow '{workflow.__qualname__}' cannot be exposed through the gateway")
+        return cls(
+            name=definition.name,
+            task_queue=task_queue,
+            arg_types=definition.arg_types,
+            ret_type=definition.ret_type,
+            signals={name: signal.arg_types for name, signal in definition.signals.items() if name is not None},
+            queries={
+                name: (query.arg_types, query.ret_type)
+                for name, query in definition.queries.items()
+                if name is not None
+            },
+            updates={
+                name: (update.arg_types, update.ret_type)
+                for name, update in definition.updates.items()
+                if name is not None
+            },
+        )
+
+
+def validate_args(values: Any, arg_types: Sequence[Any] | None) -> list[Any]:
+    # Validates JSON ``args`` against the handler's type hints, collecting every error
+    if values is None:
+        values = []
+    if not isinstance(values, list):
+        raise HTTPError(422, "'args' must be a list")
+    if arg_types is None:
+        return values
+    if len(values) != len(arg_types):
+        raise HTTPError(422, f"Expected {len(arg_types)} argument(s), got {len(values)}")
+
+    converted: list[Any] = []
+    errors: list[dict[str, Any]] = []
+    for index, (value, type_hint) in enumerate(zip(values, arg_types, strict=True)):
+        try:
+            converted.append(to_type(value, type_hint))
+        except ValidationError as exc:  # noqa: PERF203
+            errors.extend(
+                {"loc": ["args", index, *error["loc"]], "msg": error["msg"], "type": error["type"]}
+                for error in exc.errors(include_url=False)
+            )
+        except (TypeError, ValueError) as exc:
+            errors.append({"loc": ["args", index], "msg": str(exc), "type": "value_error"})
+    if errors:
+        raise HTTPError(422, errors)
+    return converted
+
+
+@contextlib.contextmanager
+def temporal_errors() -> Iterator[None]:
+    # Maps client errors to HTTP statuses; anything else is left to the server as a 500
+    try:
+        yield
+    except WorkflowAlreadyStartedError as exc:
+        raise HTTPError(409, f"Workflow '{exc.workflow_id}' is already running") from exc
+    except WorkflowFailureError as exc:
+        raise HTTPError(500, {"message": "Workflow failed", "cause": str(exc.cause)}) from exc
+    except (WorkflowQueryFailedError, WorkflowQueryRejectedError) as exc:
+        raise HTTPError(400, f"Query failed: {exc}") from exc
+    except WorkflowUpdateFailedError as exc:
+        raise HTTPError(400, {"message": "Update failed", "cause": str(exc.cause)}) from exc
+    except (asyncio.TimeoutError, WorkflowUpdateRPCTimeoutOrCancelledError) as exc:
+        raise HTTPError(504, "Timed out waiting for the workflow") from exc
+    except RPCError as exc:
+        if exc.status == RPCStatusCode.NOT_FOUND:
+            raise HTTPError(404, exc.message) from exc
+        raise HTTPError(502, exc.message) from exc
+
+
+def _body_object(body: Any) -> dict[str, Any]:
+    if body is None:
+        return {}
+    if not isinstance(body, dict):
+        raise HTTPError(422, "Request body must be a JSON object")
+    return body
+
+
+def _timeout(scope: Scope) -> float | None:
+    value = query_params(scope).get("timeout")
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise HTTPError(422, f"Invalid timeout '{value}'") from None
+
+
+class WorkflowGateway:
+    """ASGI app exposing HTTP endpoints for a set of workflow types.
+
+    Routes, relative to ``prefix``, with ``{workflow}`` the workflow type name:
+
+    - ``GET /``: registered workflows, their signals and queries
+    - ``POST /{workflow}/start``: ``{"id": ..., "args": [...]}``, ``id`` defaults to a random one
+    - ``POST /{workflow}/start-batch``: ``{"items": [{"id": ..., "args": [...]}, ...]}``, streamed
+      back as one NDJSON line per workflow as starts complete
+    - ``GET /{workflow}/{workflow_id}/result?timeout=...``
+    - ``POST /{workflow}/{workflow_id}/signal/{signal}``: ``{"args": [...]}``
+    - ``GET|POST /{workflow}/{workflow_id}/query/{query}``: ``{"args": [...]}`` for POST
+    - ``POST /{workflow}/{workflow_id}/update/{update}?timeout=...``: ``{"args": [...],
+      "update_args": [...], "wait_for_stage": "completed"}``, starting the workflow with
+      ``args`` unless it is already running, see ``UpdateWithStartCaller``
+
+    Arguments are validated against the workflow's type hints before any RPC is made. The
+    Temporal client comes from the ASGI scope, see ``TemporalClientLifespan``.
+    """
+
+    def __init__(
+        self,
+        workflows: Iterable[GatewayWorkflow],
+        *,
+        prefix: str = "",
+        max_body_size: int | None = None,
+        batch_concurrency: int | None = None,
+    ) -> None:
+        self._workflows = {workflow.name: workflow for workflow in workflows}
+        self._prefix = prefix.rstrip("/")
+        self._max_body_size = max_body_size or config.GATEWAY_MAX_BODY_SIZE
+        self._batch_concurrency = batch_concurrency or config.GATEWAY_BATCH_CONCURRENCY
+
+    @property
+    def workflows(self) -> dict[str, GatewayWorkflow]:
+        return dict(self._workflows)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await serve_lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        try:
+            await self._dispatch(scope, receive, send)
+        except HTTPError as exc:
+            await send_error(send, exc)
+
+    async def _dispatch(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path: str = scope["path"]
+        if not path.startswith(self._prefix):
+            raise HTTPError(404, "Not found")
+        segments = [segment for segment in path[len(self._prefix) :].split("/") if segment]
+        method: str = scope["method"]
+
+        if not segments:
+            self._require_method(method, "GET")
+            await send_json(send, 200, {"workflows": self._describe()})
+            return
+
+        workflow = self._workflows.get(segments[0])
+        if workflow is None:
+            raise HTTPError(404, f"Unknown workflow '{segments[0]}'")
+
+        route = segments[1:]
+        with temporal_errors():
+            if route == ["start"]:
+                self._require_method(method, "POST")
+                await self._start(workflow, scope, receive, send)
+            elif route == ["start-batch"]:
+                self._require_method(method, "POST")
+                await self._start_batch(workflow, scope, receive, send)
+            elif len(route) == 2 and route[1] == "result":  # noqa: PLR2004
+                self._require_method(method, "GET")
+                await self._result(workflow, route[0], scope, send)
+            elif len(route) == 3 and route[1] == "signal":  # noqa: PLR2004
+                self._require_method(method, "POST")
+                await self._signal(workflow, scope, receive, send, workflow_id=route[0], signal=route[2])
+            elif len(route) == 3 and route[1] == "query":  # noqa: PLR2004
+                self._require_method(method, "GET", "POST")
+                await self._query(workflow, scope, receive, send, workflow_id=route[0], query=route[2])
+            elif len(route) == 3 and route[1] == "update":  # noqa: PLR2004
+                self._require_method(method, "POST")
+                await self._update(workflow, scope, receive, send, workflow_id=route[0], update=route[2])
+            else:
+                raise HTTPError(404, "Not found")
+
+    @staticmethod
+    def _require_method(method: str, *allowed: str) -> None:
+        if method not in allowed:
+            raise HTTPError(405, f"Method {method} not allowed", headers=[(b"allow", ", ".join(allowed).encode())])
+
+    def _describe(self) -> dict[str, Any]:
+        return {
+            name: {
+                "task_queue": workflow.task_queue,
+                "signals": list(workflow.signals),
+                "queries": list(workflow.queries),
+                "updates": list(workflow.updates),
+            }
+            for name, workflow in self._workflows.items()
+        }
+
+    async def _start(self, workflow: GatewayWorkflow, scope: Scope, receive: Receive, send: Send) -> None:
+        body = _body_object(await read_json(receive, self._max_body_size))
+        args = validate_args(body.get("args"), workflow.arg_types)
+        workflow_id = body.get("id") or f"{workflow.name}-{uuid.uuid4()}"
+
+        handle = await get_temporal_client(scope).start_workflow(
+            workflow.name,
+            args=args,
+            id=workflow_id,
+            task_queue=workflow.task_queue,
+        )
+        await send_json(send, 201, {"workflow_id": handle.id, "run_id": handle.result_run_id})
+
+    async def _start_batch(self, workflow: GatewayWorkflow, scope: Scope, receive: Receive, send: Send) -> None:
+        body = _body_object(await read_json(receive, self._max_body_size))
+        items = body.get("items")
+        if not isinstance(items, list):
+            raise HTTPError(422, "'items' must be a list")
+
+        # Validate everything first, so a bad item rejects the batch before anything starts
+        start_items: list[BulkStartItem] = []
+        errors: list[dict[str, Any]] = []
+        for index, item in enumerate(items):
+            try:
+                item_object = _body_object(item)
+                args = validate_args(item_object.get("args"), workflow.arg_types)
+            except HTTPError as exc:
+                errors.append({"index": index, "error": exc.detail})
+                continue
+            workflow_id = item_object.get("id") or f"{workflow.name}-{uuid.uuid4()}"
+            start_items.append(BulkStartItem(workflow.name, args, workflow_id))
+        if errors:
+            raise HTTPError(422, errors)
+
+        starter = BulkWorkflowStarter(
+            cast("Client", get_temporal_client(scope)),
+            workflow.task_queue,
+            concurrency=self._batch_concurrency,
+        )
+
+        async def lines() -> AsyncIterator[bytes]:
+            async for result in starter.stream(start_items):
+                line: dict[str, Any] = {"index": result.index, "workflow_id": result.id}
+                if result.already_started:
+                    line["status"] = "already_started"
+                elif result.ok:
+                    line["status"] = "started"
+                else:
+                    line.update(status="failed", error=str(result.error))
+                yield dump_json(line) + b"\n"
+
+        await send_stream(send, 200, lines())
+
+    async def _result(self, workflow: GatewayWorkflow, workflow_id: str, scope: Scope, send: Send) -> None:
+        run_id = query_params(scope).get("run_id")
+        waiter = get_result_waiter(scope)
+        if waiter is not None:
+            result = await waiter.result(
+                workflow_id, run_id=run_id, result_type=workflow.ret_type, timeout=_timeout(scope)
+            )
+        else:
+            handle = get_temporal_client(scope).get_workflow_handle(
+                workflow_id,
+                run_id=run_id,
+                result_type=workflow.ret_type,
+            )
+            result = await asyncio.wait_for(handle.result(), _timeout(scope))
+        await send_json(send, 200, {"workflow_id": workflow_id, "result": result})
+
+    async def _signal(  # noqa: PLR0913
+        self,
+        workflow: GatewayWorkflow,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        *,
+        workflow_id: str,
+        signal: str,
+    ) -> None:
+        if signal not in workflow.signals:
+            raise HTTPError(404, f"Unknown signal '{signal}' for workflow '{workflow.name}'")
+        body = _body_object(await read_json(receive, self._max_body_size))
+        args = validate_args(body.get("args"), workflow.signals[signal])
+
+        cache = get_query_cache(scope)
+        if cache is not None:
+            await cache.signal(workflow_id, signal, *args)
+        else:
+            await get_temporal_client(scope).get_workflow_handle(workflow_id).signal(signal, args=args)
+        await send_json(send, 202, {"workflow_id": workflow_id, "signal": signal})
+
+    async def _query(  # noqa: PLR0913
+        self,
+        workflow: GatewayWorkflow,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        *,
+        workflow_id: str,
+        query: str,
+    ) -> None:
+        if query not in workflow.queries:
+            raise HTTPError(404, f"Unknown query '{query}' for workflow '{workflow.name}'")
+        arg_types, ret_type = workflow.queries[query]
+        body = _body_object(await read_json(receive, self._max_body_size)) if scope["method"] == "POST" else {}
+        args = validate_args(body.get("args"), arg_types)
+
+        cache = get_query_cache(scope)
+        if cache is not None:
+            result = await cache.query(workflow_id, query, *args, result_type=ret_type)
+        else:
+            handle = get_temporal_client(scope).get_workflow_handle(workflow_id)
+            result = await handle.query(query, args=args, result_type=ret_type)
+        await send_json(send, 200, {"workflow_id": workflow_id, "result": result})
+
+    async def _update(  # noqa: PLR0913
+        self,
+        workflow: GatewayWorkflow,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        *,
+        workflow_id: str,
+        update: str,
+    ) -> None:
+        if update not in workflow.updates:
+            raise HTTPError(404, f"Unknown update '{update}' for workflow '{workflow.name}'")
+        arg_types, ret_type = workflow.updates[update]
+        body = _body_object(await read_json(receive, self._max_body_size))
+        args = validate_args(body.get("args"), workflow.arg_types)
+        update_args = validate_args(body.get("update_args"), arg_types)
+        try:
+            caller = UpdateWithStartCaller(
+                cast("Client", get_temporal_client(scope)),
+                workflow.task_queue,
+                wait_for_stage=body.get("wait_for_stage"),
+                timeout=_timeout(scope),
+            )
+        except ValueError as exc:
+            raise HTTPError(422, str(exc)) from None
+
+        result = await caller.call(
+            workflow.name,
+            update,
+            workflow_id=workflow_id,
+            args=args,
+            update_args=update_args,
+            update_id=body.get("update_id"),
+            result_type=ret_type,
+        )
+        cache = get_query_cache(scope)
+        if cache is not None:
+            cache.invalidate(workflow_id)
+        content: dict[str, Any] = {
+            "workflow_id": result.workflow_id,
+            "run_id": result.run_id,
+            "update_id": result.update_id,
+            "stage": result.stage.name.lower(),
+        }
+        if result.completed:
+            content["result"] = result.result
+        await send_json(send, 200 if result.completed else 202, content)
@@ -0,0 +1,135 @@
+import asyncio
+import contextlib
+from collections.abc import Sequence
+from http import HTTPStatus
+from typing import Any
+
+from temporal_boost.asgi.http import HTTPError, Message, Receive, Scope, Send, send_error, send_json, serve_lifespan
+from temporal_boost.temporal import config
+from temporal_boost.temporal.health import WorkerHealth
+
+
+_MAX_REQUEST_HEAD = 8192
+
+
+class WorkerHealthApp:
+    """ASGI app reporting the health of Temporal workers.
+
+    ``GET /live`` answers ``503`` when an event loop lags more than allowed, ``GET /ready``
+    answers ``503`` until every worker is running and polling, and ``GET /`` returns the full
+    report with slot usage per type. Responses are built from counters only, so the routes can
+    be scraped every second.
+    """
+
+    def __init__(self, healths: Sequence[WorkerHealth], *, prefix: str = "") -> None:
+        self._healths = list(healths)
+        self._prefix = prefix.rstrip("/")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await serve_lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        try:
+            await self._route(scope, send)
+        except HTTPError as error:
+            await send_error(send, error)
+
+    async def _route(self, scope: Scope, send: Send) -> None:
+        path = scope["path"]
+        if not path.startswith(self._prefix):
+            raise HTTPError(404, "Not found")
+        route = path[len(self._prefix) :].rstrip("/")
+        if route not in {"", "/live", "/ready"}:
+            raise HTTPError(404, "Not found")
+        if scope["method"] not in {"GET", "HEAD"}:
+            raise HTTPError(405, "Method not allowed", headers=[(b"allow", b"GET, HEAD")])
+
+        if route == "/live":
+            live = all(health.live for health in self._healths)
+            lags = {health.name: round(health.loop_lag, 4) for health in self._healths}
+            await send_json(send, 200 if live else 503, {"live": live, "event_loop_lag": lags})
+        elif route == "/ready":
+            ready = all(health.ready for health in self._healths)
+            workers = {health.name: health.ready for health in self._healths}
+            await send_json(send, 200 if ready else 503, {"ready": ready, "workers": workers})
+        else:
+            await send_json(send, 200, {"workers": [health.snapshot() for health in self._healths]})
+
+
+class HealthServer:
+    """Minimal HTTP/1.1 server running an ASGI app on the current event loop.
+
+    Meant for health probes of processes that have no ASGI server of their own: each
+    connection serves one request without a body and is closed after the response.
+    """
+
+    def __init__(self, app: Any, host: str | None = None, port: int = 0) -> None:
+        self._app = app
+        self._host = host or config.HEALTH_HOST
+        self._port = port
+        self._server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        if self._server is None:
+            return self._port
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if len(head) > _MAX_REQUEST_HEAD:
+                return
+            method, target, _ = head.split(b"\r\n", 1)[0].decode("latin-1").split(" ", 2)
+            path, _, query = target.partition("?")
+            scope = {
+                "type": "http",
+                "http_version": "1.1",
+                "method": method,
+                "path": path,
+                "query_string": query.encode(),
+                "headers": [],
+            }
+            writer.write(await self._respond(scope))
+            await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _respond(self, scope: Scope) -> bytes:
+        status = 500
+        headers: list[tuple[bytes, bytes]] = []
+        body: list[bytes] = []
+
+        async def receive() -> Message:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers.extend(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                body.append(message.get("body", b""))
+
+        await self._app(scope, receive, send)
+        content = b"" if scope["method"] == "HEAD" else b"".join(body)
+        lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}".encode()]
+        lines.extend(name + b": " + value for name, value in headers)
+        lines.append(b"connection: close")
+        return b"\r\n".join(lines) + b"\r\n\r\n" + content
@@ -0,0 +1,119 @@
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable, MutableMapping
+from typing import Any
+from urllib.parse import parse_qsl
+
+from pydantic_core import from_json, to_json
+
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+JSON_CONTENT_TYPE = b"application/json"
+NDJSON_CONTENT_TYPE = b"application/x-ndjson"
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, detail: Any, *, headers: Iterable[tuple[bytes, bytes]] = ()) -> None:
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+        self.headers = list(headers)
+
+
+def dump_json(value: Any) -> bytes:
+    # pydantic-core serializes models, dataclasses, datetimes, UUIDs, ... without a Python round trip
+    return to_json(value, serialize_unknown=True)
+
+
+def query_params(scope: Scope) -> dict[str, str]:
+    return dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+
+
+async def read_body(receive: Receive, max_size: int) -> bytes:
+    chunks: list[bytes] = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise HTTPError(400, "Client disconnected")
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > max_size:
+            raise HTTPError(413, f"Request body exceeds {max_size} bytes")
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+async def read_json(receive: Receive, max_size: int) -> Any:
+    body = await read_body(receive, max_size)
+    if not body:
+        return None
+    try:
+        return from_json(body)
+    except ValueError as exc:
+        raise HTTPError(400, f"Invalid JSON body: {exc}") from None
+
+
+async def send_response(
+    send: Send,
+    status: int,
+    body: bytes,
+    *,
+    content_type: bytes = JSON_CONTENT_TYPE,
+    headers: Iterable[tuple[bytes, bytes]] = (),
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", content_type),
+                (b"content-length", str(len(body)).encode()),
+                *headers,
+            ],
+        },
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def send_json(send: Send, status: int, content: Any, *, headers: Iterable[tuple[bytes, bytes]] = ()) -> None:
+    await send_response(send, status, dump_json(content), headers=headers)
+
+
+async def send_stream(
+    send: Send,
+    status: int,
+    chunks: AsyncIterable[bytes],
+    *,
+    content_type: bytes = NDJSON_CONTENT_TYPE,
+    headers: Iterable[tuple[bytes, bytes]] = (),
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", content_type), (b"cache-control", b"no-cache"), *headers],
+        },
+    )
+    async for chunk in chunks:
+        await send({"type": "http.response.body", "body": chunk, "more_body": True})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def send_error(send: Send, error: HTTPError) -> None:
+    await send_json(send, error.status, {"error": error.detail}, headers=error.headers)
+
+
+async def serve_lifespan(receive: Receive, send: Send) -> None:
+    # For standalone components that hold no resources of their own
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
@@ -0,0 +1,196 @@
+import asyncio
+import logging
+from typing import Any
+
+from temporalio.client import Client
+
+from temporal_boost.asgi.http import Message, Receive, Scope, Send
+from temporal_boost.cli.importer import import_app_object
+from temporal_boost.temporal.client import TemporalClientBuilder
+from temporal_boost.temporal.pool import TemporalClientPool
+from temporal_boost.temporal.query_cache import QueryCache, QueryCacheInterceptor, QueryCacheOptions
+from temporal_boost.temporal.result_waiter import ResultWaiter
+
+
+logger = logging.getLogger(__name__)
+
+TEMPORAL_CLIENT_STATE_KEY = "temporal_client"
+QUERY_CACHE_STATE_KEY = "temporal_query_cache"
+RESULT_WAITER_STATE_KEY = "temporal_result_waiter"
+
+
+def get_temporal_client(source: Any) -> Client | TemporalClientPool:
+    # Accepts a Starlette/FastAPI request or a raw ASGI scope
+    scope = getattr(source, "scope", source)
+    try:
+        return scope["state"][TEMPORAL_CLIENT_STATE_KEY]  # type: ignore[no-any-return]
+    except KeyError:
+        raise RuntimeError(
+            "Temporal client is not available. Ensure the ASGI worker was added with temporal_client=True",
+        ) from None
+
+
+def get_query_cache(source: Any) -> QueryCache | None:
+    scope = getattr(source, "scope", source)
+    return scope.get("state", {}).get(QUERY_CACHE_STATE_KEY)  # type: ignore[no-any-return]
+
+
+def get_result_waiter(source: Any) -> ResultWaiter | None:
+    scope = getattr(source, "scope", source)
+    return scope.get("state", {}).get(RESULT_WAITER_STATE_KEY)  # type: ignore[no-any-return]
+
+
+class TemporalClientLifespan:
+    """ASGI middleware owning one Temporal client, or client pool, for the lifetime of the app.
+
+    The client connects on ``lifespan.startup`` and is released after the app completes
+    ``lifespan.shutdown``. Requests find it in ``scope["state"]`` (``request.state.temporal_client``
+    in Starlette and FastAPI), and apps with a ``state`` attribute get ``app.state.temporal_client``
+    too. Apps without lifespan support still work: the middleware then answers the lifespan
+    protocol itself, and servers without lifespan support connect on the first request.
+
+    A ``ResultWaiter`` sharing result long-polls is published next to the client as
+    ``temporal_result_waiter``, and with ``query_cache`` options a ``QueryCache`` as
+    ``temporal_query_cache``. The cache is then invalidated by every signal and update sent
+    through the client, not only those sent through the cache.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        client_builder: TemporalClientBuilder,
+        *,
+        pool_size: int = 1,
+        query_cache: QueryCacheOptions | None = None,
+    ) -> None:
+        self._app = app
+        self._client_builder = client_builder
+        self._pool_size = pool_size
+        self._query_cache_options = query_cache
+        self._client: Client | TemporalClientPool | None = None
+        self._query_cache: QueryCache | None = None
+        self._query_cache_interceptor: QueryCacheInterceptor | None = None
+        if query_cache is not None:
+            self._query_cache_interceptor = QueryCacheInterceptor()
+            client_builder.add_interceptor(self._query_cache_interceptor)
+        self._result_waiter: ResultWaiter | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def app(self) -> Any:
+        if isinstance(self._app, str):
+            self._app = import_app_object(self._app)
+        return self._app
+
+    @property
+    def client(self) -> Client | TemporalClientPool:
+        if self._client is None:
+            raise RuntimeError("Temporal client is not connected. It is created on ASGI lifespan startup")
+        return self._client
+
+    @property
+    def query_cache(self) -> QueryCache | None:
+        return self._query_cache
+
+    @property
+    def result_waiter(self) -> ResultWaiter | None:
+        return self._result_waiter
+
+    async def connect(self) -> Client | TemporalClientPool:
+        async with self._lock:
+            if self._client is None:
+                if self._pool_size > 1:
+                    self._client = await self._client_builder.build_pool(self._pool_size)
+                else:
+                    self._client = await self._client_builder.build()
+                self._result_waiter = ResultWaiter(self._client)
+                if self._query_cache_interceptor is not None:
+                    self._query_cache = QueryCache(self._client, self._query_cache_options)
+                    self._query_cache_interceptor.cache = self._query_cache
+                self._set_app_state(self._client)
+                logger.info("Temporal client for ASGI app connected")
+        return self._client
+
+    async def close(self) -> None:
+        # The SDK has no explicit close: connections are released with the last reference
+        async with self._lock:
+            if self._client is None:
+                return
+            self._client = None
+            self._query_cache = None
+            if self._query_cache_interceptor is not None:
+                self._query_cache_interceptor.cache = None
+            self._result_waiter = None
+            self._set_app_state(None)
+            logger.info("Temporal client for ASGI app released")
+
+    def _state(self, client: Client | TemporalClientPool) -> dict[str, Any]:
+        state: dict[str, Any] = {TEMPORAL_CLIENT_STATE_KEY: client, RESULT_WAITER_STATE_KEY: self._result_waiter}
+        if self._query_cache is not None:
+            state[QUERY_CACHE_STATE_KEY] = self._query_cache
+        return state
+
+    def _set_app_state(self, client: Client | TemporalClientPool | None) -> None:
+        state = getattr(self.app, "state", None)
+        if state is None:
+            return
+        if client is not None:
+            for key, value in self._state(client).items():
+                setattr(state, key, value)
+            return
+        for key in (TEMPORAL_CLIENT_STATE_KEY, RESULT_WAITER_STATE_KEY, QUERY_CACHE_STATE_KEY):
+            if hasattr(state, key):
+                delattr(state, key)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(scope, receive, send)
+            return
+
+        client = self._client if self._client is not None else await self.connect()
+        scope.setdefault("state", {}).update(self._state(client))
+        await self.app(scope, receive, send)
+
+    async def _lifespan(self, scope: Scope, receive: Receive, send: Send) -> None:
+        received = False
+
+        async def receive_wrapper() -> Message:
+            nonlocal received
+            message = await receive()
+            received = True
+            if message["type"] == "lifespan.startup":
+                client = await self.connect()
+                if "state" in scope:
+                    scope["state"].update(self._state(client))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] in {"lifespan.shutdown.complete", "lifespan.shutdown.failed"}:
+                await self.close()
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        except Exception:
+            if received:
+                raise
+            # The app does not implement lifespan, so run the protocol for the client alone
+            await self._own_lifespan(scope, receive, send)
+
+    async def _own_lifespan(self, scope: Scope, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    client = await self.connect()
+                except Exception as exc:
+                    logger.exception("Failed to connect Temporal client for ASGI app")
+                    await send({"type": "lifespan.startup.failed", "message": str(exc)})
+                    return
+                if "state" in scope:
+                    scope["state"].update(self._state(client))
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
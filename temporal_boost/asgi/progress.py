@@ -0,0 +1,356 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from temporalio.client import Client, WorkflowFailureError, WorkflowHandle
+from temporalio.service import RPCError, RPCStatusCode
+
+from temporal_boost.asgi.http import HTTPError, Receive, Scope, Send, dump_json, send_error, serve_lifespan
+from temporal_boost.asgi.lifespan import get_temporal_client
+from temporal_boost.temporal import config
+from temporal_boost.temporal.pool import TemporalClientPool
+
+
+logger = logging.getLogger(__name__)
+
+SSE_CONTENT_TYPE = b"text/event-stream"
+
+_TERMINAL_EVENTS = frozenset({"completed", "failed", "not_found", "error"})
+
+
+class _Disconnected(Exception):  # noqa: N818
+    pass
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    event: str
+    data: Any = None
+
+    @property
+    def terminal(self) -> bool:
+        return self.event in _TERMINAL_EVENTS
+
+    def to_json(self) -> bytes:
+        return dump_json({"event": self.event, "data": self.data})
+
+    def to_sse(self) -> bytes:
+        return b"event: " + self.event.encode() + b"\ndata: " + dump_json(self.data) + b"\n\n"
+
+
+class ProgressSubscription:
+    """Events of one workflow for one subscriber.
+
+    The buffer is bounded: a subscriber that falls behind loses the oldest progress
+    events, never the latest one or the terminal event.
+    """
+
+    def __init__(self, buffer_size: int) -> None:
+        self._queue: asyncio.Queue[ProgressEvent] = asyncio.Queue(maxsize=buffer_size)
+
+    def put(self, event: ProgressEvent) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(event)
+
+    async def get(self) -> ProgressEvent:
+        return await self._queue.get()
+
+    async def __aiter__(self) -> AsyncIterator[ProgressEvent]:
+        while True:
+            event = await self.get()
+            yield event
+            if event.terminal:
+                return
+
+
+class _ProgressPoller:
+    # One query loop and one result long-poll per workflow ID, fanned out to every subscriber
+
+    def __init__(
+        self,
+        handle: WorkflowHandle[Any, Any],
+        query: str,
+        query_args: Sequence[Any],
+        interval: float,
+    ) -> None:
+        self._handle = handle
+        self._query = query
+        self._query_args = query_args
+        self._interval = interval
+        self._subscribers: set[ProgressSubscription] = set()
+        self._last_progress: ProgressEvent | None = None
+        self._last_payload: bytes | None = None
+        self._terminal: ProgressEvent | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def finished(self) -> bool:
+        return self._terminal is not None or (self._task is not None and self._task.done())
+
+    def add(self, subscription: ProgressSubscription) -> None:
+        # Late subscribers get the current state straight away instead of waiting for a change
+        for event in (self._last_progress, self._terminal):
+            if event is not None:
+                subscription.put(event)
+        self._subscribers.add(subscription)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"progress-{self._handle.id}")
+
+    def remove(self, subscription: ProgressSubscription) -> None:
+        self._subscribers.discard(subscription)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+    def _publish(self, event: ProgressEvent) -> None:
+        if event.terminal:
+            self._terminal = event
+        else:
+            self._last_progress = event
+        for subscription in self._subscribers:
+            subscription.put(event)
+
+    async def _run(self) -> None:
+        result_task = asyncio.create_task(self._wait_result())
+        try:
+            while not result_task.done():
+                terminal = await self._poll()
+                if terminal is not None:
+                    self._publish(terminal)
+                    return
+                await asyncio.wait({result_task}, timeout=self._interval)
+            # One last query so subscribers see the final progress before the outcome
+            await self._poll()
+            self._publish(result_task.result())
+        finally:
+            result_task.cancel()
+
+    async def _poll(self) -> ProgressEvent | None:
+        try:
+            progress = await self._handle.query(self._query, args=self._query_args)
+        except Exception as exc:
+            if isinstance(exc, RPCError) and exc.status == RPCStatusCode.NOT_FOUND:
+                return ProgressEvent("not_found", {"message": exc.message})
+            # Transient, e.g. no worker polling right now: keep the last progress and retry
+            logger.warning(f"Progress query '{self._query}' for workflow '{self._handle.id}' failed: {exc}")
+            return None
+
+        payload = dump_json(progress)
+        if payload != self._last_payload:
+            self._last_payload = payload
+            self._publish(ProgressEvent("progress", progress))
+        return None
+
+    async def _wait_result(self) -> ProgressEvent:
+        try:
+            result = await self._handle.result()
+        except WorkflowFailureError as exc:
+            return ProgressEvent("failed", {"message": str(exc.cause)})
+        except RPCError as exc:
+            if exc.status == RPCStatusCode.NOT_FOUND:
+                return ProgressEvent("not_found", {"message": exc.message})
+            return ProgressEvent("error", {"message": exc.message})
+        except Exception as exc:
+            return ProgressEvent("error", {"message": str(exc)})
+        return ProgressEvent("completed", result)
+
+
+class ProgressHub:
+    """Shares one progress poller per workflow ID between all of its subscribers.
+
+    The first subscriber of a workflow starts a loop running ``query`` every ``interval``
+    seconds next to a single ``result()`` long-poll; changed query results are published as
+    ``progress`` events, and the outcome as ``completed``, ``failed`` or ``not_found``. The
+    loop stops as soon as the last subscriber leaves.
+    """
+
+    def __init__(
+        self,
+        query: str,
+        *,
+        query_args: Sequence[Any] = (),
+        interval: float | None = None,
+        buffer_size: int = 16,
+    ) -> None:
+        self._query = query
+        self._query_args = query_args
+        self._interval = interval if interval is not None else config.PROGRESS_POLL_INTERVAL
+        self._buffer_size = buffer_size
+        self._pollers: dict[str, _ProgressPoller] = {}
+
+    @property
+    def active_workflows(self) -> list[str]:
+        return list(self._pollers)
+
+    @contextlib.asynccontextmanager
+    async def subscribe(
+        self,
+        client: Client | TemporalClientPool,
+        workflow_id: str,
+    ) -> AsyncIterator[ProgressSubscription]:
+        poller = self._pollers.get(workflow_id)
+        if poller is None or poller.finished:
+            handle = client.get_workflow_handle(workflow_id)
+            poller = _ProgressPoller(handle, self._query, self._query_args, self._interval)
+            self._pollers[workflow_id] = poller
+
+        subscription = ProgressSubscription(self._buffer_size)
+        poller.add(subscription)
+        try:
+            yield subscription
+        finally:
+            poller.remove(subscription)
+            if not poller.subscribers:
+                if self._pollers.get(workflow_id) is poller:
+                    del self._pollers[workflow_id]
+                await poller.stop()
+
+    async def close(self) -> None:
+        pollers, self._pollers = list(self._pollers.values()), {}
+        await asyncio.gather(*(poller.stop() for poller in pollers))
+
+
+async def _wait_disconnect(receive: Receive) -> None:
+    while True:
+        message = await receive()
+        if message["type"] in {"http.disconnect", "websocket.disconnect"}:
+            return
+
+
+async def _next_event(
+    subscription: ProgressSubscription,
+    disconnected: asyncio.Task[None],
+    timeout: float | None,
+) -> ProgressEvent | None:
+    # None means nothing happened within ``timeout``; raises _Disconnected once the client left
+    next_event = asyncio.ensure_future(subscription.get())
+    done, _ = await asyncio.wait({next_event, disconnected}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    if next_event in done:
+        return next_event.result()
+    next_event.cancel()
+    if disconnected in done:
+        raise _Disconnected
+    return None
+
+
+class WorkflowProgressStream:
+    """ASGI app streaming workflow progress over Server-Sent Events or WebSocket.
+
+    ``GET {prefix}/{workflow_id}`` answers with an SSE stream and a WebSocket connection to
+    the same path receives JSON messages ``{"event": ..., "data": ...}``. Viewers of the same
+    workflow share one ``ProgressHub`` poller, so Temporal sees one query per interval no
+    matter how many clients are connected. The Temporal client comes from the ASGI scope,
+    see ``TemporalClientLifespan``.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        query: str,
+        *,
+        query_args: Sequence[Any] = (),
+        prefix: str = "",
+        interval: float | None = None,
+        heartbeat: float | None = None,
+        buffer_size: int = 16,
+    ) -> None:
+        self._hub = ProgressHub(query, query_args=query_args, interval=interval, buffer_size=buffer_size)
+        self._prefix = prefix.rstrip("/")
+        self._heartbeat = heartbeat if heartbeat is not None else config.PROGRESS_HEARTBEAT_INTERVAL
+
+    @property
+    def hub(self) -> ProgressHub:
+        return self._hub
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await serve_lifespan(receive, send)
+            await self._hub.close()
+            return
+
+        workflow_id = self._workflow_id(scope)
+        if scope["type"] == "websocket":
+            await self._serve_websocket(scope, receive, send, workflow_id)
+        elif scope["type"] == "http":
+            try:
+                if workflow_id is None:
+                    raise HTTPError(404, "Not found")
+                if scope["method"] != "GET":
+                    raise HTTPError(405, f"Method {scope['method']} not allowed", headers=[(b"allow", b"GET")])
+            except HTTPError as exc:
+                await send_error(send, exc)
+                return
+            await self._serve_sse(scope, receive, send, workflow_id)
+
+    def _workflow_id(self, scope: Scope) -> str | None:
+        path: str = scope["path"]
+        if not path.startswith(self._prefix):
+            return None
+        segments = [segment for segment in path[len(self._prefix) :].split("/") if segment]
+        return segments[0] if len(segments) == 1 else None
+
+    async def _serve_sse(self, scope: Scope, receive: Receive, send: Send, workflow_id: str) -> None:
+        disconnected = asyncio.create_task(_wait_disconnect(receive))
+        try:
+            async with self._hub.subscribe(get_temporal_client(scope), workflow_id) as subscription:
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 200,
+                        "headers": [
+                            (b"content-type", SSE_CONTENT_TYPE),
+                            (b"cache-control", b"no-cache"),
+                            (b"x-accel-buffering", b"no"),
+                        ],
+                    },
+                )
+                while True:
+                    event = await _next_event(subscription, disconnected, self._heartbeat)
+                    if event is None:
+                        # Comment line keeping proxies from closing an idle stream
+                        await send({"type": "http.response.body", "body": b": keepalive\n\n", "more_body": True})
+                        continue
+                    await send({"type": "http.response.body", "body": event.to_sse(), "more_body": True})
+                    if event.terminal:
+                        break
+            await send({"type": "http.response.body", "body": b""})
+        except _Disconnected:
+            pass
+        finally:
+            disconnected.cancel()
+
+    async def _serve_websocket(self, scope: Scope, receive: Receive, send: Send, workflow_id: str | None) -> None:
+        message = await receive()
+        if message["type"] != "websocket.connect":
+            return
+        if workflow_id is None:
+            await send({"type": "websocket.close", "code": 1008})
+            return
+        await send({"type": "websocket.accept"})
+
+        disconnected = asyncio.create_task(_wait_disconnect(receive))
+        try:
+            async with self._hub.subscribe(get_temporal_client(scope), workflow_id) as subscription:
+                while True:
+                    event = await _next_event(subscription, disconnected, None)
+                    if event is None:
+                        continue
+                    await send({"type": "websocket.send", "text": event.to_json().decode()})
+                    if event.terminal:
+                        break
+            await send({"type": "websocket.close", "code": 1000})
+        except _Disconnected:
+            pass
+        finally:
+            disconnected.cancel()
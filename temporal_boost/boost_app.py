@@ -7,23 +7,28 @@ import threading
 import time
 from collections.abc import Callable
 from pathlib import Path
-from typing import Any, ClassVar
-
-import click
-import typer
-import yaml
-from temporalio.types import MethodAsyncNoParam
-from temporalio.worker._interceptor import Interceptor
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from temporal_boost.common import DEFAULT_LOGGING_CONFIG
-from temporal_boost.workers import (
-    ASGIWorkerType,
-    BaseAsgiWorker,
-    BaseBoostWorker,
-    FastStreamBoostWorker,
-    TemporalBoostWorker,
-    get_asgi_worker_class,
-)
+from temporal_boost.workers.asgi_registry import ASGIWorkerType, get_asgi_worker_class
+
+
+# Temporal, the worker adapters and the feature modules are imported by the methods using
+# them, so importing the app module stays cheap for the CLI and for each worker process
+if TYPE_CHECKING:
+    import typer
+    from temporalio.types import MethodAsyncNoParam
+    from temporalio.worker import Interceptor
+
+    from temporal_boost.asgi.admission import AdmissionOptions
+    from temporal_boost.asgi.gateway import WorkflowGateway
+    from temporal_boost.asgi.health import WorkerHealthApp
+    from temporal_boost.temporal.definitions import Definition
+    from temporal_boost.temporal.query_cache import QueryCacheOptions
+    from temporal_boost.temporal.schedule import CronScheduleOptions
+    from temporal_boost.workers.base import BaseAsgiWorker, BaseBoostWorker
+    from temporal_boost.workers.faststream_worker import FastStreamBoostWorker
+    from temporal_boost.workers.temporal import TemporalBoostWorker
 
 
 logger = logging.getLogger(__name__)
@@ -58,29 +63,28 @@ class BoostApp:
         self._registered_cron_workers: list[BaseBoostWorker] = []
         self._registered_asgi_workers: list[BaseAsgiWorker] = []
 
-        self._root_typer = typer.Typer(name=self._name, no_args_is_help=True)
-        self._run_typer = typer.Typer(name="run")
-        self._cron_typer = typer.Typer(name="cron")
-        self._exec_typer: typer.Typer = typer.Typer(name="exec")
-
-        self._root_typer.add_typer(self._run_typer, no_args_is_help=True)
-        self._root_typer.add_typer(self._cron_typer, no_args_is_help=True)
-        self._root_typer.add_typer(self._exec_typer, no_args_is_help=True)
-
-        self._run_typer.command(name="all")(self.run_all_workers)
+        # Commands are kept by group and turned into a Typer app only when it is needed,
+        # so `run <worker>` in a spawned process starts the worker without building the CLI
+        self._commands: dict[str, dict[str, Callable[..., Any]]] = {
+            "run": {"all": self.run_all_workers},
+            "cron": {},
+            "exec": {},
+        }
+        self._typer_app: typer.Typer | None = None
 
     def add_worker(  # noqa: PLR0913
         self,
         worker_name: str,
         task_queue: str,
         *,
-        activities: list[Callable[..., Any]] | None = None,
-        workflows: list[type] | None = None,
-        interceptors: list[Interceptor] | None = None,
+        activities: "list[Definition[Callable[..., Any]]] | None" = None,
+        workflows: "list[Definition[type]] | None" = None,
+        interceptors: "list[Definition[Interceptor]] | None" = None,
         cron_schedule: str | None = None,
-        cron_runner: MethodAsyncNoParam[Any, Any] | None = None,
+        cron_runner: "MethodAsyncNoParam[Any, Any] | None" = None,
+        cron_options: "CronScheduleOptions | None" = None,
         **worker_kwargs: Any,
-    ) -> TemporalBoostWorker:
+    ) -> "TemporalBoostWorker":
         if worker_name in self._RESERVED_NAMES:
             raise RuntimeError(f"Worker name '{worker_name}' is reserved and cannot be used.")
 
@@ -88,6 +92,8 @@ class BoostApp:
             if worker_name == getattr(registered_worker, "name", None):
                 raise RuntimeError(f"Worker name '{worker_name}' is already registered.")
 
+        from temporal_boost.workers.temporal import TemporalBoostWorker  # noqa: PLC0415
+
         worker = TemporalBoostWorker(
             worker_name=worker_name,
             task_queue=task_queue,
@@ -96,6 +102,7 @@ class BoostApp:
             interceptors=interceptors,
             cron_schedule=cron_schedule,
             cron_runner=cron_runner,
+            cron_options=cron_options,
             debug_mode=self._debug_mode,
             **worker_kwargs,
         )
@@ -107,10 +114,10 @@ class BoostApp:
         if self._global_use_pydantic is not None:
             worker.configure_temporal_client(use_pydantic_data_converter=self._global_use_pydantic)
 
-        self._run_typer.command(name=worker_name)(worker.run)
+        self._add_command("run", worker_name, worker.run)
 
         if cron_schedule and cron_runner:
-            self._cron_typer.command(name=worker_name)(worker.cron)
+            self._add_command("cron", worker_name, worker.cron)
             self._registered_cron_workers.append(worker)
 
         self._registered_workers.append(worker)
@@ -125,6 +132,10 @@ class BoostApp:
         *,
         log_level: str | int | None = None,
         asgi_worker_type: ASGIWorkerType = ASGIWorkerType.auto,
+        temporal_client: bool = False,
+        temporal_client_pool_size: int = 1,
+        query_cache: "QueryCacheOptions | None" = None,
+        admission_control: "AdmissionOptions | None" = None,
         **asgi_worker_kwargs: Any,
     ) -> None:
         if worker_name in self._RESERVED_NAMES:
@@ -134,6 +145,19 @@ class BoostApp:
             if worker_name == registered_worker.name:
                 raise RuntimeError(f"Worker name '{worker_name}' is already registered.")
 
+        if temporal_client:
+            from temporal_boost.temporal.client import TemporalClientBuilder  # noqa: PLC0415
+
+            asgi_worker_kwargs["client_builder"] = TemporalClientBuilder(
+                target_host=self._global_temporal_endpoint,
+                namespace=self._global_temporal_namespace,
+                use_pydantic_data_converter=self._global_use_pydantic,
+            )
+            asgi_worker_kwargs["client_pool_size"] = temporal_client_pool_size
+            asgi_worker_kwargs["client_query_cache"] = query_cache
+        if admission_control is not None:
+            asgi_worker_kwargs["admission_control"] = admission_control
+
         AsgiWorkerClass = get_asgi_worker_class(asgi_worker_type)  # noqa: N806
         worker = AsgiWorkerClass(
             app=asgi_app,
@@ -146,9 +170,66 @@ class BoostApp:
 
         worker.name = worker_name
 
-        self._run_typer.command(name=worker_name)(worker.run)
+        self._add_command("run", worker_name, worker.run)
         self._registered_workers.append(worker)
 
+    def create_workflow_gateway(
+        self,
+        *,
+        prefix: str = "",
+        workers: list[str] | None = None,
+        **gateway_kwargs: Any,
+    ) -> "WorkflowGateway":
+        from temporal_boost.asgi.gateway import GatewayWorkflow, WorkflowGateway  # noqa: PLC0415
+        from temporal_boost.workers.temporal import TemporalBoostWorker  # noqa: PLC0415
+
+        workflows: list[GatewayWorkflow] = []
+        for worker in self._registered_workers:
+            if not isinstance(worker, TemporalBoostWorker):
+                continue
+            if workers is not None and worker.name not in workers:
+                continue
+            workflows.extend(GatewayWorkflow.from_class(workflow, worker.task_queue) for workflow in worker.workflows)
+
+        return WorkflowGateway(workflows, prefix=prefix, **gateway_kwargs)
+
+    def create_health_app(self, *, prefix: str = "", workers: list[str] | None = None) -> "WorkerHealthApp":
+        from temporal_boost.asgi.health import WorkerHealthApp  # noqa: PLC0415
+        from temporal_boost.workers.temporal import TemporalBoostWorker  # noqa: PLC0415
+
+        # Reports live data only for workers running in this process, as with `run all`
+        healths = [
+            worker.enable_health()
+            for worker in self._registered_workers
+            if isinstance(worker, TemporalBoostWorker) and (workers is None or worker.name in workers)
+        ]
+        return WorkerHealthApp(healths, prefix=prefix)
+
+    def add_workflow_gateway(  # noqa: PLR0913
+        self,
+        worker_name: str,
+        host: str,
+        port: int,
+        *,
+        prefix: str = "",
+        workers: list[str] | None = None,
+        temporal_client_pool_size: int = 1,
+        query_cache: "QueryCacheOptions | None" = None,
+        **asgi_worker_kwargs: Any,
+    ) -> "WorkflowGateway":
+        gateway = self.create_workflow_gateway(prefix=prefix, workers=workers)
+        self.add_asgi_worker(
+            worker_name,
+            gateway,
+            host,
+            port,
+            temporal_client=True,
+            temporal_client_pool_size=temporal_client_pool_size,
+            query_cache=query_cache,
+            **asgi_worker_kwargs,
+        )
+        return gateway
+
     def add_faststream_worker(
         self,
         worker_name: str,
@@ -156,7 +237,7 @@ class BoostApp:
         *,
         log_level: str | int | None = None,
         **faststream_kwargs: Any,
-    ) -> FastStreamBoostWorker:
+    ) -> "FastStreamBoostWorker":
         if worker_name in self._RESERVED_NAMES:
             raise RuntimeError(f"Worker name '{worker_name}' is reserved and cannot be used.")
 
@@ -164,6 +245,8 @@ class BoostApp:
             if worker_name == registered_worker.name:
                 raise RuntimeError(f"Worker name '{worker_name}' is already registered.")
 
+        from temporal_boost.workers.faststream_worker import FastStreamBoostWorker  # noqa: PLC0415
+
         worker = FastStreamBoostWorker(
             app=faststream_app,
             log_level=log_level,
@@ -172,14 +255,14 @@ class BoostApp:
 
         worker.name = worker_name
 
-        self._run_typer.command(name=worker_name)(worker.run)
+        self._add_command("run", worker_name, worker.run)
         self._registered_workers.append(worker)
         return worker
 
     def add_exec_method_sync(self, name: str, callback: Callable[..., Any]) -> None:
-        self._exec_typer.command(name=name)(callback)
+        self._add_command("exec", name, callback)
 
-    def add_async_runtime(self, worker_name: str, boost_worker: TemporalBoostWorker) -> None:
+    def add_async_runtime(self, worker_name: str, boost_worker: "TemporalBoostWorker") -> None:
         if worker_name in self._RESERVED_NAMES:
             raise RuntimeError(f"Worker name '{worker_name}' is reserved and cannot be used.")
 
@@ -187,10 +270,10 @@ class BoostApp:
             if worker_name == registered_worker.name:
                 raise RuntimeError(f"Worker name '{worker_name}' is already registered.")
 
-        self._run_typer.command(name=worker_name)(boost_worker.run)
+        self._add_command("run", worker_name, boost_worker.run)
         self._registered_workers.append(boost_worker)
 
-    def get_registered_workers(self) -> list[BaseBoostWorker]:
+    def get_registered_workers(self) -> list["BaseBoostWorker"]:
         return self._registered_workers.copy()
 
     def run_all_workers(self) -> None:
@@ -215,11 +298,16 @@ class BoostApp:
             raise
 
     def run(self, *args: Any, **kwargs: Any) -> None:
-        typer_args = list(args)
-        if not args:
+        if len(args) == 1 and isinstance(args[0], list | tuple):
+            typer_args = list(args[0])
+        elif args:
+            typer_args = list(args)
+        else:
             typer_args = sys.argv[1:]
 
             if os.name == "nt":
+                import click  # noqa: PLC0415
+
                 typer_args = click.utils._expand_args(typer_args)  # noqa: SLF001
 
         if len(typer_args) > 1:
@@ -227,14 +315,46 @@ class BoostApp:
         else:
             logger.info(f"Application '{self._name}' is starting. No specific worker selected.")
 
+        command = None if kwargs else self._resolve_command(typer_args)
         try:
-            self._root_typer(*args, **kwargs)
+            if command is not None:
+                command()
+            else:
+                self._root_typer(typer_args, **kwargs)
         except SystemExit as exc:
             logger.warning(f"Exit with code: {exc.code}")
         except:
             logger.exception("Error during application run")
             raise
 
+    @property
+    def _root_typer(self) -> "typer.Typer":
+        if self._typer_app is None:
+            self._typer_app = self._build_typer()
+        return self._typer_app
+
+    def _add_command(self, group: str, name: str, callback: Callable[..., Any]) -> None:
+        self._commands[group][name] = callback
+        self._typer_app = None
+
+    def _resolve_command(self, args: list[str]) -> Callable[[], Any] | None:
+        # Only `run <worker>` and `cron <worker>` skip Typer: anything with options, help or an
+        # unknown name goes through the full CLI to get its parsing and error messages
+        if len(args) != 2 or args[0] not in {"run", "cron"}:  # noqa: PLR2004
+            return None
+        return self._commands[args[0]].get(args[1])
+
+    def _build_typer(self) -> "typer.Typer":
+        import typer  # noqa: PLC0415
+
+        root_typer = typer.Typer(name=self._name, no_args_is_help=True)
+        for group, commands in self._commands.items():
+            group_typer = typer.Typer(name=group)
+            for name, callback in commands.items():
+                group_typer.command(name=name)(callback)
+            root_typer.add_typer(group_typer, no_args_is_help=True)
+        return root_typer
+
     def _configure_logging(self, log_config: dict[str, Any] | Path | None) -> None:
         try:
             if isinstance(log_config, dict):
@@ -242,7 +362,12 @@ class BoostApp:
                 logging.config.dictConfig(log_config)
             elif isinstance(log_config, Path):
                 if log_config.suffix in {".json", ".yaml", ".yml"}:
-                    loader = json.loads if log_config.suffix == ".json" else yaml.safe_load
+                    if log_config.suffix == ".json":
+                        loader = json.loads
+                    else:
+                        import yaml  # noqa: PLC0415
+
+                        loader = yaml.safe_load
                     log_conf = loader(log_config.read_text())
                     self._logger_config = log_conf
                     logging.config.dictConfig(log_conf)
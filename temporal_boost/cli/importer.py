@@ -1,24 +1,17 @@
 import importlib
 import sys
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 
-def import_app_object(app_path: str) -> Any:
-    try:
-        module_str, attribute_path = app_path.split(":", 1)
-    except ValueError as exc:
-        raise ValueError(f'Import string "{app_path}" must be in format "<module>:<attribute>".') from exc
-
-    if not module_str or not attribute_path:
-        raise ValueError(f'Import string "{app_path}" must be in format "<module>:<attribute>".')
-
+def import_module(module_str: str) -> ModuleType:
     try:
-        module = importlib.import_module(module_str)
+        return importlib.import_module(module_str)
     except ModuleNotFoundError as exc:
         candidates: list[Path] = []
         current_working_dir = Path.cwd()
-        first_segment = module_str.split(".")[0]
+        first_segment = module_str.partition(".")[0]
         if (current_working_dir / first_segment).exists():
             candidates.append(current_working_dir)
         candidates.append(current_working_dir.parent)
@@ -27,12 +20,22 @@ def import_app_object(app_path: str) -> Any:
             if candidate_str not in sys.path:
                 sys.path.insert(0, candidate_str)
             try:
-                module = importlib.import_module(module_str)
-                break
+                return importlib.import_module(module_str)
             except ModuleNotFoundError:
                 continue
-        else:
-            raise ValueError(f'Could not import module "{module_str}".') from exc
+        raise ValueError(f'Could not import module "{module_str}".') from exc
+
+
+def import_app_object(app_path: str) -> Any:
+    try:
+        module_str, attribute_path = app_path.split(":", 1)
+    except ValueError as exc:
+        raise ValueError(f'Import string "{app_path}" must be in format "<module>:<attribute>".') from exc
+
+    if not module_str or not attribute_path:
+        raise ValueError(f'Import string "{app_path}" must be in format "<module>:<attribute>".')
+
+    module = import_module(module_str)
 
     instance: Any = module
     for attribute in attribute_path.split("."):
@@ -1,8 +1,10 @@
 import logging
+import os
 from multiprocessing import Process
 
 from temporal_boost.cli.importer import import_app_object
 from temporal_boost.cli.prometheus import setup_prometheus_multiproc_dir
+from temporal_boost.temporal.resources import PROCESS_COUNT_ENV
 
 
 logger = logging.getLogger(__name__)
@@ -19,6 +21,8 @@ def run_single_process(app_path: str, arguments: list[str]) -> None:
 
 def run_multiprocess(app_path: str, number_of_processes: int, arguments: list[str]) -> None:
     setup_prometheus_multiproc_dir()
+    # Children split container resources between themselves when sizing "auto" limits
+    os.environ[PROCESS_COUNT_ENV] = str(number_of_processes)
     process_collection: list[Process] = []
 
     logger.info(f"Starting {number_of_processes} processes for app '{app_path}'")
@@ -3,21 +3,51 @@ import logging
 import typer
 
 from temporal_boost.cli.process_runner import run_multiprocess, run_single_process
+from temporal_boost.temporal import config
+from temporal_boost.temporal.resources import auto_process_count, detect_container_resources
 
 
 logger = logging.getLogger(__name__)
 cli_app = typer.Typer(help="CLI runner for BoostApp services")
 
 
+def resolve_process_count(workers: str) -> int:
+    if workers.strip().lower() == config.AUTO:
+        resources = detect_container_resources()
+        number_of_processes = auto_process_count(resources)
+        memory = f"{resources.memory_limit} bytes" if resources.memory_limit is not None else "unlimited"
+        logger.info(
+            f"Auto-detected {number_of_processes} processes from {resources.source} limits "
+            f"(cpu={resources.cpu_limit:g}, memory={memory})",
+        )
+        return number_of_processes
+
+    try:
+        number_of_processes = int(workers)
+    except ValueError:
+        raise typer.BadParameter(f"Expected a positive integer or '{config.AUTO}', got '{workers}'") from None
+    if number_of_processes < 1:
+        raise typer.BadParameter(f"Expected a positive integer or '{config.AUTO}', got '{workers}'")
+    return number_of_processes
+
+
 @cli_app.command("run")
 def run_command(
     app: str = typer.Argument(..., help="Path to BoostApp, e.g. 'my_app.app:app'"),
-    workers: int = typer.Option(1, "--workers", "-w", help="Number of processes to run"),
+    workers: str = typer.Option(
+        "1",
+        "--workers",
+        "-w",
+        help="Number of processes to run, or 'auto' to derive it from the container CPU limit",
+    ),
     arguments: list[str] = typer.Argument(None, help="Additional arguments to pass to app.run()", show_default=False),  # noqa: B008
 ) -> None:
     additional_arguments = arguments or []
-    if workers > 1:
-        logger.info(f"Starting {workers} processes for app '{app}' with arguments: {additional_arguments}")
-        run_multiprocess(app, workers, additional_arguments)
+    number_of_processes = resolve_process_count(workers)
+    if number_of_processes > 1:
+        logger.info(
+            f"Starting {number_of_processes} processes for app '{app}' with arguments: {additional_arguments}",
+        )
+        run_multiprocess(app, number_of_processes, additional_arguments)
     else:
         run_single_process(app, additional_arguments)
@@ -0,0 +1,134 @@
+import dataclasses
+import functools
+import sys
+from typing import Any
+
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import CompositePayloadConverter, DataConverter, EncodingPayloadConverter
+
+
+# Imported once here for the same reason as the converters in temporal_boost.temporal.converter:
+# payload converters are instantiated inside the workflow sandbox for every run.
+pa: Any
+try:
+    import pyarrow as pa  # type: ignore[import-untyped, no-redef]
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+ARROW_ENCODING = "binary/arrow"
+ARROW_KIND_METADATA_KEY = "arrow-kind"
+
+
+class ArrowPlainPayloadConverter(EncodingPayloadConverter):
+    """``binary/arrow`` converter for Arrow tables, pandas frames and NumPy arrays.
+
+    Tables, record batches and frames are written as an Arrow IPC stream, numeric arrays as
+    an IPC tensor. Decoding maps Arrow buffers straight onto the payload bytes without
+    copying, so decoded NumPy arrays are read-only views. Values of any other type are left
+    to the next converter in the chain.
+    """
+
+    def __init__(self) -> None:
+        if pa is None:
+            raise RuntimeError("pyarrow is not installed.")
+
+    @property
+    def encoding(self) -> str:
+        return ARROW_ENCODING
+
+    def to_payload(self, value: Any) -> Payload | None:
+        if isinstance(value, pa.Table):
+            kind, data = "table", _write_stream(value)
+        elif isinstance(value, pa.RecordBatch):
+            kind, data = "record_batch", _write_stream(value)
+        elif _is_instance_of(value, "pandas", "DataFrame"):
+            kind, data = "pandas", _write_stream(pa.Table.from_pandas(value))
+        elif _is_instance_of(value, "numpy", "ndarray"):
+            try:
+                tensor = pa.Tensor.from_numpy(value)
+            except (pa.ArrowException, TypeError, ValueError):
+                # Object and string arrays have no tensor representation
+                return None
+            kind, data = "numpy", _write_tensor(tensor)
+        else:
+            return None
+
+        return Payload(
+            metadata={"encoding": ARROW_ENCODING.encode(), ARROW_KIND_METADATA_KEY: kind.encode()},
+            data=data,
+        )
+
+    def from_payload(self, payload: Payload, type_hint: type | None = None) -> Any:
+        kind = payload.metadata.get(ARROW_KIND_METADATA_KEY, b"table").decode()
+        buffer = pa.py_buffer(payload.data)
+
+        if kind == "numpy":
+            return pa.ipc.read_tensor(buffer).to_numpy()
+
+        reader = pa.ipc.open_stream(buffer)
+        if kind == "record_batch" and type_hint is not pa.Table:
+            return reader.read_next_batch()
+
+        table = reader.read_all()
+        if type_hint is pa.Table:
+            return table
+        if kind == "pandas" or _is_class_of(type_hint, "pandas", "DataFrame"):
+            return table.to_pandas()
+        return table
+
+
+def _is_instance_of(value: Any, module: str, name: str) -> bool:
+    # Only look at libraries the process already imported: a value cannot be a DataFrame
+    # if pandas was never imported, and importing it just to check would be expensive
+    imported = sys.modules.get(module)
+    return imported is not None and isinstance(value, getattr(imported, name))
+
+
+def _is_class_of(type_hint: Any, module: str, name: str) -> bool:
+    imported = sys.modules.get(module)
+    return imported is not None and type_hint is getattr(imported, name)
+
+
+def _write_stream(data: Any) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, data.schema) as writer:
+        writer.write(data)
+    return sink.getvalue().to_pybytes()  # type: ignore[no-any-return]
+
+
+def _write_tensor(tensor: Any) -> bytes:
+    sink = pa.BufferOutputStream()
+    pa.ipc.write_tensor(tensor, sink)
+    return sink.getvalue().to_pybytes()  # type: ignore[no-any-return]
+
+
+class _ArrowPayloadConverterMixin:
+    pass
+
+
+@functools.cache
+def arrow_payload_converter_class(
+    base: type[CompositePayloadConverter],
+) -> type[CompositePayloadConverter]:
+    """Subclass of ``base`` trying the Arrow converter before its own converters."""
+    if issubclass(base, _ArrowPayloadConverterMixin):
+        return base
+
+    def __init__(self: CompositePayloadConverter) -> None:  # noqa: N807
+        base.__init__(self)
+        CompositePayloadConverter.__init__(self, ArrowPlainPayloadConverter(), *self.converters.values())
+
+    return type(f"Arrow{base.__name__}", (_ArrowPayloadConverterMixin, base), {"__init__": __init__})
+
+
+def with_arrow_payloads(data_converter: DataConverter) -> DataConverter:
+    payload_converter_class = data_converter.payload_converter_class
+    if not issubclass(payload_converter_class, CompositePayloadConverter):
+        raise TypeError(
+            f"Arrow payloads require a composite payload converter, got {payload_converter_class.__name__}",
+        )
+    return dataclasses.replace(
+        data_converter,
+        payload_converter_class=arrow_payload_converter_class(payload_converter_class),
+    )
@@ -0,0 +1,213 @@
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from temporalio.client import Client, WorkflowHandle
+from temporalio.exceptions import WorkflowAlreadyStartedError
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BulkStartItem:
+    workflow: str | Callable[..., Any]
+    args: Sequence[Any]
+    id: str
+    options: Mapping[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class BulkStartResult:
+    index: int
+    id: str
+    handle: WorkflowHandle[Any, Any] | None = None
+    error: BaseException | None = None
+    already_started: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BulkStartReport:
+    started: int = 0
+    already_started: int = 0
+    failed: int = 0
+    resumed_from: int = 0
+    results: list[BulkStartResult] = field(default_factory=list)
+
+    @property
+    def errors(self) -> list[BulkStartResult]:
+        return [result for result in self.results if not result.ok]
+
+
+BulkStartInput = BulkStartItem | tuple[str | Callable[..., Any], Sequence[Any], str]
+
+
+class _Checkpoint:
+    """Low watermark of input positions that are fully processed, plus the failed ones.
+
+    Starts complete out of order, so only the prefix of consecutive finished items is
+    persisted; resuming replays at most ``concurrency`` items, which then report as
+    already started. Failed starts count as processed, so one failure does not pin the
+    watermark, and their positions are kept in ``failed`` for a resume to retry.
+    """
+
+    def __init__(self, path: Path | None, every: int) -> None:
+        self._path = path
+        self._every = every
+        self._finished: set[int] = set()
+        self._since_save = 0
+        self.watermark = 0
+        self.failed: set[int] = set()
+
+    def load(self) -> int:
+        if self._path is not None and self._path.exists():
+            state = json.loads(self._path.read_text())
+            self.watermark = int(state["completed"])
+            self.failed = {int(index) for index in state.get("failed", ())}
+        return self.watermark
+
+    def mark(self, index: int, *, failed: bool = False) -> None:
+        if failed:
+            self.failed.add(index)
+        else:
+            self.failed.discard(index)
+
+        # Retried failures sit below the watermark and are already counted in it
+        if index >= self.watermark:
+            self._finished.add(index)
+            while self.watermark in self._finished:
+                self._finished.remove(self.watermark)
+                self.watermark += 1
+
+        self._since_save += 1
+        if self._since_save >= self._every:
+            self.save()
+
+    def save(self) -> None:
+        self._since_save = 0
+        if self._path is None:
+            return
+        temporary_path = self._path.with_suffix(f"{self._path.suffix}.tmp")
+        temporary_path.write_text(json.dumps({"completed": self.watermark, "failed": sorted(self.failed)}))
+        temporary_path.replace(self._path)
+
+
+async def _iterate(items: AsyncIterable[BulkStartInput] | Iterable[BulkStartInput]) -> AsyncIterator[BulkStartInput]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+class BulkWorkflowStarter:
+    def __init__(  # noqa: PLR0913
+        self,
+        client: Client,
+        task_queue: str,
+        *,
+        concurrency: int = 100,
+        checkpoint_path: str | Path | None = None,
+        checkpoint_every: int = 1000,
+        collect_results: bool = False,
+        **start_kwargs: Any,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError(f"Bulk start concurrency must be positive, got {concurrency}")
+
+        self._client = client
+        self._task_queue = task_queue
+        self._concurrency = concurrency
+        self._checkpoint_path = Path(checkpoint_path) if checkpoint_path is not None else None
+        self._checkpoint_every = checkpoint_every
+        self._collect_results = collect_results
+        self._start_kwargs = start_kwargs
+
+    async def run(self, items: AsyncIterable[BulkStartInput] | Iterable[BulkStartInput]) -> BulkStartReport:
+        report = BulkStartReport()
+        async with contextlib.aclosing(self._stream(items, report)) as results:
+            async for result in results:
+                if self._collect_results or not result.ok:
+                    report.results.append(result)
+
+        logger.info(
+            f"Bulk start finished: {report.started} started, {report.already_started} already started, "
+            f"{report.failed} failed (resumed from item {report.resumed_from})",
+        )
+        return report
+
+    async def stream(
+        self, items: AsyncIterable[BulkStartInput] | Iterable[BulkStartInput]
+    ) -> AsyncIterator[BulkStartResult]:
+        async with contextlib.aclosing(self._stream(items, BulkStartReport())) as results:
+            async for result in results:
+                yield result
+
+    async def _stream(
+        self,
+        items: AsyncIterable[BulkStartInput] | Iterable[BulkStartInput],
+        report: BulkStartReport,
+    ) -> AsyncGenerator[BulkStartResult, None]:
+        checkpoint = _Checkpoint(self._checkpoint_path, self._checkpoint_every)
+        report.resumed_from = checkpoint.load()
+        retry = frozenset(checkpoint.failed)
+        if report.resumed_from:
+            logger.info(
+                f"Resuming bulk start after {report.resumed_from} processed items, retrying {len(retry)} failed",
+            )
+
+        pending: set[asyncio.Task[BulkStartResult]] = set()
+        try:
+            index = 0
+            async for item in _iterate(items):
+                if index >= report.resumed_from or index in retry:
+                    if len(pending) >= self._concurrency:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            yield self._record(task.result(), report, checkpoint)
+                    pending.add(asyncio.create_task(self._start(index, item)))
+                index += 1
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield self._record(task.result(), report, checkpoint)
+        finally:
+            for task in pending:
+                task.cancel()
+            checkpoint.save()
+
+    def _record(self, result: BulkStartResult, report: BulkStartReport, checkpoint: _Checkpoint) -> BulkStartResult:
+        if result.already_started:
+            report.already_started += 1
+        elif result.ok:
+            report.started += 1
+        else:
+            report.failed += 1
+        checkpoint.mark(result.index, failed=not result.ok)
+        return result
+
+    async def _start(self, index: int, item: BulkStartInput) -> BulkStartResult:
+        if not isinstance(item, BulkStartItem):
+            item = BulkStartItem(*item)
+
+        options = {**self._start_kwargs, **item.options}
+        options.setdefault("task_queue", self._task_queue)
+        try:
+            handle = await self._client.start_workflow(item.workflow, args=item.args, id=item.id, **options)
+        except WorkflowAlreadyStartedError:
+            return BulkStartResult(index=index, id=item.id, already_started=True)
+        except Exception as exc:
+            logger.warning(f"Failed to start workflow '{item.id}': {exc}")
+            return BulkStartResult(index=index, id=item.id, error=exc)
+        return BulkStartResult(index=index, id=item.id, handle=handle)
@@ -0,0 +1,261 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import PayloadCodec
+
+
+CLAIM_CHECK_ENCODING = b"binary/claim-check"
+CLAIM_CHECK_SIZE_METADATA_KEY = "claim-check-size"
+
+# Keys known to be uploaded by this process, to skip the existence check on repeats
+_KNOWN_KEYS_LIMIT = 10_000
+
+
+class BlobNotFoundError(KeyError):
+    pass
+
+
+class BlobStore(ABC):
+    """Content-addressed storage for payloads offloaded by ``ClaimCheckPayloadCodec``."""
+
+    @abstractmethod
+    async def put(self, key: str, data: bytes) -> None: ...
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes: ...
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool: ...
+
+
+class FileSystemBlobStore(BlobStore):
+    """Blobs stored as files under ``root``, sharded by the first two key characters.
+
+    Works on any shared mount (NFS, EFS, ...) and as a local stand-in for object storage
+    in development and tests.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def _path(self, key: str) -> Path:
+        return self._root / key[:2] / key
+
+    async def put(self, key: str, data: bytes) -> None:
+        await asyncio.to_thread(self._write, key, data)
+
+    async def get(self, key: str) -> bytes:
+        try:
+            return await asyncio.to_thread(self._path(key).read_bytes)
+        except FileNotFoundError:
+            raise BlobNotFoundError(key) from None
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread(self._path(key).exists)
+
+    def _write(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent readers never see a partial blob
+        descriptor, temporary_name = tempfile.mkstemp(dir=path.parent, prefix=f".{key}.")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            Path(temporary_name).replace(path)
+        except BaseException:
+            Path(temporary_name).unlink(missing_ok=True)
+            raise
+
+
+class S3BlobStore(BlobStore):
+    """Blobs stored in an S3-compatible bucket through boto3.
+
+    ``client_kwargs`` are passed to ``boto3.client("s3", ...)``, e.g. ``endpoint_url`` for
+    MinIO or other S3-compatible services.
+    """
+
+    def __init__(self, bucket: str, prefix: str = "", *, client: Any = None, **client_kwargs: Any) -> None:
+        if client is None:
+            try:
+                import boto3  # type: ignore[import-not-found]  # noqa: PLC0415
+            except ImportError as exc:
+                raise RuntimeError("boto3 is not installed.") from exc
+            client = boto3.client("s3", **client_kwargs)
+
+        self._client = client
+        self._bucket = bucket
+        self._prefix = prefix.strip("/")
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}/{key}" if self._prefix else key
+
+    async def put(self, key: str, data: bytes) -> None:
+        await asyncio.to_thread(self._client.put_object, Bucket=self._bucket, Key=self._key(key), Body=data)
+
+    async def get(self, key: str) -> bytes:
+        try:
+            response = await asyncio.to_thread(self._client.get_object, Bucket=self._bucket, Key=self._key(key))
+        except self._client.exceptions.NoSuchKey:
+            raise BlobNotFoundError(key) from None
+        return await asyncio.to_thread(response["Body"].read)  # type: ignore[no-any-return]
+
+    async def exists(self, key: str) -> bool:
+        try:
+            await asyncio.to_thread(self._client.head_object, Bucket=self._bucket, Key=self._key(key))
+        except self._client.exceptions.ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}:
+                return False
+            raise
+        return True
+
+
+def blob_store_from_url(url: str) -> BlobStore:
+    # Accepts file:///path, a plain path or s3://bucket/prefix
+    parsed = urlparse(url)
+    if parsed.scheme == "s3":
+        return S3BlobStore(parsed.netloc, parsed.path)
+    if parsed.scheme in {"", "file"}:
+        return FileSystemBlobStore(parsed.path if parsed.scheme else url)
+    raise ValueError(f"Unsupported blob store URL '{url}', expected file:// or s3://")
+
+
+@dataclass
+class ClaimCheckStats:
+    offloaded: int = 0
+    deduplicated: int = 0
+    fetched: int = 0
+    cache_hits: int = 0
+    bytes_offloaded: int = 0
+
+
+class ClaimCheckPayloadCodec(PayloadCodec):
+    """Offload payloads of at least ``threshold`` bytes to a blob store.
+
+    Only a ``binary/claim-check`` reference holding the SHA-256 of the serialized payload
+    goes into history. Identical payloads map to the same blob and are uploaded once;
+    fetched blobs are kept in a small in-memory LRU and, with ``cache_dir``, on local disk
+    so replays do not go back to the store.
+    """
+
+    def __init__(
+        self,
+        store: BlobStore,
+        *,
+        threshold: int = 256 * 1024,
+        cache_dir: str | Path | None = None,
+        memory_cache_size: int = 32,
+    ) -> None:
+        self._store = store
+        self._threshold = threshold
+        self._disk_cache = FileSystemBlobStore(cache_dir) if cache_dir is not None else None
+        self._memory_cache_size = memory_cache_size
+        self._memory_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._known_keys: OrderedDict[str, None] = OrderedDict()
+        # Guards the caches and stats: with payload offload the codec runs on several threads
+        self._lock = threading.Lock()
+        self.stats = ClaimCheckStats()
+
+    @property
+    def store(self) -> BlobStore:
+        return self._store
+
+    @property
+    def threshold(self) -> int:
+        return self._threshold
+
+    async def encode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        return list(await asyncio.gather(*(self._encode_payload(payload) for payload in payloads)))
+
+    async def decode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        return list(await asyncio.gather(*(self._decode_payload(payload) for payload in payloads)))
+
+    async def _encode_payload(self, payload: Payload) -> Payload:
+        if len(payload.data) < self._threshold or payload.metadata.get("encoding") == CLAIM_CHECK_ENCODING:
+            return payload
+
+        data = payload.SerializeToString()
+        key = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            known = key in self._known_keys
+        if known or await self._store.exists(key):
+            with self._lock:
+                self.stats.deduplicated += 1
+        else:
+            await self._store.put(key, data)
+            with self._lock:
+                self.stats.offloaded += 1
+                self.stats.bytes_offloaded += len(data)
+        self._remember(key)
+
+        return Payload(
+            metadata={"encoding": CLAIM_CHECK_ENCODING, CLAIM_CHECK_SIZE_METADATA_KEY: str(len(data)).encode()},
+            data=key.encode(),
+        )
+
+    async def _decode_payload(self, payload: Payload) -> Payload:
+        if payload.metadata.get("encoding") != CLAIM_CHECK_ENCODING:
+            return payload
+
+        key = payload.data.decode()
+        decoded = Payload()
+        decoded.ParseFromString(await self._fetch(key))
+        return decoded
+
+    async def _fetch(self, key: str) -> bytes:
+        with self._lock:
+            data = self._memory_cache.get(key)
+            if data is not None:
+                self._memory_cache.move_to_end(key)
+                self.stats.cache_hits += 1
+                return data
+
+        if self._disk_cache is not None:
+            try:
+                data = await self._disk_cache.get(key)
+                with self._lock:
+                    self.stats.cache_hits += 1
+            except BlobNotFoundError:
+                data = None
+
+        if data is None:
+            data = await self._store.get(key)
+            if hashlib.sha256(data).hexdigest() != key:
+                raise RuntimeError(f"Claim-check blob '{key}' does not match its content hash")
+            with self._lock:
+                self.stats.fetched += 1
+            if self._disk_cache is not None:
+                await self._disk_cache.put(key, data)
+
+        self._cache_in_memory(key, data)
+        return data
+
+    def _remember(self, key: str) -> None:
+        with self._lock:
+            self._known_keys[key] = None
+            self._known_keys.move_to_end(key)
+            while len(self._known_keys) > _KNOWN_KEYS_LIMIT:
+                self._known_keys.popitem(last=False)
+
+    def _cache_in_memory(self, key: str, data: bytes) -> None:
+        if self._memory_cache_size <= 0:
+            return
+        with self._lock:
+            self._memory_cache[key] = data
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self._memory_cache_size:
+                self._memory_cache.popitem(last=False)
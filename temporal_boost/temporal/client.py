@@ -1,14 +1,23 @@
-from typing import TYPE_CHECKING, Any
+import asyncio
+import dataclasses
+import logging
+from concurrent.futures import Executor
+from typing import Any
 
-from temporalio.client import Client
-from temporalio.contrib.pydantic import pydantic_data_converter
+from temporalio.client import Client, Interceptor
+from temporalio.converter import DataConverter, PayloadCodec
 from temporalio.runtime import Runtime
+from temporalio.service import RPCError
 
 from temporal_boost.temporal import config
+from temporal_boost.temporal.claim_check import BlobStore, ClaimCheckPayloadCodec, blob_store_from_url
+from temporal_boost.temporal.codec import CompressionAlgorithm, CompressionPayloadCodec, PayloadCodecChain
+from temporal_boost.temporal.converter import DataConverterType, pydantic_data_converter, resolve_data_converter
+from temporal_boost.temporal.offload import PayloadOffloader, with_payload_offload
+from temporal_boost.temporal.pool import ClientPoolStrategy, TemporalClientPool
 
 
-if TYPE_CHECKING:
-    from temporalio.converter import DataConverter
+logger = logging.getLogger(__name__)
 
 
 class TemporalClientBuilder:
@@ -21,6 +30,13 @@ class TemporalClientBuilder:
         *,
         tls: bool | None = None,
         use_pydantic_data_converter: bool | None = None,
+        data_converter: DataConverter | DataConverterType | str | None = None,
+        compression: CompressionAlgorithm | str | None = None,
+        compression_threshold: int | None = None,
+        arrow_payloads: bool | None = None,
+        lazy: bool | None = None,
+        connect_attempts: int | None = None,
+        connect_backoff: float | None = None,
         **kwargs: Any,
     ) -> None:
         self._target_host = target_host or config.TARGET_HOST
@@ -29,11 +45,37 @@ class TemporalClientBuilder:
         self._tls = tls if tls is not None else config.CLIENT_TLS
         self._identity = identity or config.CLIENT_IDENTITY
 
+        self._lazy = lazy if lazy is not None else config.CLIENT_LAZY
+        self._connect_attempts = max(1, connect_attempts or config.CLIENT_CONNECT_ATTEMPTS)
+        self._connect_backoff = connect_backoff if connect_backoff is not None else config.CLIENT_CONNECT_BACKOFF
+
         self._runtime: Runtime | None = None
 
         self._data_converter: DataConverter | None = None
-        if use_pydantic_data_converter or config.USE_PYDANTIC_DATA_CONVERTER:
+        if data_converter is not None:
+            self.set_data_converter(data_converter)
+        elif use_pydantic_data_converter:
+            self._data_converter = pydantic_data_converter
+        elif config.DATA_CONVERTER:
+            self.set_data_converter(config.DATA_CONVERTER)
+        elif config.USE_PYDANTIC_DATA_CONVERTER:
             self._data_converter = pydantic_data_converter
+        self._arrow_payloads = arrow_payloads if arrow_payloads is not None else config.ARROW_PAYLOADS
+
+        self._payload_codecs: list[PayloadCodec] = []
+        compression = compression or config.PAYLOAD_COMPRESSION
+        if compression:
+            self.set_compression(compression, threshold=compression_threshold)
+        elif compression_threshold is not None:
+            self._set_compression_threshold(compression_threshold)
+
+        self._claim_check_codec: ClaimCheckPayloadCodec | None = None
+        if config.CLAIM_CHECK_STORE:
+            self.set_claim_check(config.CLAIM_CHECK_STORE)
+
+        self._payload_offloader: PayloadOffloader | None = None
+        if config.PAYLOAD_OFFLOAD_THRESHOLD > 0:
+            self.set_payload_offload(config.PAYLOAD_OFFLOAD_THRESHOLD)
 
         self._client_kwargs = kwargs
 
@@ -55,25 +97,166 @@ class TemporalClientBuilder:
     def set_identity(self, identity: str) -> None:
         self._identity = identity
 
+    def set_lazy(self, lazy: bool) -> None:
+        self._lazy = lazy
+
+    def set_connect_retries(self, attempts: int, backoff: float | None = None) -> None:
+        self._connect_attempts = max(1, attempts)
+        if backoff is not None:
+            self._connect_backoff = backoff
+
     def set_kwargs(self, **kwargs: Any) -> None:
+        if "lazy" in kwargs:
+            self.set_lazy(kwargs.pop("lazy"))
+        if "data_converter" in kwargs:
+            self.set_data_converter(kwargs.pop("data_converter"))
+        compression_threshold = kwargs.pop("compression_threshold", None)
+        if "compression" in kwargs:
+            self.set_compression(kwargs.pop("compression"), threshold=compression_threshold)
+        elif compression_threshold is not None:
+            self._set_compression_threshold(compression_threshold)
+        if "arrow_payloads" in kwargs:
+            self.set_arrow_payloads(kwargs.pop("arrow_payloads"))
         self._client_kwargs.update(kwargs)
 
+    def add_interceptor(self, interceptor: Interceptor) -> None:
+        self._client_kwargs["interceptors"] = [*self._client_kwargs.get("interceptors", ()), interceptor]
+
     def set_pydantic_data_converter(self) -> None:
         self._data_converter = pydantic_data_converter
 
-    async def build(self) -> Client:
+    def set_data_converter(self, data_converter: DataConverter | DataConverterType | str) -> None:
+        self._data_converter = resolve_data_converter(data_converter)
+
+    def set_arrow_payloads(self, enabled: bool) -> None:
+        self._arrow_payloads = enabled
+
+    def add_payload_codec(self, codec: PayloadCodec) -> None:
+        self._payload_codecs.append(codec)
+
+    def set_compression(
+        self,
+        algorithm: CompressionAlgorithm | str,
+        *,
+        threshold: int | None = None,
+        level: int | None = None,
+    ) -> None:
+        codecs = [codec for codec in self._payload_codecs if not isinstance(codec, CompressionPayloadCodec)]
+        compression_codec = CompressionPayloadCodec(
+            algorithm,
+            threshold=threshold if threshold is not None else config.PAYLOAD_COMPRESSION_THRESHOLD,
+            level=level,
+        )
+        # Compress first, so codecs added later (encryption, claim check) see the smaller payload
+        self._payload_codecs = [compression_codec, *codecs]
+
+    def set_claim_check(
+        self,
+        store: BlobStore | str,
+        *,
+        threshold: int | None = None,
+        cache_dir: str | None = None,
+    ) -> None:
+        if isinstance(store, str):
+            store = blob_store_from_url(store)
+        self._claim_check_codec = ClaimCheckPayloadCodec(
+            store,
+            threshold=threshold if threshold is not None else config.CLAIM_CHECK_THRESHOLD,
+            cache_dir=cache_dir or config.CLAIM_CHECK_CACHE_DIR,
+        )
+
+    def set_payload_offload(
+        self,
+        threshold: int,
+        *,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        if self._payload_offloader is not None:
+            self._payload_offloader.shutdown()
+        self._payload_offloader = PayloadOffloader(
+            threshold,
+            executor=executor,
+            max_workers=max_workers or config.PAYLOAD_OFFLOAD_WORKERS,
+        )
+
+    def _set_compression_threshold(self, threshold: int) -> None:
+        codec = next((codec for codec in self._payload_codecs if isinstance(codec, CompressionPayloadCodec)), None)
+        if codec is None:
+            raise ValueError("Compression threshold requires compression, set it or TEMPORAL_PAYLOAD_COMPRESSION")
+        self.set_compression(codec.algorithm, threshold=threshold, level=codec.level)
+
+    def _build_data_converter(self) -> DataConverter | None:
+        data_converter = self._data_converter
+        if self._arrow_payloads:
+            # Imported here so pyarrow is only loaded by applications that use it
+            from temporal_boost.temporal.arrow import with_arrow_payloads  # noqa: PLC0415
+
+            data_converter = with_arrow_payloads(data_converter or DataConverter.default)
+        if self._payload_codecs or self._claim_check_codec is not None:
+            data_converter = self._with_payload_codecs(data_converter or DataConverter.default)
+        if self._payload_offloader is not None:
+            data_converter = with_payload_offload(data_converter or DataConverter.default, self._payload_offloader)
+        return data_converter
+
+    def _with_payload_codecs(self, data_converter: DataConverter) -> DataConverter:
+        for codec in self._payload_codecs:
+            if isinstance(codec, CompressionPayloadCodec) and codec.metric_meter is None and self._runtime is not None:
+                codec.bind_metric_meter(self._runtime.metric_meter)
+
+        codecs = [*self._payload_codecs]
+        if data_converter.payload_codec is not None:
+            codecs.append(data_converter.payload_codec)
+        # Claim check last, so blobs in the store are already compressed (and encrypted, if configured)
+        if self._claim_check_codec is not None:
+            codecs.append(self._claim_check_codec)
+        payload_codec = codecs[0] if len(codecs) == 1 else PayloadCodecChain(codecs)
+        return dataclasses.replace(data_converter, payload_codec=payload_codec)
+
+    async def build(self, *, lazy: bool | None = None) -> Client:
         if self._runtime is None:
             self._runtime = Runtime.default()
 
-        if self._data_converter:
-            self._client_kwargs["data_converter"] = self._data_converter
-
-        return await Client.connect(
-            target_host=self._target_host,
-            namespace=self._namespace,
-            api_key=self._api_key,
-            tls=self._tls,
-            identity=self._identity,
-            runtime=self._runtime,
-            **self._client_kwargs,
-        )
+        data_converter = self._build_data_converter()
+        if data_converter:
+            self._client_kwargs["data_converter"] = data_converter
+
+        lazy = self._lazy if lazy is None else lazy
+        # A lazy client only connects on its first RPC, so there is nothing to retry here
+        attempts = 1 if lazy else self._connect_attempts
+        attempt = 1
+        while True:
+            try:
+                return await Client.connect(
+                    target_host=self._target_host,
+                    namespace=self._namespace,
+                    api_key=self._api_key,
+                    tls=self._tls,
+                    identity=self._identity,
+                    runtime=self._runtime,
+                    lazy=lazy,
+                    **self._client_kwargs,
+                )
+            except (RuntimeError, RPCError) as exc:  # noqa: PERF203
+                if attempt >= attempts:
+                    raise
+                delay = min(self._connect_backoff * 2 ** (attempt - 1), config.CLIENT_CONNECT_MAX_BACKOFF)
+                logger.warning(
+                    f"Failed to connect to Temporal at '{self._target_host}' (attempt {attempt}/{attempts}): {exc}. "
+                    f"Retrying in {delay:.1f}s",
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def build_pool(
+        self,
+        size: int | None = None,
+        *,
+        strategy: ClientPoolStrategy | str | None = None,
+    ) -> TemporalClientPool:
+        size = size or config.CLIENT_POOL_SIZE
+        if size < 1:
+            raise ValueError(f"Client pool size must be positive, got {size}")
+
+        clients = await asyncio.gather(*(self.build() for _ in range(size)))
+        return TemporalClientPool(clients, strategy=strategy or config.CLIENT_POOL_STRATEGY)
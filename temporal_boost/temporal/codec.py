@@ -0,0 +1,235 @@
+import threading
+import time
+import zlib
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import Enum
+
+from temporalio.api.common.v1 import Payload
+from temporalio.common import MetricMeter
+from temporalio.converter import PayloadCodec
+
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+try:
+    import lz4.frame as lz4_frame  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover
+    lz4_frame = None
+
+COMPRESSED_ENCODING = b"binary/compressed"
+COMPRESSION_METADATA_KEY = "compression"
+
+
+class CompressionAlgorithm(str, Enum):
+    zstd = "zstd"
+    lz4 = "lz4"
+    zlib = "zlib"
+
+
+def _zstd_compress(data: bytes, level: int | None) -> bytes:
+    return zstandard.compress(data, level=3 if level is None else level)  # type: ignore[no-any-return]
+
+
+def _lz4_compress(data: bytes, level: int | None) -> bytes:
+    return lz4_frame.compress(data, compression_level=level or 0)  # type: ignore[union-attr, no-any-return]
+
+
+def _zlib_compress(data: bytes, level: int | None) -> bytes:
+    return zlib.compress(data, -1 if level is None else level)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    return zstandard.decompress(data)  # type: ignore[no-any-return]
+
+
+def _lz4_decompress(data: bytes) -> bytes:
+    return lz4_frame.decompress(data)  # type: ignore[union-attr, no-any-return]
+
+
+_COMPRESSORS: dict[CompressionAlgorithm, Callable[[bytes, int | None], bytes]] = {
+    CompressionAlgorithm.zstd: _zstd_compress,
+    CompressionAlgorithm.lz4: _lz4_compress,
+    CompressionAlgorithm.zlib: _zlib_compress,
+}
+
+_DECOMPRESSORS: dict[CompressionAlgorithm, Callable[[bytes], bytes]] = {
+    CompressionAlgorithm.zstd: _zstd_decompress,
+    CompressionAlgorithm.lz4: _lz4_decompress,
+    CompressionAlgorithm.zlib: zlib.decompress,
+}
+
+
+def _ensure_available(algorithm: CompressionAlgorithm) -> None:
+    if algorithm == CompressionAlgorithm.zstd and zstandard is None:
+        raise RuntimeError("zstandard is not installed.")
+    if algorithm == CompressionAlgorithm.lz4 and lz4_frame is None:
+        raise RuntimeError("lz4 is not installed.")
+
+
+@dataclass
+class CompressionStats:
+    encoded: int = 0
+    compressed: int = 0
+    skipped: int = 0
+    decoded: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    encode_seconds: float = 0.0
+    decode_seconds: float = 0.0
+
+    @property
+    def ratio(self) -> float:
+        return self.bytes_in / self.bytes_out if self.bytes_out else 1.0
+
+
+class PayloadCodecChain(PayloadCodec):
+    """Apply codecs in order when encoding and in reverse order when decoding."""
+
+    def __init__(self, codecs: Sequence[PayloadCodec]) -> None:
+        self._codecs = list(codecs)
+
+    @property
+    def codecs(self) -> list[PayloadCodec]:
+        return list(self._codecs)
+
+    async def encode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        for codec in self._codecs:
+            payloads = await codec.encode(payloads)
+        return list(payloads)
+
+    async def decode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        for codec in reversed(self._codecs):
+            payloads = await codec.decode(payloads)
+        return list(payloads)
+
+
+class CompressionPayloadCodec(PayloadCodec):
+    """Compress payloads of at least ``threshold`` bytes.
+
+    The whole serialized payload, metadata included, is compressed and wrapped in a
+    ``binary/compressed`` payload tagged with the algorithm, so decoding works for any
+    installed algorithm regardless of the one configured for encoding. Payloads below the
+    threshold, or that do not get smaller, are passed through untouched.
+    """
+
+    def __init__(
+        self,
+        algorithm: CompressionAlgorithm | str = CompressionAlgorithm.zlib,
+        *,
+        threshold: int = 4096,
+        level: int | None = None,
+        metric_meter: MetricMeter | None = None,
+    ) -> None:
+        self._algorithm = CompressionAlgorithm(algorithm)
+        _ensure_available(self._algorithm)
+        self._compress = _COMPRESSORS[self._algorithm]
+        self._algorithm_tag = self._algorithm.value.encode()
+        self._threshold = threshold
+        self._level = level
+
+        # Stats are updated from several threads when the codec is offloaded
+        self._stats_lock = threading.Lock()
+        self.stats = CompressionStats()
+        self.metric_meter: MetricMeter | None = None
+        self.bind_metric_meter(metric_meter)
+
+    @property
+    def algorithm(self) -> CompressionAlgorithm:
+        return self._algorithm
+
+    @property
+    def threshold(self) -> int:
+        return self._threshold
+
+    @property
+    def level(self) -> int | None:
+        return self._level
+
+    def bind_metric_meter(self, metric_meter: MetricMeter | None) -> None:
+        self.metric_meter = metric_meter
+        meter = (metric_meter or MetricMeter.noop).with_additional_attributes({"algorithm": self._algorithm.value})
+        self._ratio_histogram = meter.create_histogram_float(
+            "boost_payload_compression_ratio",
+            "Original to compressed size of compressed payloads",
+        )
+        self._skipped_counter = meter.create_counter(
+            "boost_payload_compression_skipped",
+            "Payloads passed through uncompressed",
+        )
+        self._encode_latency = meter.create_histogram_timedelta(
+            "boost_payload_compression_encode_latency",
+            "Time spent compressing a batch of payloads",
+            "ms",
+        )
+        self._decode_latency = meter.create_histogram_timedelta(
+            "boost_payload_compression_decode_latency",
+            "Time spent decompressing a batch of payloads",
+            "ms",
+        )
+
+    async def encode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        started_at = time.perf_counter()
+        encoded = [self._encode_payload(payload) for payload in payloads]
+        elapsed = time.perf_counter() - started_at
+        with self._stats_lock:
+            self.stats.encode_seconds += elapsed
+        self._encode_latency.record(timedelta(seconds=elapsed))
+        return encoded
+
+    async def decode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        started_at = time.perf_counter()
+        decoded = [self._decode_payload(payload) for payload in payloads]
+        elapsed = time.perf_counter() - started_at
+        with self._stats_lock:
+            self.stats.decode_seconds += elapsed
+        self._decode_latency.record(timedelta(seconds=elapsed))
+        return decoded
+
+    def _encode_payload(self, payload: Payload) -> Payload:
+        with self._stats_lock:
+            self.stats.encoded += 1
+        if len(payload.data) < self._threshold or payload.metadata.get("encoding") == COMPRESSED_ENCODING:
+            return self._skip(payload)
+
+        original = payload.SerializeToString()
+        compressed = self._compress(original, self._level)
+        if len(compressed) >= len(original):
+            return self._skip(payload)
+
+        with self._stats_lock:
+            self.stats.compressed += 1
+            self.stats.bytes_in += len(original)
+            self.stats.bytes_out += len(compressed)
+        self._ratio_histogram.record(len(original) / len(compressed))
+        return Payload(
+            metadata={"encoding": COMPRESSED_ENCODING, COMPRESSION_METADATA_KEY: self._algorithm_tag},
+            data=compressed,
+        )
+
+    def _skip(self, payload: Payload) -> Payload:
+        with self._stats_lock:
+            self.stats.skipped += 1
+        self._skipped_counter.add(1)
+        return payload
+
+    def _decode_payload(self, payload: Payload) -> Payload:
+        if payload.metadata.get("encoding") != COMPRESSED_ENCODING:
+            return payload
+
+        tag = payload.metadata.get(COMPRESSION_METADATA_KEY, b"").decode()
+        try:
+            algorithm = CompressionAlgorithm(tag)
+        except ValueError:
+            raise RuntimeError(f"Unknown payload compression '{tag}'") from None
+        _ensure_available(algorithm)
+
+        with self._stats_lock:
+            self.stats.decoded += 1
+        decoded = Payload()
+        decoded.ParseFromString(_DECOMPRESSORS[algorithm](payload.data))
+        return decoded
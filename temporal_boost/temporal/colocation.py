@@ -0,0 +1,67 @@
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from temporalio.client import Client, WorkflowHandle
+
+
+logger = logging.getLogger(__name__)
+
+
+class LocalWorkerRegistry:
+    """Task queues served by co-located workers in this process, mapped to their clients.
+
+    Eager workflow start only works through the client (connection) the local worker polls
+    with, so starts for a registered queue are routed to that client.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: dict[str, Client] = {}
+
+    def register(self, task_queue: str, client: Client) -> None:
+        with self._lock:
+            self._clients[task_queue] = client
+        logger.info(f"Task queue '{task_queue}' is served by a co-located worker, eager start enabled")
+
+    def unregister(self, task_queue: str, client: Client) -> None:
+        with self._lock:
+            if self._clients.get(task_queue) is client:
+                del self._clients[task_queue]
+
+    def get(self, task_queue: str) -> Client | None:
+        with self._lock:
+            return self._clients.get(task_queue)
+
+    def task_queues(self) -> list[str]:
+        with self._lock:
+            return list(self._clients)
+
+
+local_worker_registry = LocalWorkerRegistry()
+
+
+async def start_workflow_colocated(
+    client: Client | None,
+    workflow: str | Callable[..., Any],
+    *args: Any,
+    id: str,  # noqa: A002
+    task_queue: str,
+    **start_kwargs: Any,
+) -> WorkflowHandle[Any, Any]:
+    # Eager start hands the first workflow task straight to the local worker, skipping a poll round-trip
+    local_client = local_worker_registry.get(task_queue)
+    if local_client is not None:
+        return await local_client.start_workflow(
+            workflow,
+            args=args,
+            id=id,
+            task_queue=task_queue,
+            request_eager_start=True,
+            **start_kwargs,
+        )
+
+    if client is None:
+        raise RuntimeError(f"No co-located worker for task queue '{task_queue}' and no client provided")
+    return await client.start_workflow(workflow, args=args, id=id, task_queue=task_queue, **start_kwargs)
@@ -2,6 +2,9 @@ import os
 from datetime import timedelta
 
 
+AUTO = "auto"
+
+
 def get_env_bool(name: str, *, default: bool = False) -> bool:
     return os.getenv(name, str(default)).lower() in {"true", "1", "yes"}
 
@@ -13,6 +16,12 @@ def get_env_int(name: str, default: int) -> int:
         return default
 
 
+def get_env_int_or_auto(name: str, default: int) -> int | str:
+    if os.getenv(name, "").strip().lower() == AUTO:
+        return AUTO
+    return get_env_int(name, default)
+
+
 def get_env_float(name: str, default: float) -> float:
     try:
         return float(os.getenv(name, default))
@@ -27,16 +36,72 @@ CLIENT_TLS: bool = get_env_bool("TEMPORAL_TLS", default=False)
 CLIENT_API_KEY: str | None = os.getenv("TEMPORAL_API_KEY", None)
 CLIENT_IDENTITY: str | None = os.getenv("TEMPORAL_IDENTITY", None)
 USE_PYDANTIC_DATA_CONVERTER: bool = get_env_bool("TEMPORAL_USE_PYDANTIC_DATA_CONVERTER", default=False)
+DATA_CONVERTER: str | None = os.getenv("TEMPORAL_DATA_CONVERTER", None)
+PAYLOAD_COMPRESSION: str | None = os.getenv("TEMPORAL_PAYLOAD_COMPRESSION", None)
+PAYLOAD_COMPRESSION_THRESHOLD: int = get_env_int("TEMPORAL_PAYLOAD_COMPRESSION_THRESHOLD", 4096)
+CLAIM_CHECK_STORE: str | None = os.getenv("TEMPORAL_CLAIM_CHECK_STORE", None)
+CLAIM_CHECK_THRESHOLD: int = get_env_int("TEMPORAL_CLAIM_CHECK_THRESHOLD", 256 * 1024)
+CLAIM_CHECK_CACHE_DIR: str | None = os.getenv("TEMPORAL_CLAIM_CHECK_CACHE_DIR", None)
+PAYLOAD_OFFLOAD_THRESHOLD: int = get_env_int("TEMPORAL_PAYLOAD_OFFLOAD_THRESHOLD", 0)
+PAYLOAD_OFFLOAD_WORKERS: int = get_env_int("TEMPORAL_PAYLOAD_OFFLOAD_WORKERS", 4)
+ARROW_PAYLOADS: bool = get_env_bool("TEMPORAL_ARROW_PAYLOADS", default=False)
+CLIENT_LAZY: bool = get_env_bool("TEMPORAL_CLIENT_LAZY", default=False)
+CLIENT_CONNECT_ATTEMPTS: int = get_env_int("TEMPORAL_CLIENT_CONNECT_ATTEMPTS", 5)
+CLIENT_CONNECT_BACKOFF: float = get_env_float("TEMPORAL_CLIENT_CONNECT_BACKOFF", 0.5)
+CLIENT_CONNECT_MAX_BACKOFF: float = get_env_float("TEMPORAL_CLIENT_CONNECT_MAX_BACKOFF", 10.0)
+CLIENT_POOL_SIZE: int = get_env_int("TEMPORAL_CLIENT_POOL_SIZE", 4)
+CLIENT_POOL_STRATEGY: str = os.getenv("TEMPORAL_CLIENT_POOL_STRATEGY", "round_robin")
 
 # Worker configuration
-MAX_CONCURRENT_WORKFLOW_TASKS: int = get_env_int("TEMPORAL_MAX_CONCURRENT_WORKFLOW_TASKS", 300)
-MAX_CONCURRENT_ACTIVITIES: int = get_env_int("TEMPORAL_MAX_CONCURRENT_ACTIVITIES", 300)
-MAX_CONCURRENT_LOCAL_ACTIVITIES: int = get_env_int("TEMPORAL_MAX_CONCURRENT_LOCAL_ACTIVITIES", 100)
-MAX_WORKFLOW_TASK_POLLS: int = get_env_int("TEMPORAL_MAX_WORKFLOW_TASK_POLLS", 10)
-MAX_ACTIVITY_TASK_POLLS: int = get_env_int("TEMPORAL_MAX_ACTIVITY_TASK_POLLS", 10)
+MAX_CONCURRENT_WORKFLOW_TASKS: int | str = get_env_int_or_auto("TEMPORAL_MAX_CONCURRENT_WORKFLOW_TASKS", 300)
+MAX_CONCURRENT_ACTIVITIES: int | str = get_env_int_or_auto("TEMPORAL_MAX_CONCURRENT_ACTIVITIES", 300)
+MAX_CONCURRENT_LOCAL_ACTIVITIES: int | str = get_env_int_or_auto("TEMPORAL_MAX_CONCURRENT_LOCAL_ACTIVITIES", 100)
+MAX_WORKFLOW_TASK_POLLS: int | str = get_env_int_or_auto("TEMPORAL_MAX_WORKFLOW_TASK_POLLS", 10)
+MAX_ACTIVITY_TASK_POLLS: int | str = get_env_int_or_auto("TEMPORAL_MAX_ACTIVITY_TASK_POLLS", 10)
 NONSTICKY_STICKY_RATIO: float = get_env_float("TEMPORAL_NONSTICKY_TO_STICKY_RATIO", default=0.2)
 GRACEFUL_SHUTDOWN_TIMEOUT: timedelta = timedelta(seconds=get_env_int("TEMPORAL_GRACEFUL_SHUTDOWN_TIMEOUT", 30))
 
+# Worker health reporting
+HEALTH_HOST: str = os.getenv("TEMPORAL_HEALTH_HOST", "0.0.0.0")  # noqa: S104
+HEALTH_CHECK_INTERVAL: float = get_env_float("TEMPORAL_HEALTH_CHECK_INTERVAL", 1.0)
+HEALTH_MAX_LOOP_LAG: float = get_env_float("TEMPORAL_HEALTH_MAX_LOOP_LAG", 5.0)
+
+# Cron schedules
+CRON_OVERLAP_POLICY: str = os.getenv("TEMPORAL_CRON_OVERLAP_POLICY", "skip")
+CRON_JITTER: timedelta = timedelta(seconds=get_env_float("TEMPORAL_CRON_JITTER", 0.0))
+CRON_CATCHUP_WINDOW: timedelta = timedelta(seconds=get_env_float("TEMPORAL_CRON_CATCHUP_WINDOW", 60.0))
+CRON_TIME_ZONE: str | None = os.getenv("TEMPORAL_CRON_TIME_ZONE", None)
+
+# Query result cache for API processes
+QUERY_CACHE_TTL: float = get_env_float("TEMPORAL_QUERY_CACHE_TTL", 1.0)
+QUERY_CACHE_MAX_ENTRIES: int = get_env_int("TEMPORAL_QUERY_CACHE_MAX_ENTRIES", 10000)
+
+# Shared workflow result long-polls for API processes
+RESULT_CACHE_TTL: float = get_env_float("TEMPORAL_RESULT_CACHE_TTL", 5.0)
+RESULT_CACHE_MAX_ENTRIES: int = get_env_int("TEMPORAL_RESULT_CACHE_MAX_ENTRIES", 1000)
+
+# Update-with-start calls
+UPDATE_WAIT_STAGE: str = os.getenv("TEMPORAL_UPDATE_WAIT_STAGE", "completed")
+UPDATE_TIMEOUT: float = get_env_float("TEMPORAL_UPDATE_TIMEOUT", 10.0)
+
+# Admission control for ASGI workers
+ADMISSION_MAX_IN_FLIGHT: int = get_env_int("TEMPORAL_ADMISSION_MAX_IN_FLIGHT", 100)
+ADMISSION_MAX_LATENCY: float = get_env_float("TEMPORAL_ADMISSION_MAX_LATENCY", 2.0)
+ADMISSION_RETRY_AFTER: float = get_env_float("TEMPORAL_ADMISSION_RETRY_AFTER", 1.0)
+ADMISSION_WINDOW: float = get_env_float("TEMPORAL_ADMISSION_WINDOW", 10.0)
+
+# HTTP gateway for ASGI workers
+GATEWAY_MAX_BODY_SIZE: int = get_env_int("TEMPORAL_GATEWAY_MAX_BODY_SIZE", 1024 * 1024)
+GATEWAY_BATCH_CONCURRENCY: int = get_env_int("TEMPORAL_GATEWAY_BATCH_CONCURRENCY", 100)
+PROGRESS_POLL_INTERVAL: float = get_env_float("TEMPORAL_PROGRESS_POLL_INTERVAL", 1.0)
+PROGRESS_HEARTBEAT_INTERVAL: float = get_env_float("TEMPORAL_PROGRESS_HEARTBEAT_INTERVAL", 15.0)
+
+# Automatic sizing ("auto" values) derived from container limits
+CGROUP_ROOT: str = os.getenv("TEMPORAL_BOOST_CGROUP_ROOT", "/sys/fs/cgroup")
+AUTO_SLOTS_PER_CPU: int = get_env_int("TEMPORAL_BOOST_AUTO_SLOTS_PER_CPU", 100)
+AUTO_MEMORY_PER_SLOT_MB: int = get_env_int("TEMPORAL_BOOST_AUTO_MEMORY_PER_SLOT_MB", 4)
+AUTO_MAX_SLOTS: int = get_env_int("TEMPORAL_BOOST_AUTO_MAX_SLOTS", 1000)
+
 # Prometheus configuration for Telemetry
 PROMETHEUS_BIND_ADDRESS: str | None = os.getenv("TEMPORAL_PROMETHEUS_BIND_ADDRESS")
 PROMETHEUS_COUNTERS_TOTAL_SUFFIX: bool = get_env_bool("TEMPORAL_PROMETHEUS_COUNTERS_TOTAL_SUFFIX", default=False)
@@ -0,0 +1,356 @@
+import functools
+import logging
+import sys
+import typing
+from collections.abc import Callable, Iterable, Sequence
+from enum import Enum
+from typing import Any
+
+import temporalio.activity
+import temporalio.workflow
+from pydantic import BaseModel, TypeAdapter
+from pydantic.errors import PydanticUserError
+from pydantic_core import to_jsonable_python
+from temporalio.api.common.v1 import Payload, Payloads
+from temporalio.contrib.pydantic import PydanticJSONPlainPayloadConverter
+from temporalio.converter import (
+    BinaryNullPayloadConverter,
+    BinaryPlainPayloadConverter,
+    BinaryProtoPayloadConverter,
+    CompositePayloadConverter,
+    DataConverter,
+    DefaultPayloadConverter,
+    EncodingPayloadConverter,
+    JSONPlainPayloadConverter,
+    JSONProtoPayloadConverter,
+    value_to_type,
+)
+
+
+# Optional serializers are imported once here rather than when a converter is created:
+# workflow payload converters are instantiated inside the sandbox for every run.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore[assignment]
+
+
+logger = logging.getLogger(__name__)
+
+
+class DataConverterType(str, Enum):
+    default = "default"
+    pydantic = "pydantic"
+    orjson = "orjson"
+    msgpack = "msgpack"
+
+
+# Adapters for registered workflows and activities, compiled when a worker is built and kept
+# for the life of the process. Other hints go through a bounded LRU, except classes re-imported
+# by a sandboxed workflow run: caching those would keep every run's modules alive.
+_precompiled_type_adapters: dict[Any, TypeAdapter[Any] | None] = {}
+
+
+def _build_type_adapter(type_hint: Any) -> TypeAdapter[Any] | None:
+    try:
+        return TypeAdapter(type_hint)
+    except PydanticUserError:
+        return None
+
+
+_cached_type_adapter = functools.lru_cache(maxsize=1024)(_build_type_adapter)
+
+
+def _is_reimported(type_hint: Any) -> bool:
+    # A class whose import path leads to another class is a copy from a sandboxed run;
+    # classes that cannot be looked up by name (locals, generic models) are left alone
+    if isinstance(type_hint, type):
+        target: Any = sys.modules.get(type_hint.__module__)
+        for name in type_hint.__qualname__.split("."):
+            target = getattr(target, name, None)
+            if target is None:
+                return False
+        return target is not type_hint
+    return any(_is_reimported(arg) for arg in typing.get_args(type_hint))
+
+
+def get_type_adapter(type_hint: Any) -> TypeAdapter[Any] | None:
+    """Shared ``TypeAdapter`` for a type hint, ``None`` if pydantic cannot build a schema for it."""
+    try:
+        return _precompiled_type_adapters[type_hint]
+    except KeyError:
+        if _is_reimported(type_hint):
+            return _build_type_adapter(type_hint)
+        return _cached_type_adapter(type_hint)
+    except TypeError:
+        # Unhashable hint, build it every time
+        return _build_type_adapter(type_hint)
+
+
+def _definition_type_hints(
+    workflows: Iterable[type],
+    activities: Iterable[Callable[..., Any]],
+) -> list[Any]:
+    type_hints: list[Any] = []
+    for workflow in workflows:
+        definition = temporalio.workflow._Definition.from_class(workflow)  # noqa: SLF001
+        if definition is None:
+            continue
+        type_hints.extend(definition.arg_types or ())
+        type_hints.append(definition.ret_type)
+        for signal in definition.signals.values():
+            type_hints.extend(signal.arg_types or ())
+        for query in definition.queries.values():
+            type_hints.extend(query.arg_types or ())
+            type_hints.append(query.ret_type)
+        for update in definition.updates.values():
+            type_hints.extend(update.arg_types or ())
+            type_hints.append(update.ret_type)
+
+    for activity in activities:
+        activity_definition = temporalio.activity._Definition.from_callable(activity)  # noqa: SLF001
+        if activity_definition is None:
+            continue
+        type_hints.extend(activity_definition.arg_types or ())
+        type_hints.append(activity_definition.ret_type)
+    return type_hints
+
+
+def _hint_modules(type_hint: Any) -> set[str]:
+    modules = {type_hint.__module__} if isinstance(type_hint, type) else set()
+    for arg in typing.get_args(type_hint):
+        modules |= _hint_modules(arg)
+    return modules
+
+
+def model_modules(workflows: Iterable[type], activities: Iterable[Callable[..., Any]]) -> list[str]:
+    """Modules defining the classes used by workflow and activity signatures.
+
+    Modules containing workflows, or their parent packages, are left out, so passing the
+    result through the workflow sandbox never takes the workflow code out of it.
+    """
+    workflows = list(workflows)
+    workflow_modules = {workflow.__module__ for workflow in workflows}
+    modules: set[str] = set()
+    for type_hint in _definition_type_hints(workflows, activities):
+        modules |= _hint_modules(type_hint)
+    return sorted(
+        module
+        for module in modules - {"builtins"}
+        if not any(name == module or name.startswith(f"{module}.") for name in workflow_modules)
+    )
+
+
+def precompile_type_adapters(workflows: Iterable[type], activities: Iterable[Callable[..., Any]]) -> int:
+    """Build the adapters for every run/signal/query/update method and activity up front.
+
+    Adapters are keyed by class, and a sandboxed workflow re-imports the modules that are not
+    passed through on every run, so its classes would never match them. The worker builder
+    therefore passes the ``model_modules()`` of its definitions through the sandbox when it
+    precompiles; classes declared in a workflow module are still re-imported and compiled per
+    run. Returns the number of newly compiled adapters.
+    """
+    compiled = 0
+    for type_hint in _definition_type_hints(workflows, activities):
+        if not _needs_conversion(type_hint):
+            continue
+        try:
+            if type_hint in _precompiled_type_adapters:
+                continue
+        except TypeError:
+            continue
+        _precompiled_type_adapters[type_hint] = _build_type_adapter(type_hint)
+        compiled += 1
+    return compiled
+
+
+def _needs_conversion(type_hint: type | None) -> bool:
+    return type_hint is not None and type_hint is not Any and type_hint is not object
+
+
+def to_type(value: Any, type_hint: type | None) -> Any:
+    """Validate a decoded JSON-compatible value into ``type_hint`` with the shared adapters."""
+    if not _needs_conversion(type_hint):
+        return value
+    adapter = get_type_adapter(type_hint)
+    if adapter is None:
+        return value_to_type(type_hint, value)  # type: ignore[arg-type]
+    return adapter.validate_python(value)
+
+
+class OrjsonPlainPayloadConverter(EncodingPayloadConverter):
+    """``json/plain`` converter backed by orjson and pydantic-core.
+
+    Payloads stay wire-compatible with the default JSON converter, so workers using either
+    one can read each other's histories. Pydantic models, dataclasses, datetimes, UUIDs and
+    enums are encoded natively; type-hinted values are validated in a single pass over the
+    raw JSON bytes.
+    """
+
+    _ENCODING = "json/plain"
+    _OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise RuntimeError("orjson is not installed.")
+
+    @property
+    def encoding(self) -> str:
+        return self._ENCODING
+
+    def to_payload(self, value: Any) -> Payload | None:
+        if isinstance(value, BaseModel):
+            data = value.__pydantic_serializer__.to_json(value)
+        else:
+            data = orjson.dumps(value, default=to_jsonable_python, option=self._OPTIONS)
+        return Payload(metadata={"encoding": self._ENCODING.encode()}, data=data)
+
+    def from_payload(self, payload: Payload, type_hint: type | None = None) -> Any:
+        if _needs_conversion(type_hint):
+            adapter = get_type_adapter(type_hint)
+            if adapter is not None:
+                return adapter.validate_json(payload.data)
+        try:
+            value = orjson.loads(payload.data)
+        except orjson.JSONDecodeError as exc:
+            raise RuntimeError("Failed parsing") from exc
+        return to_type(value, type_hint)
+
+
+class MsgpackPlainPayloadConverter(EncodingPayloadConverter):
+    """``binary/msgpack`` converter backed by msgspec.
+
+    MessagePack payloads are smaller and faster to handle than JSON, but only readable by
+    workers that register this converter as well.
+    """
+
+    _ENCODING = "binary/msgpack"
+
+    def __init__(self) -> None:
+        if msgspec is None:
+            raise RuntimeError("msgspec is not installed.")
+        self._encoder = msgspec.msgpack.Encoder(enc_hook=to_jsonable_python)
+        self._decoder = msgspec.msgpack.Decoder()
+
+    @property
+    def encoding(self) -> str:
+        return self._ENCODING
+
+    def to_payload(self, value: Any) -> Payload | None:
+        return Payload(metadata={"encoding": self._ENCODING.encode()}, data=self._encoder.encode(value))
+
+    def from_payload(self, payload: Payload, type_hint: type | None = None) -> Any:
+        try:
+            value = self._decoder.decode(payload.data)
+        except msgspec.DecodeError as exc:
+            raise RuntimeError("Failed parsing") from exc
+        return to_type(value, type_hint)
+
+
+class CachedPydanticJSONPayloadConverter(PydanticJSONPlainPayloadConverter):
+    """Pydantic JSON converter using the process-wide (and precompiled) adapter cache.
+
+    The SDK converter caches adapters per converter instance, and workflow converters are
+    instantiated for every workflow run, so each run would otherwise rebuild its validators.
+    """
+
+    def from_payload(self, payload: Payload, type_hint: type | None = None) -> Any:
+        adapter = get_type_adapter(type_hint if type_hint is not None else Any)
+        if adapter is None:
+            return super().from_payload(payload, type_hint)
+        return adapter.validate_json(payload.data)
+
+
+class CachedPydanticPayloadConverter(CompositePayloadConverter):
+    """Drop-in replacement for the SDK pydantic payload converter with shared adapters."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            *(
+                CachedPydanticJSONPayloadConverter() if isinstance(converter, JSONPlainPayloadConverter) else converter
+                for converter in DefaultPayloadConverter.default_encoding_payload_converters
+            ),
+        )
+
+
+pydantic_data_converter = DataConverter(payload_converter_class=CachedPydanticPayloadConverter)
+
+
+def uses_shared_type_adapters(data_converter: DataConverter) -> bool:
+    return isinstance(
+        data_converter.payload_converter,
+        CachedPydanticPayloadConverter | OrjsonPayloadConverter | MsgpackPayloadConverter,
+    )
+
+
+def _json_payload_converter() -> EncodingPayloadConverter:
+    return OrjsonPlainPayloadConverter() if orjson is not None else JSONPlainPayloadConverter()
+
+
+class OrjsonPayloadConverter(CompositePayloadConverter):
+    """Default converter chain with orjson in place of the standard library JSON converter."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            BinaryNullPayloadConverter(),
+            BinaryPlainPayloadConverter(),
+            JSONProtoPayloadConverter(),
+            BinaryProtoPayloadConverter(),
+            OrjsonPlainPayloadConverter(),
+        )
+
+
+class MsgpackPayloadConverter(CompositePayloadConverter):
+    """Default converter chain encoding values as MessagePack.
+
+    The JSON converter stays registered after it, so ``json/plain`` payloads written before
+    the switch (or by other SDKs) are still decoded.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(
+            BinaryNullPayloadConverter(),
+            BinaryPlainPayloadConverter(),
+            JSONProtoPayloadConverter(),
+            BinaryProtoPayloadConverter(),
+            MsgpackPlainPayloadConverter(),
+            _json_payload_converter(),
+        )
+
+
+def resolve_data_converter(data_converter: DataConverter | DataConverterType | str) -> DataConverter:
+    if isinstance(data_converter, DataConverter):
+        return data_converter
+
+    try:
+        converter_type = DataConverterType(data_converter.lower())
+    except ValueError:
+        available = ", ".join(item.value for item in DataConverterType)
+        raise ValueError(f"Unknown data converter '{data_converter}', expected one of: {available}") from None
+
+    if converter_type == DataConverterType.pydantic:
+        return pydantic_data_converter
+    if converter_type == DataConverterType.orjson:
+        return DataConverter(payload_converter_class=OrjsonPayloadConverter)
+    if converter_type == DataConverterType.msgpack:
+        return DataConverter(payload_converter_class=MsgpackPayloadConverter)
+    return DataConverter.default
+
+
+def payload_key(data_converter: DataConverter, values: Sequence[Any]) -> bytes | None:
+    """Stable key of ``values`` built from their serialized payloads.
+
+    Equal keys mean the values reach Temporal as the same payloads, unlike ``repr()``, which
+    may be truncated or include object addresses. Returns ``None`` when the values cannot be
+    serialized.
+    """
+    try:
+        payloads = data_converter.payload_converter.to_payloads(values)
+    except Exception:
+        return None
+    return Payloads(payloads=payloads).SerializeToString(deterministic=True)
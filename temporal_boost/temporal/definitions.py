@@ -0,0 +1,78 @@
+import fnmatch
+import inspect
+from collections.abc import Callable, Iterable
+from typing import Any, TypeAlias, TypeVar
+
+import temporalio.activity
+import temporalio.workflow
+from temporalio.worker import Interceptor
+
+from temporal_boost.cli.importer import import_app_object, import_module
+
+
+T = TypeVar("T")
+
+# An object, or an import string resolved when the worker starts: "<module>:<attribute>" for a
+# single object, or "<module>:<pattern>" (e.g. "myapp.orders.activities:*") for every matching
+# definition in the module
+Definition: TypeAlias = T | str
+
+
+def is_activity(value: Any) -> bool:
+    return callable(value) and temporalio.activity._Definition.from_callable(value) is not None  # noqa: SLF001
+
+
+def is_workflow(value: Any) -> bool:
+    return inspect.isclass(value) and temporalio.workflow._Definition.from_class(value) is not None  # noqa: SLF001
+
+
+def is_interceptor(value: Any) -> bool:
+    return isinstance(value, Interceptor)
+
+
+def resolve_definitions(
+    definitions: Iterable[Definition[T]],
+    predicate: Callable[[Any], bool],
+    kind: str,
+) -> list[T]:
+    """Resolve import strings to objects, keeping the other entries as they are.
+
+    Patterns only pick module attributes accepted by ``predicate``; functions and classes
+    imported from elsewhere are skipped, so a module re-exporting another module's
+    definitions does not register them twice.
+    """
+    resolved: list[T] = []
+    for definition in definitions:
+        if not isinstance(definition, str):
+            resolved.append(definition)
+        elif _is_pattern(definition):
+            resolved.extend(_import_matching(definition, predicate, kind))
+        else:
+            resolved.append(import_app_object(definition))
+
+    unique: dict[int, T] = {id(value): value for value in resolved}
+    return list(unique.values())
+
+
+def _is_pattern(import_string: str) -> bool:
+    return any(char in import_string.partition(":")[2] for char in "*?[")
+
+
+def _import_matching(import_string: str, predicate: Callable[[Any], bool], kind: str) -> list[Any]:
+    module_str, _, pattern = import_string.partition(":")
+    module = import_module(module_str)
+
+    matched = [
+        value
+        for name, value in vars(module).items()
+        if fnmatch.fnmatchcase(name, pattern) and _defined_in(value, module.__name__) and predicate(value)
+    ]
+    if not matched:
+        raise ValueError(f'Import string "{import_string}" matched no {kind}.')
+    return matched
+
+
+def _defined_in(value: Any, module_name: str) -> bool:
+    if inspect.isclass(value) or inspect.isroutine(value):
+        return getattr(value, "__module__", None) == module_name
+    return True
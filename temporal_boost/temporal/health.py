@@ -0,0 +1,237 @@
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from temporalio.worker import (
+    CustomSlotSupplier,
+    FixedSizeSlotSupplier,
+    SlotMarkUsedContext,
+    SlotPermit,
+    SlotReleaseContext,
+    SlotReserveContext,
+    Worker,
+    WorkerTuner,
+)
+
+from temporal_boost.temporal import config
+
+
+@dataclass(frozen=True)
+class SlotUsage:
+    capacity: int
+    reserved: int
+    used: int
+
+    @property
+    def available(self) -> int:
+        return self.capacity - self.used
+
+    @property
+    def polling(self) -> int:
+        # Slots are reserved before a poll and marked used once it returns a task
+        return self.reserved - self.used
+
+
+class _TrackedPermit(SlotPermit):
+    def __init__(self) -> None:
+        self.used = False
+
+
+def _wake(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class TrackingSlotSupplier(CustomSlotSupplier):
+    """Fixed-size slot supplier that counts reserved and used slots.
+
+    Behaves like the SDK's ``FixedSizeSlotSupplier`` with ``capacity`` slots, but runs in
+    Python: every reserve, mark and release takes a lock, because the SDK may call them from its
+    own threads. Reservations without a task are the outstanding polls. ``last_task_at`` is the
+    monotonic time a poll, or eager dispatch, last handed over a task; polls that time out
+    without a task do not move it, so it says nothing about whether polling still succeeds.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.first_reserved_at: float | None = None
+        self.last_task_at: float | None = None
+        self._reserved = 0
+        self._used = 0
+        self._waiters: list[asyncio.Future[None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def usage(self) -> SlotUsage:
+        with self._lock:
+            return SlotUsage(self.capacity, self._reserved, self._used)
+
+    async def reserve_slot(self, ctx: SlotReserveContext) -> SlotPermit:  # noqa: ARG002
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                permit = self._reserve()
+                if permit is not None:
+                    return permit
+                waiter = loop.create_future()
+                self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                with self._lock, contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+
+    def try_reserve_slot(self, ctx: SlotReserveContext) -> SlotPermit | None:  # noqa: ARG002
+        with self._lock:
+            return self._reserve()
+
+    def mark_slot_used(self, ctx: SlotMarkUsedContext) -> None:
+        with self._lock:
+            if isinstance(ctx.permit, _TrackedPermit) and not ctx.permit.used:
+                ctx.permit.used = True
+                self._used += 1
+            self.last_task_at = time.monotonic()
+
+    def release_slot(self, ctx: SlotReleaseContext) -> None:
+        with self._lock:
+            self._reserved -= 1
+            if isinstance(ctx.permit, _TrackedPermit) and ctx.permit.used:
+                self._used -= 1
+            # Waiters re-check the count, so waking all of them cannot lose a wake-up
+            waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+
+    def _reserve(self) -> SlotPermit | None:
+        if self._reserved >= self.capacity:
+            return None
+        self._reserved += 1
+        if self.first_reserved_at is None:
+            self.first_reserved_at = time.monotonic()
+        return _TrackedPermit()
+
+
+class WorkerHealth:
+    """Poller, slot and event loop health of one Temporal worker.
+
+    ``tuner()`` replaces the worker's fixed slot limits with ``TrackingSlotSupplier`` instances
+    of the same size, so slot usage costs a few counter updates per task. A monitor task on
+    the worker's event loop measures how late its sleeps wake up; a loop blocked since the last
+    check is reported by the age of that check, so the lag stays accurate when the report is
+    read from another thread. ``snapshot()`` only reads counters and is cheap to poll.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        task_queue: str,
+        *,
+        check_interval: float | None = None,
+        max_loop_lag: float | None = None,
+    ) -> None:
+        self.name = name
+        self.task_queue = task_queue
+        self._check_interval = check_interval or config.HEALTH_CHECK_INTERVAL
+        self._max_loop_lag = max_loop_lag if max_loop_lag is not None else config.HEALTH_MAX_LOOP_LAG
+        self._suppliers: dict[str, TrackingSlotSupplier] = {}
+        self._worker: Worker | None = None
+        self._monitor: asyncio.Task[None] | None = None
+        self._loop_lag = 0.0
+        self._checked_at: float | None = None
+
+    @property
+    def slots(self) -> dict[str, SlotUsage]:
+        return {slot_type: supplier.usage for slot_type, supplier in self._suppliers.items()}
+
+    @property
+    def polling(self) -> bool:
+        # Pollers reserve a slot before their first poll, so any reservation means polling started
+        return any(supplier.first_reserved_at is not None for supplier in self._suppliers.values())
+
+    @property
+    def seconds_since_last_task(self) -> float | None:
+        # Time since a task was last delivered, not since the last poll: None until the first
+        # task, and it keeps growing while a healthy worker sits idle
+        times = [supplier.last_task_at for supplier in self._suppliers.values() if supplier.last_task_at is not None]
+        return time.monotonic() - max(times) if times else None
+
+    @property
+    def loop_lag(self) -> float:
+        if self._checked_at is None:
+            return 0.0
+        overdue = time.monotonic() - self._checked_at - self._check_interval
+        return max(self._loop_lag, overdue)
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and self._worker.is_running and not self._worker.is_shutdown
+
+    @property
+    def live(self) -> bool:
+        return not self._max_loop_lag or self.loop_lag <= self._max_loop_lag
+
+    @property
+    def ready(self) -> bool:
+        return self.running and self.polling and self.live
+
+    def tuner(self, limits: Mapping[str, int], *, nexus_slots: int | None = None) -> WorkerTuner:
+        self._suppliers = {
+            "workflow": TrackingSlotSupplier(limits["max_concurrent_workflow_tasks"]),
+            "activity": TrackingSlotSupplier(limits["max_concurrent_activities"]),
+            "local_activity": TrackingSlotSupplier(limits["max_concurrent_local_activities"]),
+        }
+        return WorkerTuner.create_composite(
+            workflow_supplier=self._suppliers["workflow"],
+            activity_supplier=self._suppliers["activity"],
+            local_activity_supplier=self._suppliers["local_activity"],
+            nexus_supplier=FixedSizeSlotSupplier(nexus_slots or 100),
+        )
+
+    def start(self, worker: Worker) -> None:
+        self._worker = worker
+        if self._monitor is None:
+            self._checked_at = time.monotonic()
+            self._monitor = asyncio.create_task(self._monitor_loop())
+
+    async def stop(self) -> None:
+        if self._monitor is not None:
+            self._monitor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._monitor
+            self._monitor = None
+        self._checked_at = None
+
+    def snapshot(self) -> dict[str, Any]:
+        seconds_since_last_task = self.seconds_since_last_task
+        return {
+            "worker": self.name,
+            "task_queue": self.task_queue,
+            "live": self.live,
+            "ready": self.ready,
+            "running": self.running,
+            "polling": self.polling,
+            "event_loop_lag": round(self.loop_lag, 4),
+            "seconds_since_last_task": (
+                round(seconds_since_last_task, 3) if seconds_since_last_task is not None else None
+            ),
+            "slots": {
+                slot_type: {
+                    "capacity": usage.capacity,
+                    "used": usage.used,
+                    "available": usage.available,
+                    "pollers": usage.polling,
+                }
+                for slot_type, usage in self.slots.items()
+            },
+        }
+
+    async def _monitor_loop(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self._check_interval)
+            self._checked_at = time.monotonic()
+            self._loop_lag = max(0.0, self._checked_at - started - self._check_interval)
@@ -0,0 +1,148 @@
+import asyncio
+import dataclasses
+import threading
+from collections.abc import Coroutine, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import DataConverter, PayloadCodec
+
+
+T = TypeVar("T")
+
+_thread_state = threading.local()
+
+
+def _run_on_thread_loop(coroutine: Coroutine[Any, Any, T]) -> T:
+    # Each executor thread keeps one event loop for the async codec APIs
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None:
+        loop = _thread_state.loop = asyncio.new_event_loop()
+
+    _thread_state.active = True
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        _thread_state.active = False
+
+
+@dataclass
+class OffloadStats:
+    inline: int = 0
+    offloaded: int = 0
+    bytes_offloaded: int = 0
+
+
+class PayloadOffloader:
+    """Runs encode/decode work for batches of at least ``threshold`` bytes in an executor.
+
+    Small batches stay on the event loop, where a thread hop would cost more than the
+    work itself. Nested calls made from an offloaded task run inline on that thread.
+
+    Offloaded codecs run concurrently on the executor threads, each with its own event loop,
+    so they must be thread-safe and must not use asyncio primitives, sessions or connections
+    bound to another loop.
+    """
+
+    def __init__(
+        self,
+        threshold: int,
+        *,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        self._threshold = threshold
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self.stats = OffloadStats()
+
+    @property
+    def threshold(self) -> int:
+        return self._threshold
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix="temporal-boost-payload",
+                    )
+        return self._executor
+
+    def should_offload(self, payloads: Sequence[Payload]) -> bool:
+        if getattr(_thread_state, "active", False):
+            return False
+
+        size = sum(len(payload.data) for payload in payloads)
+        with self._lock:
+            if size < self._threshold:
+                self.stats.inline += 1
+                return False
+
+            self.stats.offloaded += 1
+            self.stats.bytes_offloaded += size
+            return True
+
+    async def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, _run_on_thread_loop, coroutine)
+
+    def shutdown(self) -> None:
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class OffloadingPayloadCodec(PayloadCodec):
+    """Codec wrapper running ``codec`` in the offloader's executor for large batches."""
+
+    def __init__(self, codec: PayloadCodec, offloader: PayloadOffloader) -> None:
+        self._codec = codec
+        self._offloader = offloader
+
+    @property
+    def codec(self) -> PayloadCodec:
+        return self._codec
+
+    async def encode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        if self._offloader.should_offload(payloads):
+            return await self._offloader.run(self._codec.encode(payloads))
+        return await self._codec.encode(payloads)
+
+    async def decode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        if self._offloader.should_offload(payloads):
+            return await self._offloader.run(self._codec.decode(payloads))
+        return await self._codec.decode(payloads)
+
+
+@dataclass(frozen=True)
+class OffloadingDataConverter(DataConverter):
+    """Data converter decoding large payloads, conversion included, in an executor.
+
+    On the encode side the payload size is only known after conversion, so values are
+    converted inline and only the codec step is offloaded (see ``OffloadingPayloadCodec``).
+    """
+
+    offloader: PayloadOffloader | None = None
+
+    async def decode(self, payloads: Sequence[Payload], type_hints: list[type] | None = None) -> list[Any]:
+        if self.offloader is not None and self.offloader.should_offload(payloads):
+            return await self.offloader.run(super().decode(payloads, type_hints))
+        return await super().decode(payloads, type_hints)
+
+
+def with_payload_offload(data_converter: DataConverter, offloader: PayloadOffloader) -> OffloadingDataConverter:
+    payload_codec = data_converter.payload_codec
+    if payload_codec is not None and not isinstance(payload_codec, OffloadingPayloadCodec):
+        payload_codec = OffloadingPayloadCodec(payload_codec, offloader)
+
+    fields = {
+        field.name: getattr(data_converter, field.name) for field in dataclasses.fields(data_converter) if field.init
+    }
+    fields.update(payload_codec=payload_codec, offloader=offloader)
+    return OffloadingDataConverter(**fields)
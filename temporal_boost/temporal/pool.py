@@ -0,0 +1,128 @@
+import functools
+import inspect
+import itertools
+from collections.abc import Callable, Sequence
+from enum import Enum
+from typing import Any
+
+from temporalio.client import Client, WorkflowHandle
+
+
+class ClientPoolStrategy(str, Enum):
+    round_robin = "round_robin"
+    least_in_flight = "least_in_flight"
+
+
+class _PoolSlot:
+    def __init__(self, client: Client) -> None:
+        self.client = client
+        self.in_flight = 0
+
+
+class _TrackedProxy:
+    """Forward attribute access to a pooled object, counting in-flight RPCs on its slot."""
+
+    def __init__(self, target: Any, slot: _PoolSlot) -> None:
+        self._target = target
+        self._slot = slot
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def tracked(*args: Any, **kwargs: Any) -> Any:
+            self._slot.in_flight += 1
+            try:
+                return _wrap_result(await attribute(*args, **kwargs), self._slot)
+            finally:
+                self._slot.in_flight -= 1
+
+        return tracked
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self._target!r}>"
+
+
+class PooledWorkflowHandle(_TrackedProxy):
+    pass
+
+
+def _wrap_result(result: Any, slot: _PoolSlot) -> Any:
+    if isinstance(result, WorkflowHandle):
+        return PooledWorkflowHandle(result, slot)
+    return result
+
+
+class TemporalClientPool:
+    """Client-like object spreading RPCs over several connections to the same target.
+
+    Coroutine methods of ``Client`` (``start_workflow``, ``execute_workflow``, ...) run on the
+    connection picked by the strategy, and workflow handles stay bound to the connection
+    that created them so their signals, queries and results are counted on it as well.
+    """
+
+    _HANDLE_FACTORIES = frozenset({"get_workflow_handle", "get_workflow_handle_for"})
+
+    def __init__(
+        self,
+        clients: Sequence[Client],
+        *,
+        strategy: ClientPoolStrategy | str = ClientPoolStrategy.round_robin,
+    ) -> None:
+        if not clients:
+            raise ValueError("TemporalClientPool requires at least one client")
+
+        self._slots = [_PoolSlot(client) for client in clients]
+        self._strategy = ClientPoolStrategy(strategy)
+        self._counter = itertools.count()
+
+    @property
+    def size(self) -> int:
+        return len(self._slots)
+
+    @property
+    def clients(self) -> list[Client]:
+        return [slot.client for slot in self._slots]
+
+    @property
+    def in_flight(self) -> list[int]:
+        return [slot.in_flight for slot in self._slots]
+
+    def _next_slot(self) -> _PoolSlot:
+        start = next(self._counter) % len(self._slots)
+        if self._strategy == ClientPoolStrategy.round_robin:
+            return self._slots[start]
+
+        rotated = self._slots[start:] + self._slots[:start]
+        return min(rotated, key=lambda slot: slot.in_flight)
+
+    def get_client(self) -> Client:
+        return self._next_slot().client
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._slots[0].client, name)
+        if name in self._HANDLE_FACTORIES:
+            return self._handle_factory(name)
+        if inspect.iscoroutinefunction(attribute):
+            return self._dispatch(name)
+        return attribute
+
+    def _handle_factory(self, name: str) -> Callable[..., PooledWorkflowHandle]:
+        def factory(*args: Any, **kwargs: Any) -> PooledWorkflowHandle:
+            slot = self._next_slot()
+            return PooledWorkflowHandle(getattr(slot.client, name)(*args, **kwargs), slot)
+
+        return factory
+
+    def _dispatch(self, name: str) -> Callable[..., Any]:
+        async def dispatch(*args: Any, **kwargs: Any) -> Any:
+            slot = self._next_slot()
+            slot.in_flight += 1
+            try:
+                return _wrap_result(await getattr(slot.client, name)(*args, **kwargs), slot)
+            finally:
+                slot.in_flight -= 1
+
+        return dispatch
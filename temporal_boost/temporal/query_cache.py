@@ -0,0 +1,278 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from temporalio.client import (
+    Client,
+    Interceptor,
+    OutboundInterceptor,
+    SignalWorkflowInput,
+    StartWorkflowInput,
+    StartWorkflowUpdateInput,
+    StartWorkflowUpdateWithStartInput,
+    WorkflowHandle,
+    WorkflowUpdateHandle,
+)
+from temporalio.common import MetricMeter
+from temporalio.runtime import Runtime
+
+from temporal_boost.temporal import config
+from temporal_boost.temporal.converter import payload_key
+from temporal_boost.temporal.pool import TemporalClientPool
+
+
+_QueryKey = tuple[str, str | None, str, type | None, bytes]
+
+
+@dataclass(frozen=True)
+class QueryCacheOptions:
+    """Settings of a ``QueryCache``; ``None`` values fall back to the ``TEMPORAL_QUERY_CACHE_*`` settings.
+
+    ``ttls`` maps query names to their TTL in seconds and overrides ``ttl`` for those
+    queries. A TTL of ``0`` disables caching for a query, while concurrent identical calls
+    are still collapsed into one RPC.
+    """
+
+    ttl: float | None = None
+    ttls: Mapping[str, float] = field(default_factory=dict)
+    max_entries: int | None = None
+
+
+@dataclass
+class QueryCacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        # Coalesced calls are answered without their own RPC, so they count as hits
+        requests = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / requests if requests else 0.0
+
+
+def _client_metric_meter(client: Any) -> MetricMeter:
+    runtime = getattr(getattr(getattr(client, "service_client", None), "config", None), "runtime", None)
+    return runtime.metric_meter if isinstance(runtime, Runtime) else MetricMeter.noop
+
+
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    # The caller that started a fetch may be gone; avoid "exception was never retrieved"
+    if not task.cancelled():
+        task.exception()
+
+
+class QueryCache:
+    """Workflow query results cached for a short, per-query TTL in a bounded LRU.
+
+    Concurrent calls for the same workflow, run, query, result type and arguments share one
+    RPC (singleflight). Arguments are compared by their payloads from the client's data
+    converter; queries with arguments it cannot serialize bypass the cache. Signals sent
+    through ``signal()``, and explicit ``invalidate()`` calls, drop the workflow's cached
+    results, including queries in flight at that moment, so the next query after a signal
+    from this process always reaches the workflow. Install a ``QueryCacheInterceptor`` on the
+    client to invalidate on every signal and update it sends.
+    """
+
+    def __init__(
+        self,
+        client: Client | TemporalClientPool,
+        options: QueryCacheOptions | None = None,
+        *,
+        metric_meter: MetricMeter | None = None,
+    ) -> None:
+        options = options or QueryCacheOptions()
+        self._client = client
+        self._ttl = options.ttl if options.ttl is not None else config.QUERY_CACHE_TTL
+        self._ttls = dict(options.ttls)
+        self._max_entries = options.max_entries or config.QUERY_CACHE_MAX_ENTRIES
+
+        self._entries: OrderedDict[_QueryKey, tuple[float, Any]] = OrderedDict()
+        self._keys_by_workflow: dict[str, set[_QueryKey]] = {}
+        self._in_flight: dict[_QueryKey, asyncio.Task[Any]] = {}
+        self._stale: set[asyncio.Task[Any]] = set()
+
+        self.stats = QueryCacheStats()
+        self.bind_metric_meter(metric_meter or _client_metric_meter(client))
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    def bind_metric_meter(self, metric_meter: MetricMeter) -> None:
+        self._hits_counter = metric_meter.create_counter("boost_query_cache_hits", "Queries answered from the cache")
+        self._misses_counter = metric_meter.create_counter("boost_query_cache_misses", "Queries sent to Temporal")
+        self._coalesced_counter = metric_meter.create_counter(
+            "boost_query_cache_coalesced",
+            "Queries that joined an identical query in flight",
+        )
+        self._evictions_counter = metric_meter.create_counter(
+            "boost_query_cache_evictions",
+            "Cached query results evicted by the size bound",
+        )
+        self._invalidations_counter = metric_meter.create_counter(
+            "boost_query_cache_invalidations",
+            "Workflows whose cached query results were invalidated",
+        )
+
+    def ttl_for(self, query: str) -> float:
+        return self._ttls.get(query, self._ttl)
+
+    async def query(
+        self,
+        workflow_id: str,
+        query: str,
+        *args: Any,
+        run_id: str | None = None,
+        result_type: type | None = None,
+    ) -> Any:
+        attributes = {"query": query}
+        args_key = payload_key(self._client.data_converter, args)
+        if args_key is None:
+            self.stats.misses += 1
+            self._misses_counter.add(1, attributes)
+            handle = self._client.get_workflow_handle(workflow_id, run_id=run_id)
+            return await handle.query(query, args=args, result_type=result_type)
+        key = (workflow_id, run_id, query, result_type, args_key)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                self._hits_counter.add(1, attributes)
+                return value
+            self._remove(key)
+
+        task = self._in_flight.get(key)
+        if task is not None and task not in self._stale:
+            self.stats.coalesced += 1
+            self._coalesced_counter.add(1, attributes)
+        else:
+            self.stats.misses += 1
+            self._misses_counter.add(1, attributes)
+            task = asyncio.create_task(self._fetch(key, args))
+            task.add_done_callback(_retrieve_exception)
+            self._in_flight[key] = task
+
+        # Shielded so a caller giving up does not cancel the RPC other callers wait for
+        return await asyncio.shield(task)
+
+    async def signal(self, workflow_id: str, signal: str, *args: Any, run_id: str | None = None) -> None:
+        handle = self._client.get_workflow_handle(workflow_id, run_id=run_id)
+        try:
+            await handle.signal(signal, args=args)
+        finally:
+            self.invalidate(workflow_id)
+
+    def invalidate(self, workflow_id: str) -> None:
+        keys = self._keys_by_workflow.pop(workflow_id, set())
+        for key in keys:
+            self._entries.pop(key, None)
+        in_flight = {task for key, task in self._in_flight.items() if key[0] == workflow_id}
+        self._stale.update(in_flight)
+        if keys or in_flight:
+            self.stats.invalidations += 1
+            self._invalidations_counter.add(1)
+
+    def clear(self) -> None:
+        self._stale.update(self._in_flight.values())
+        self._entries.clear()
+        self._keys_by_workflow.clear()
+
+    async def _fetch(self, key: _QueryKey, args: tuple[Any, ...]) -> Any:
+        workflow_id, run_id, query, result_type, _ = key
+        task = cast("asyncio.Task[Any]", asyncio.current_task())
+        try:
+            handle = self._client.get_workflow_handle(workflow_id, run_id=run_id)
+            value = await handle.query(query, args=args, result_type=result_type)
+            ttl = self.ttl_for(query)
+            # A result that raced with an invalidation may predate the signal, so it is not kept
+            if ttl > 0 and task not in self._stale:
+                self._store(key, value, ttl)
+            return value
+        finally:
+            # An invalidation may have let a newer fetch for the same key take over
+            if self._in_flight.get(key) is task:
+                del self._in_flight[key]
+            self._stale.discard(task)
+
+    def _store(self, key: _QueryKey, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        self._keys_by_workflow.setdefault(key[0], set()).add(key)
+        while len(self._entries) > self._max_entries:
+            oldest, _ = self._entries.popitem(last=False)
+            self._forget(oldest)
+            self.stats.evictions += 1
+            self._evictions_counter.add(1)
+
+    def _remove(self, key: _QueryKey) -> None:
+        del self._entries[key]
+        self._forget(key)
+
+    def _forget(self, key: _QueryKey) -> None:
+        keys = self._keys_by_workflow.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_workflow[key[0]]
+
+
+class QueryCacheInterceptor(Interceptor):
+    """Client interceptor invalidating ``cache`` for workflows the client signals or updates.
+
+    The cache needs a connected client while the interceptor must be installed before
+    connecting, so ``cache`` is assigned once both exist; until then calls pass through.
+    """
+
+    def __init__(self, cache: QueryCache | None = None) -> None:
+        self.cache = cache
+
+    def intercept_client(self, next: OutboundInterceptor) -> OutboundInterceptor:  # noqa: A002
+        return _QueryCacheOutboundInterceptor(next, self)
+
+
+class _QueryCacheOutboundInterceptor(OutboundInterceptor):
+    def __init__(self, next: OutboundInterceptor, root: QueryCacheInterceptor) -> None:  # noqa: A002
+        super().__init__(next)
+        self._root = root
+
+    def _invalidate(self, workflow_id: str) -> None:
+        if self._root.cache is not None:
+            self._root.cache.invalidate(workflow_id)
+
+    async def start_workflow(self, input: StartWorkflowInput) -> WorkflowHandle[Any, Any]:  # noqa: A002
+        try:
+            return await super().start_workflow(input)
+        finally:
+            # Signal-with-start reaches a running workflow as well
+            if input.start_signal is not None:
+                self._invalidate(input.id)
+
+    async def signal_workflow(self, input: SignalWorkflowInput) -> None:  # noqa: A002
+        try:
+            await super().signal_workflow(input)
+        finally:
+            self._invalidate(input.id)
+
+    async def start_workflow_update(self, input: StartWorkflowUpdateInput) -> WorkflowUpdateHandle[Any]:  # noqa: A002
+        try:
+            return await super().start_workflow_update(input)
+        finally:
+            self._invalidate(input.id)
+
+    async def start_update_with_start_workflow(
+        self,
+        input: StartWorkflowUpdateWithStartInput,  # noqa: A002
+    ) -> WorkflowUpdateHandle[Any]:
+        try:
+            return await super().start_update_with_start_workflow(input)
+        finally:
+            self._invalidate(input.start_workflow_input.id)
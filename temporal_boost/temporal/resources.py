@@ -0,0 +1,138 @@
+import logging
+import math
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from temporal_boost.temporal import config
+
+
+logger = logging.getLogger(__name__)
+
+PROCESS_COUNT_ENV = "TEMPORAL_BOOST_PROCESSES"
+
+# cgroup v1 reports "no limit" as a huge page-aligned number instead of "max"
+_CGROUP_V1_UNLIMITED = 1 << 60
+_MIN_WORKFLOW_TASK_POLLS = 2
+_MAX_TASK_POLLS = 10
+_SLOTS_PER_POLL = 30
+_MIN_SLOTS = 2
+
+
+@dataclass(frozen=True)
+class ContainerResources:
+    cpu_limit: float
+    memory_limit: int | None
+    source: str
+
+
+@dataclass(frozen=True)
+class WorkerLimits:
+    max_concurrent_workflow_tasks: int
+    max_concurrent_activities: int
+    max_concurrent_local_activities: int
+    max_concurrent_workflow_task_polls: int
+    max_concurrent_activity_task_polls: int
+    activity_executor_workers: int
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def _host_cpu_count() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def _read_cgroup_v2(root: Path) -> tuple[float | None, int | None]:
+    cpu_limit: float | None = None
+    cpu_max = _read_text(root / "cpu.max")
+    if cpu_max:
+        quota, _, period = cpu_max.partition(" ")
+        if quota != "max" and period:
+            cpu_limit = int(quota) / int(period)
+
+    memory_limit: int | None = None
+    memory_max = _read_text(root / "memory.max")
+    if memory_max and memory_max != "max":
+        memory_limit = int(memory_max)
+    return cpu_limit, memory_limit
+
+
+def _read_cgroup_v1(root: Path) -> tuple[float | None, int | None]:
+    cpu_limit: float | None = None
+    for cpu_dir in ("cpu", "cpu,cpuacct"):
+        quota = _read_text(root / cpu_dir / "cpu.cfs_quota_us")
+        period = _read_text(root / cpu_dir / "cpu.cfs_period_us")
+        if quota and period and int(quota) > 0:
+            cpu_limit = int(quota) / int(period)
+            break
+
+    memory_limit: int | None = None
+    memory_max = _read_text(root / "memory" / "memory.limit_in_bytes")
+    if memory_max and int(memory_max) < _CGROUP_V1_UNLIMITED:
+        memory_limit = int(memory_max)
+    return cpu_limit, memory_limit
+
+
+def detect_container_resources(cgroup_root: str | Path | None = None) -> ContainerResources:
+    root = Path(cgroup_root or config.CGROUP_ROOT)
+    host_cpus = _host_cpu_count()
+
+    try:
+        if (root / "cgroup.controllers").exists():
+            source = "cgroup2"
+            cpu_limit, memory_limit = _read_cgroup_v2(root)
+        elif (root / "memory").exists() or (root / "cpu").exists() or (root / "cpu,cpuacct").exists():
+            source = "cgroup1"
+            cpu_limit, memory_limit = _read_cgroup_v1(root)
+        else:
+            source, cpu_limit, memory_limit = "host", None, None
+    except ValueError:
+        logger.warning(f"Cannot parse cgroup limits under '{root}', falling back to host resources")
+        source, cpu_limit, memory_limit = "host", None, None
+
+    if cpu_limit is None:
+        cpu_limit = float(host_cpus)
+    return ContainerResources(
+        cpu_limit=min(cpu_limit, float(host_cpus)),
+        memory_limit=memory_limit,
+        source=source,
+    )
+
+
+def auto_process_count(resources: ContainerResources | None = None) -> int:
+    resources = resources or detect_container_resources()
+    return max(1, math.floor(resources.cpu_limit))
+
+
+def auto_worker_limits(
+    resources: ContainerResources | None = None,
+    processes: int | None = None,
+) -> WorkerLimits:
+    resources = resources or detect_container_resources()
+    processes = max(1, processes or config.get_env_int(PROCESS_COUNT_ENV, 1))
+
+    cpus_per_process = resources.cpu_limit / processes
+    slots = round(cpus_per_process * config.AUTO_SLOTS_PER_CPU)
+
+    if resources.memory_limit is not None:
+        memory_per_process = resources.memory_limit // processes
+        slots = min(slots, memory_per_process // (config.AUTO_MEMORY_PER_SLOT_MB * 1024 * 1024))
+
+    slots = max(_MIN_SLOTS, min(slots, config.AUTO_MAX_SLOTS))
+    polls = max(1, min(slots // _SLOTS_PER_POLL, _MAX_TASK_POLLS))
+
+    return WorkerLimits(
+        max_concurrent_workflow_tasks=slots,
+        max_concurrent_activities=slots,
+        max_concurrent_local_activities=max(1, slots // 3),
+        max_concurrent_workflow_task_polls=max(_MIN_WORKFLOW_TASK_POLLS, polls),
+        max_concurrent_activity_task_polls=polls,
+        activity_executor_workers=slots,
+    )
@@ -0,0 +1,139 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from temporalio.client import Client, WorkflowFailureError
+
+from temporal_boost.temporal import config
+from temporal_boost.temporal.pool import TemporalClientPool
+
+
+_ResultKey = tuple[str, str | None, Any]
+
+
+@dataclass
+class ResultWaiterStats:
+    waits: int = 0
+    long_polls: int = 0
+    coalesced: int = 0
+    cache_hits: int = 0
+
+
+@dataclass
+class _PendingResult:
+    task: asyncio.Task[Any]
+    waiters: int = 0
+
+
+@dataclass
+class _Outcome:
+    expires_at: float
+    value: Any = None
+    error: BaseException | None = None
+
+    def unwrap(self) -> Any:
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    # Every waiter may have left before the long-poll finished; avoid "exception was never retrieved"
+    if not task.cancelled():
+        task.exception()
+
+
+class ResultWaiter:
+    """Waits for workflow results with one shared long-poll per workflow run.
+
+    Concurrent ``result()`` calls for the same workflow ID and run ID share a single
+    ``handle.result()`` long-poll, and its result, or ``WorkflowFailureError``, is handed to
+    every waiter and kept for ``cache_ttl`` seconds for callers arriving just after. A waiter
+    timing out does not affect the others, and the long-poll is cancelled once no one waits.
+    """
+
+    def __init__(
+        self,
+        client: Client | TemporalClientPool,
+        *,
+        cache_ttl: float | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        self._client = client
+        self._cache_ttl = cache_ttl if cache_ttl is not None else config.RESULT_CACHE_TTL
+        self._max_entries = max_entries or config.RESULT_CACHE_MAX_ENTRIES
+        self._pending: dict[_ResultKey, _PendingResult] = {}
+        self._outcomes: OrderedDict[_ResultKey, _Outcome] = OrderedDict()
+        self.stats = ResultWaiterStats()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def result(
+        self,
+        workflow_id: str,
+        *,
+        run_id: str | None = None,
+        result_type: type | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        # Raises asyncio.TimeoutError after ``timeout`` seconds without cancelling the shared long-poll
+        key = (workflow_id, run_id, result_type)
+        self.stats.waits += 1
+
+        outcome = self._outcomes.get(key)
+        if outcome is not None:
+            if outcome.expires_at > time.monotonic():
+                self.stats.cache_hits += 1
+                return outcome.unwrap()
+            del self._outcomes[key]
+
+        pending = self._pending.get(key)
+        if pending is None:
+            self.stats.long_polls += 1
+            task = asyncio.create_task(self._long_poll(key))
+            task.add_done_callback(_retrieve_exception)
+            pending = self._pending[key] = _PendingResult(task)
+        else:
+            self.stats.coalesced += 1
+
+        pending.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(pending.task), timeout)
+        finally:
+            pending.waiters -= 1
+            if not pending.waiters and not pending.task.done():
+                pending.task.cancel()
+                if self._pending.get(key) is pending:
+                    del self._pending[key]
+
+    def clear(self) -> None:
+        self._outcomes.clear()
+
+    async def _long_poll(self, key: _ResultKey) -> Any:
+        workflow_id, run_id, result_type = key
+        try:
+            handle = self._client.get_workflow_handle(workflow_id, run_id=run_id, result_type=result_type)
+            value = await handle.result()
+        except WorkflowFailureError as exc:
+            self._store(key, _Outcome(time.monotonic() + self._cache_ttl, error=exc))
+            raise
+        else:
+            self._store(key, _Outcome(time.monotonic() + self._cache_ttl, value=value))
+            return value
+        finally:
+            pending = self._pending.get(key)
+            if pending is not None and pending.task is asyncio.current_task():
+                del self._pending[key]
+
+    def _store(self, key: _ResultKey, outcome: _Outcome) -> None:
+        # Only workflow outcomes are cached; RPC errors are handed to current waiters alone
+        if self._cache_ttl <= 0:
+            return
+        self._outcomes[key] = outcome
+        self._outcomes.move_to_end(key)
+        while len(self._outcomes) > self._max_entries:
+            self._outcomes.popitem(last=False)
@@ -0,0 +1,153 @@
+import hashlib
+import logging
+import re
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import Enum
+from typing import Any
+
+import temporalio.workflow
+from temporalio.client import (
+    Client,
+    Schedule,
+    ScheduleActionStartWorkflow,
+    ScheduleAlreadyRunningError,
+    ScheduleOverlapPolicy,
+    SchedulePolicy,
+    ScheduleSpec,
+    ScheduleState,
+    ScheduleUpdate,
+    ScheduleUpdateInput,
+)
+
+from temporal_boost.temporal import config
+
+
+logger = logging.getLogger(__name__)
+
+# Prefix of the schedule note holding the fingerprint of the configuration that created it
+_FINGERPRINT_PREFIX = "temporal-boost:"
+
+
+class CronOverlapPolicy(str, Enum):
+    skip = "skip"
+    buffer_one = "buffer_one"
+    buffer_all = "buffer_all"
+    cancel_other = "cancel_other"
+    terminate_other = "terminate_other"
+    allow_all = "allow_all"
+
+
+_OVERLAP_POLICIES: dict[CronOverlapPolicy, ScheduleOverlapPolicy] = {
+    CronOverlapPolicy.skip: ScheduleOverlapPolicy.SKIP,
+    CronOverlapPolicy.buffer_one: ScheduleOverlapPolicy.BUFFER_ONE,
+    CronOverlapPolicy.buffer_all: ScheduleOverlapPolicy.BUFFER_ALL,
+    CronOverlapPolicy.cancel_other: ScheduleOverlapPolicy.CANCEL_OTHER,
+    CronOverlapPolicy.terminate_other: ScheduleOverlapPolicy.TERMINATE_OTHER,
+    CronOverlapPolicy.allow_all: ScheduleOverlapPolicy.ALLOW_ALL,
+}
+
+
+@dataclass(frozen=True)
+class CronScheduleOptions:
+    """Options of the Temporal Schedule backing a cron worker.
+
+    ``None`` values fall back to the ``TEMPORAL_CRON_*`` settings. ``schedule_id``
+    defaults to an ID derived from the task queue and workflow type, so every replica
+    and restart reconciles the same schedule.
+    """
+
+    schedule_id: str | None = None
+    overlap: CronOverlapPolicy | str | None = None
+    jitter: timedelta | None = None
+    catchup_window: timedelta | None = None
+    time_zone: str | None = None
+    pause_on_failure: bool = False
+
+
+class ReconcileResult(str, Enum):
+    created = "created"
+    updated = "updated"
+    unchanged = "unchanged"
+
+
+def cron_schedule_id(task_queue: str, workflow: str | Callable[..., Awaitable[Any]]) -> str:
+    if isinstance(workflow, str):
+        workflow_name = workflow
+    else:
+        workflow_name = temporalio.workflow._Definition.must_from_run_fn(workflow).name  # noqa: SLF001
+    return re.sub(r"[^A-Za-z0-9._-]+", "-", f"cron-{task_queue}-{workflow_name}")
+
+
+def build_cron_schedule(
+    cron: str,
+    workflow: str | Callable[..., Awaitable[Any]],
+    task_queue: str,
+    options: CronScheduleOptions | None = None,
+) -> tuple[str, Schedule]:
+    options = options or CronScheduleOptions()
+    schedule_id = options.schedule_id or cron_schedule_id(task_queue, workflow)
+    overlap = CronOverlapPolicy(options.overlap or config.CRON_OVERLAP_POLICY)
+    jitter = options.jitter if options.jitter is not None else config.CRON_JITTER
+    catchup_window = options.catchup_window if options.catchup_window is not None else config.CRON_CATCHUP_WINDOW
+    time_zone = options.time_zone or config.CRON_TIME_ZONE
+
+    action = ScheduleActionStartWorkflow(workflow, id=schedule_id, task_queue=task_queue)
+    configuration = (cron, action.workflow, task_queue, overlap, jitter, catchup_window, time_zone)
+    configuration += (options.pause_on_failure,)
+    fingerprint = hashlib.sha256(repr(configuration).encode()).hexdigest()[:16]
+
+    schedule = Schedule(
+        action=action,
+        spec=ScheduleSpec(cron_expressions=[cron], jitter=jitter or None, time_zone_name=time_zone),
+        policy=SchedulePolicy(
+            overlap=_OVERLAP_POLICIES[overlap],
+            catchup_window=catchup_window,
+            pause_on_failure=options.pause_on_failure,
+        ),
+        state=ScheduleState(note=f"{_FINGERPRINT_PREFIX}{fingerprint}"),
+    )
+    return schedule_id, schedule
+
+
+async def reconcile_cron_schedule(
+    client: Client,
+    cron: str,
+    workflow: str | Callable[..., Awaitable[Any]],
+    task_queue: str,
+    options: CronScheduleOptions | None = None,
+) -> ReconcileResult:
+    """Create the cron schedule, or bring an existing one in line with ``cron`` and ``options``.
+
+    Safe to call from every replica on every start: the schedule ID is deterministic, and
+    an existing schedule is only updated when its configuration fingerprint differs. A
+    schedule paused by an operator stays paused.
+    """
+    schedule_id, schedule = build_cron_schedule(cron, workflow, task_queue, options)
+    try:
+        await client.create_schedule(schedule_id, schedule)
+    except ScheduleAlreadyRunningError:
+        pass
+    else:
+        logger.info(f"Created cron schedule '{schedule_id}' ({cron})")
+        return ReconcileResult.created
+
+    updated = False
+
+    def updater(update_input: ScheduleUpdateInput) -> ScheduleUpdate | None:
+        nonlocal updated
+        current = update_input.description.schedule
+        if current.state.note == schedule.state.note:
+            return None
+
+        schedule.state.paused = current.state.paused
+        updated = True
+        return ScheduleUpdate(schedule=schedule)
+
+    await client.get_schedule_handle(schedule_id).update(updater)
+    if updated:
+        logger.info(f"Updated cron schedule '{schedule_id}' ({cron})")
+        return ReconcileResult.updated
+    logger.debug(f"Cron schedule '{schedule_id}' is up to date")
+    return ReconcileResult.unchanged
@@ -0,0 +1,230 @@
+import asyncio
+import logging
+import time
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from temporalio.client import Client
+from temporalio.service import RPCError, RPCStatusCode
+
+from temporal_boost.temporal.converter import payload_key
+
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({
+    RPCStatusCode.UNKNOWN,
+    RPCStatusCode.DEADLINE_EXCEEDED,
+    RPCStatusCode.RESOURCE_EXHAUSTED,
+    RPCStatusCode.ABORTED,
+    RPCStatusCode.INTERNAL,
+    RPCStatusCode.UNAVAILABLE,
+})
+
+_SignalKey = tuple[str, str | None, str, Hashable]
+
+
+@dataclass
+class SignalDispatchStats:
+    submitted: int = 0
+    coalesced: int = 0
+    sent: int = 0
+    failed: int = 0
+    retried: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def throughput(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.sent / elapsed if elapsed > 0 else 0.0
+
+
+@dataclass
+class SignalFanOutReport:
+    sent: int
+    coalesced: int
+    elapsed: float
+    failures: dict[str, BaseException] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class _PendingSignal:
+    workflow_id: str
+    run_id: str | None
+    signal: str
+    args: tuple[Any, ...]
+    future: asyncio.Future[None]
+
+
+def _retrieve_exception(future: asyncio.Future[None]) -> None:
+    # Fire-and-forget callers never await the future; avoid "exception was never retrieved"
+    if not future.cancelled():
+        future.exception()
+
+
+class SignalDispatcher:
+    """Client-side signal sender that coalesces identical signals and bounds concurrency.
+
+    Signals with the same workflow ID, run ID, name and arguments submitted within
+    ``coalesce_window`` seconds are sent once, and every submitter awaits the same delivery.
+    Arguments are compared by their payloads from the client's data converter, or by the
+    caller's ``dedupe_key``; signals whose arguments cannot be serialized are never coalesced.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        coalesce_window: float = 0.05,
+        concurrency: int = 100,
+        max_attempts: int = 3,
+        retry_backoff: float = 0.1,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError(f"Signal dispatch concurrency must be positive, got {concurrency}")
+
+        self._client = client
+        self._coalesce_window = coalesce_window
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._max_attempts = max(1, max_attempts)
+        self._retry_backoff = retry_backoff
+
+        self._pending: dict[_SignalKey, _PendingSignal] = {}
+        self._flush_handle: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.stats = SignalDispatchStats()
+
+    def submit(
+        self,
+        workflow_id: str,
+        signal: str,
+        *args: Any,
+        run_id: str | None = None,
+        dedupe_key: Hashable | None = None,
+    ) -> asyncio.Future[None]:
+        if dedupe_key is None:
+            dedupe_key = self._args_key(args)
+        return self._submit(workflow_id, signal, args, run_id, dedupe_key)
+
+    async def signal(
+        self,
+        workflow_id: str,
+        signal: str,
+        *args: Any,
+        run_id: str | None = None,
+        dedupe_key: Hashable | None = None,
+    ) -> None:
+        await self.submit(workflow_id, signal, *args, run_id=run_id, dedupe_key=dedupe_key)
+
+    async def fan_out(
+        self,
+        workflow_ids: Iterable[str],
+        signal: str,
+        *args: Any,
+        dedupe_key: Hashable | None = None,
+    ) -> SignalFanOutReport:
+        started_at = time.monotonic()
+        # Every workflow gets the same arguments, so they are encoded once
+        if dedupe_key is None:
+            dedupe_key = self._args_key(args)
+        submitted = [
+            (workflow_id, self._submit(workflow_id, signal, args, None, dedupe_key)) for workflow_id in workflow_ids
+        ]
+        unique_futures = {id(future): future for _, future in submitted}
+        await asyncio.gather(*unique_futures.values(), return_exceptions=True)
+
+        failures = {
+            workflow_id: exception for workflow_id, future in submitted if (exception := future.exception()) is not None
+        }
+        failed_deliveries = sum(1 for future in unique_futures.values() if future.exception() is not None)
+
+        report = SignalFanOutReport(
+            sent=len(unique_futures) - failed_deliveries,
+            coalesced=len(submitted) - len(unique_futures),
+            elapsed=time.monotonic() - started_at,
+            failures=failures,
+        )
+        logger.info(
+            f"Signal '{signal}' fan-out: {report.sent} sent, {report.coalesced} coalesced, "
+            f"{len(report.failures)} failed in {report.elapsed:.3f}s ({report.throughput:.1f}/s)",
+        )
+        return report
+
+    async def close(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _args_key(self, args: tuple[Any, ...]) -> Hashable | None:
+        return payload_key(self._client.data_converter, args)
+
+    def _submit(
+        self,
+        workflow_id: str,
+        signal: str,
+        args: tuple[Any, ...],
+        run_id: str | None,
+        dedupe_key: Hashable | None,
+    ) -> asyncio.Future[None]:
+        # Without a key the arguments cannot be compared, so the signal gets a key of its own
+        key = (workflow_id, run_id, signal, dedupe_key if dedupe_key is not None else object())
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.stats.coalesced += 1
+            return pending.future
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        future.add_done_callback(_retrieve_exception)
+        self._pending[key] = _PendingSignal(workflow_id, run_id, signal, args, future)
+        self.stats.submitted += 1
+
+        if self._flush_handle is None:
+            if self._coalesce_window > 0:
+                self._flush_handle = loop.call_later(self._coalesce_window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return future
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        for pending_signal in pending.values():
+            task = asyncio.create_task(self._deliver(pending_signal))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _deliver(self, pending: _PendingSignal) -> None:
+        async with self._semaphore:
+            handle = self._client.get_workflow_handle(pending.workflow_id, run_id=pending.run_id)
+            for attempt in range(1, self._max_attempts + 1):
+                try:
+                    await handle.signal(pending.signal, args=pending.args)
+                except RPCError as exc:
+                    if exc.status in RETRYABLE_STATUS_CODES and attempt < self._max_attempts:
+                        self.stats.retried += 1
+                        await asyncio.sleep(self._retry_backoff * 2 ** (attempt - 1))
+                        continue
+                    self._fail(pending, exc)
+                    return
+                except Exception as exc:
+                    self._fail(pending, exc)
+                    return
+
+                self.stats.sent += 1
+                if not pending.future.done():
+                    pending.future.set_result(None)
+                return
+
+    def _fail(self, pending: _PendingSignal, exc: BaseException) -> None:
+        self.stats.failed += 1
+        logger.warning(f"Failed to send signal '{pending.signal}' to workflow '{pending.workflow_id}': {exc}")
+        if not pending.future.done():
+            pending.future.set_exception(exc)
@@ -0,0 +1,117 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from temporalio.client import Client, WithStartWorkflowOperation, WorkflowUpdateStage
+from temporalio.common import WorkflowIDConflictPolicy
+
+from temporal_boost.temporal import config
+
+
+def resolve_update_stage(stage: WorkflowUpdateStage | str | None) -> WorkflowUpdateStage:
+    if stage is None:
+        stage = config.UPDATE_WAIT_STAGE
+    if isinstance(stage, str):
+        try:
+            stage = WorkflowUpdateStage[stage.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown update wait stage '{stage}'. Use 'accepted' or 'completed'") from None
+    if stage == WorkflowUpdateStage.ADMITTED:
+        # The server only answers update-with-start once the update is accepted or completed
+        raise ValueError("Update-with-start cannot wait for the 'admitted' stage. Use 'accepted' or 'completed'")
+    return stage
+
+
+@dataclass
+class UpdateWithStartResult:
+    workflow_id: str
+    run_id: str | None
+    update_id: str
+    stage: WorkflowUpdateStage
+    result: Any = None
+
+    @property
+    def completed(self) -> bool:
+        return self.stage == WorkflowUpdateStage.COMPLETED
+
+
+class UpdateWithStartCaller:
+    """Request/response calls into workflows with a single update-with-start RPC.
+
+    Each call starts the workflow if no run with ``workflow_id`` is open, or reuses the
+    running one, and delivers the update in the same request. Waiting for the ``completed``
+    stage returns the update result without a separate start and poll for ``result()``;
+    ``accepted`` returns as soon as the workflow has validated the update.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        client: Client,
+        task_queue: str,
+        *,
+        wait_for_stage: WorkflowUpdateStage | str | None = None,
+        timeout: float | None = None,
+        rpc_timeout: timedelta | None = None,
+        id_conflict_policy: WorkflowIDConflictPolicy = WorkflowIDConflictPolicy.USE_EXISTING,
+        **start_kwargs: Any,
+    ) -> None:
+        self._client = client
+        self._task_queue = task_queue
+        self._wait_for_stage = resolve_update_stage(wait_for_stage)
+        self._timeout = timeout if timeout is not None else config.UPDATE_TIMEOUT
+        self._rpc_timeout = rpc_timeout
+        self._id_conflict_policy = id_conflict_policy
+        self._start_kwargs = start_kwargs
+
+    async def call(  # noqa: PLR0913
+        self,
+        workflow: str | Callable[..., Awaitable[Any]],
+        update: str | Callable[..., Any],
+        *,
+        workflow_id: str,
+        args: Sequence[Any] = (),
+        update_args: Sequence[Any] = (),
+        update_id: str | None = None,
+        result_type: type | None = None,
+        wait_for_stage: WorkflowUpdateStage | str | None = None,
+        timeout: float | None = None,
+        **start_options: Any,
+    ) -> UpdateWithStartResult:
+        # Raises asyncio.TimeoutError when the stage is not reached within the timeout; the
+        # update may still complete in the workflow afterwards
+        stage = resolve_update_stage(wait_for_stage) if wait_for_stage is not None else self._wait_for_stage
+        timeout = timeout if timeout is not None else self._timeout
+        options = {**self._start_kwargs, **start_options}
+        options.setdefault("task_queue", self._task_queue)
+        options.setdefault("id_conflict_policy", self._id_conflict_policy)
+
+        operation: WithStartWorkflowOperation[Any, Any] = WithStartWorkflowOperation(
+            workflow,
+            args=args,
+            id=workflow_id,
+            **options,
+        )
+
+        async def execute() -> UpdateWithStartResult:
+            handle = await self._client.start_update_with_start_workflow(
+                update,  # type: ignore[arg-type]
+                args=update_args,
+                start_workflow_operation=operation,
+                wait_for_stage=stage,
+                id=update_id,
+                result_type=result_type,
+                rpc_timeout=self._rpc_timeout,
+            )
+            # With the completed stage the outcome arrives with the response, so no extra RPC is made
+            result = await handle.result() if stage == WorkflowUpdateStage.COMPLETED else None
+            return UpdateWithStartResult(
+                workflow_id=handle.workflow_id,
+                run_id=handle.workflow_run_id,
+                update_id=handle.id,
+                stage=stage,
+                result=result,
+            )
+
+        return await asyncio.wait_for(execute(), timeout or None)
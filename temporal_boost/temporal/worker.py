@@ -1,11 +1,46 @@
+import dataclasses
+import inspect
+import logging
+import time
 from collections.abc import Callable
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from temporalio.client import Client
 from temporalio.worker import Worker
 from temporalio.worker._interceptor import Interceptor
+from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner
 
 from temporal_boost.temporal import config
+from temporal_boost.temporal.converter import model_modules, precompile_type_adapters, uses_shared_type_adapters
+from temporal_boost.temporal.definitions import (
+    Definition,
+    is_activity,
+    is_interceptor,
+    is_workflow,
+    resolve_definitions,
+)
+from temporal_boost.temporal.resources import auto_worker_limits
+
+
+if TYPE_CHECKING:
+    from temporal_boost.temporal.health import WorkerHealth
+
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_limit(name: str, value: int | str) -> int | None:
+    # None stands for "auto"; settings from env files may differ in case and spacing
+    if isinstance(value, int):
+        return value
+    normalized = value.strip().lower()
+    if normalized == config.AUTO:
+        return None
+    try:
+        return int(normalized)
+    except ValueError:
+        raise ValueError(f"Expected an integer or '{config.AUTO}' for {name}, got '{value}'") from None
 
 
 class TemporalWorkerBuilder:
@@ -14,12 +49,12 @@ class TemporalWorkerBuilder:
         task_queue: str,
         *,
         debug_mode: bool = False,
-        max_concurrent_workflow_tasks: int | None = None,
-        max_concurrent_activities: int | None = None,
-        max_concurrent_local_activities: int | None = None,
-        max_concurrent_workflow_task_polls: int | None = None,
+        max_concurrent_workflow_tasks: int | str | None = None,
+        max_concurrent_activities: int | str | None = None,
+        max_concurrent_local_activities: int | str | None = None,
+        max_concurrent_workflow_task_polls: int | str | None = None,
         nonsticky_to_sticky_poll_ratio: float | None = None,
-        max_concurrent_activity_task_polls: int | None = None,
+        max_concurrent_activity_task_polls: int | str | None = None,
         **kwargs: Any,
     ) -> None:
         self._client: Client | None = None
@@ -36,9 +71,14 @@ class TemporalWorkerBuilder:
         self._nonsticky_to_sticky_poll_ratio = nonsticky_to_sticky_poll_ratio or config.NONSTICKY_STICKY_RATIO
         self._max_concurrent_activity_task_polls = max_concurrent_activity_task_polls or config.MAX_ACTIVITY_TASK_POLLS
 
-        self._activities: list[Callable[..., Any]] = []
-        self._workflows: list[type] = []
-        self._interceptors: list[Interceptor] = []
+        self._activities: list[Definition[Callable[..., Any]]] = []
+        self._workflows: list[Definition[type]] = []
+        self._interceptors: list[Definition[Interceptor]] = []
+        self._resolved_activities: list[Callable[..., Any]] | None = None
+        self._resolved_workflows: list[type] | None = None
+        self._resolved_interceptors: list[Interceptor] | None = None
+        self._health: WorkerHealth | None = None
+        self._activity_executor: ThreadPoolExecutor | None = None
 
         self._worker_kwargs = kwargs
 
@@ -51,28 +91,127 @@ class TemporalWorkerBuilder:
     def set_client(self, client: Client) -> None:
         self._client = client
 
-    def set_activities(self, activities: list[Callable[..., Any]]) -> None:
+    @property
+    def activities(self) -> list[Callable[..., Any]]:
+        # Import strings are resolved on first access, normally when the worker is built
+        if self._resolved_activities is None:
+            self._resolved_activities = resolve_definitions(self._activities, is_activity, "activities")
+        return self._resolved_activities
+
+    @property
+    def workflows(self) -> list[type]:
+        if self._resolved_workflows is None:
+            self._resolved_workflows = resolve_definitions(self._workflows, is_workflow, "workflows")
+        return self._resolved_workflows
+
+    @property
+    def interceptors(self) -> list[Interceptor]:
+        if self._resolved_interceptors is None:
+            self._resolved_interceptors = resolve_definitions(self._interceptors, is_interceptor, "interceptors")
+        return self._resolved_interceptors
+
+    def set_activities(self, activities: list[Definition[Callable[..., Any]]]) -> None:
         self._activities = activities
+        self._resolved_activities = None
 
-    def set_workflows(self, workflows: list[type]) -> None:
+    def set_workflows(self, workflows: list[Definition[type]]) -> None:
         self._workflows = workflows
+        self._resolved_workflows = None
 
-    def set_interceptors(self, interceptors: list[Interceptor]) -> None:
+    def set_interceptors(self, interceptors: list[Definition[Interceptor]]) -> None:
         self._interceptors = interceptors
+        self._resolved_interceptors = None
+
+    def set_health(self, health: "WorkerHealth | None") -> None:
+        self._health = health
+
+    def _resolve_limits(self) -> dict[str, int]:
+        limit_names = (
+            "max_concurrent_workflow_tasks",
+            "max_concurrent_activities",
+            "max_concurrent_local_activities",
+            "max_concurrent_workflow_task_polls",
+            "max_concurrent_activity_task_polls",
+        )
+        configured = {name: _parse_limit(name, getattr(self, f"_{name}")) for name in limit_names}
+        auto_names = [name for name, value in configured.items() if value is None]
+        if not auto_names:
+            return {name: value for name, value in configured.items() if value is not None}
+
+        limits = auto_worker_limits()
+        resolved: dict[str, int] = {
+            name: value if value is not None else getattr(limits, name) for name, value in configured.items()
+        }
+        derived = [f"{name}={resolved[name]}" for name in auto_names]
+
+        has_sync_activities = any(not inspect.iscoroutinefunction(activity) for activity in self.activities)
+        if has_sync_activities and "activity_executor" not in self._worker_kwargs:
+            self._activity_executor = ThreadPoolExecutor(max_workers=limits.activity_executor_workers)
+            self._worker_kwargs["activity_executor"] = self._activity_executor
+            derived.append(f"activity_executor_workers={limits.activity_executor_workers}")
+
+        logger.info(f"Auto-sized worker limits for task queue '{self.task_queue}': {', '.join(derived)}")
+        return resolved
+
+    def _precompile_type_adapters(self) -> None:
+        if not uses_shared_type_adapters(self.client.data_converter):
+            return
+
+        started_at = time.perf_counter()
+        compiled = precompile_type_adapters(self.workflows, self.activities)
+        if compiled:
+            logger.info(
+                f"Precompiled {compiled} type adapters for task queue '{self.task_queue}' "
+                f"in {(time.perf_counter() - started_at) * 1000:.1f}ms",
+            )
+        self._pass_through_model_modules()
+
+    def _pass_through_model_modules(self) -> None:
+        # Sandboxed runs then use the classes the adapters were precompiled for
+        runner = self._worker_kwargs.get("workflow_runner", SandboxedWorkflowRunner())
+        modules = model_modules(self.workflows, self.activities)
+        if not modules or not isinstance(runner, SandboxedWorkflowRunner):
+            return
+        self._worker_kwargs["workflow_runner"] = dataclasses.replace(
+            runner,
+            restrictions=runner.restrictions.with_passthrough_modules(*modules),
+        )
+        logger.debug(f"Passed model modules through the workflow sandbox: {', '.join(modules)}")
+
+    def _slot_options(self, limits: dict[str, int]) -> dict[str, Any]:
+        slot_limits = {
+            "max_concurrent_workflow_tasks": limits["max_concurrent_workflow_tasks"],
+            "max_concurrent_activities": limits["max_concurrent_activities"],
+            "max_concurrent_local_activities": limits["max_concurrent_local_activities"],
+        }
+        if self._health is None:
+            return slot_limits
+        if "tuner" in self._worker_kwargs:
+            raise RuntimeError("Worker health tracks the worker's slot limits and cannot be combined with a tuner")
+        # The same limits, enforced by slot suppliers that count reserved and used slots
+        nexus_slots = self._worker_kwargs.pop("max_concurrent_nexus_tasks", None)
+        return {"tuner": self._health.tuner(slot_limits, nexus_slots=nexus_slots)}
+
+    def shutdown(self) -> None:
+        # Only the executor created for auto limits is owned here; a user's executor is left alone
+        if self._activity_executor is not None:
+            self._worker_kwargs.pop("activity_executor", None)
+            self._activity_executor.shutdown(wait=False)
+            self._activity_executor = None
 
     def build(self) -> Worker:
+        limits = self._resolve_limits()
+        self._precompile_type_adapters()
         return Worker(
             client=self.client,
             task_queue=self.task_queue,
-            activities=self._activities,
-            workflows=self._workflows,
-            max_concurrent_workflow_tasks=self._max_concurrent_workflow_tasks,
-            max_concurrent_activities=self._max_concurrent_activities,
-            max_concurrent_local_activities=self._max_concurrent_local_activities,
-            max_concurrent_workflow_task_polls=self._max_concurrent_workflow_task_polls,
+            activities=self.activities,
+            workflows=self.workflows,
+            **self._slot_options(limits),
+            max_concurrent_workflow_task_polls=limits["max_concurrent_workflow_task_polls"],
             nonsticky_to_sticky_poll_ratio=self._nonsticky_to_sticky_poll_ratio,
-            max_concurrent_activity_task_polls=self._max_concurrent_activity_task_polls,
+            max_concurrent_activity_task_polls=limits["max_concurrent_activity_task_polls"],
             debug_mode=self._debug_mode,
-            interceptors=self._interceptors,
+            interceptors=self.interceptors,
             **self._worker_kwargs,
         )
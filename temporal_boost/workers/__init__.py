@@ -1,10 +1,15 @@
-from temporal_boost.workers.asgi_registry import ASGIWorkerType, get_asgi_worker_class
-from temporal_boost.workers.base import BaseAsgiWorker, BaseBoostWorker
-from temporal_boost.workers.faststream_worker import FastStreamBoostWorker
-from temporal_boost.workers.granian_worker import GranianBoostWorker
-from temporal_boost.workers.hypercorn_worker import HypercornBoostWorker
-from temporal_boost.workers.temporal import TemporalBoostWorker
-from temporal_boost.workers.uvicorn_worker import UvicornBoostWorker
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from temporal_boost.workers.asgi_registry import ASGIWorkerType, get_asgi_worker_class
+    from temporal_boost.workers.base import BaseAsgiWorker, BaseBoostWorker
+    from temporal_boost.workers.faststream_worker import FastStreamBoostWorker
+    from temporal_boost.workers.granian_worker import GranianBoostWorker
+    from temporal_boost.workers.hypercorn_worker import HypercornBoostWorker
+    from temporal_boost.workers.temporal import TemporalBoostWorker
+    from temporal_boost.workers.uvicorn_worker import UvicornBoostWorker
 
 
 __all__ = (
@@ -18,3 +23,30 @@ __all__ = (
     "UvicornBoostWorker",
     "get_asgi_worker_class",
 )
+
+# Worker adapters are loaded on first access, so an ASGI process does not import the Temporal
+# worker and a Temporal worker does not import the ASGI adapters
+_LAZY_IMPORTS = {
+    "ASGIWorkerType": "temporal_boost.workers.asgi_registry",
+    "BaseAsgiWorker": "temporal_boost.workers.base",
+    "BaseBoostWorker": "temporal_boost.workers.base",
+    "FastStreamBoostWorker": "temporal_boost.workers.faststream_worker",
+    "GranianBoostWorker": "temporal_boost.workers.granian_worker",
+    "HypercornBoostWorker": "temporal_boost.workers.hypercorn_worker",
+    "TemporalBoostWorker": "temporal_boost.workers.temporal",
+    "UvicornBoostWorker": "temporal_boost.workers.uvicorn_worker",
+    "get_asgi_worker_class": "temporal_boost.workers.asgi_registry",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,7 +1,12 @@
+import importlib
+import importlib.util
 from collections.abc import Callable
 from enum import Enum
+from typing import TYPE_CHECKING
 
-from temporal_boost.workers.base import BaseAsgiWorker
+
+if TYPE_CHECKING:
+    from temporal_boost.workers.base import BaseAsgiWorker
 
 
 class ASGIWorkerRegistry:
@@ -12,22 +17,19 @@ class ASGIWorkerRegistry:
         self,
         key: str,
         packages: list[str] | None = None,
-    ) -> Callable[[type[BaseAsgiWorker]], type[BaseAsgiWorker]]:
+    ) -> Callable[[type["BaseAsgiWorker"]], type["BaseAsgiWorker"]]:
         if packages is None:
             packages = []
 
-        def decorator(cls: type[BaseAsgiWorker]) -> type[BaseAsgiWorker]:
-            try:
-                for package in packages:
-                    __import__(package)
-            except ImportError:
-                return cls
-            self._data[key] = cls
+        def decorator(cls: type["BaseAsgiWorker"]) -> type["BaseAsgiWorker"]:
+            # Servers are imported by the worker's run(), so only check they are installed
+            if all(_is_installed(package) for package in packages):
+                self._data[key] = cls
             return cls
 
         return decorator
 
-    def get(self, key: str) -> type[BaseAsgiWorker]:
+    def get(self, key: str) -> type["BaseAsgiWorker"]:
         try:
             return self._data[key]
         except KeyError:
@@ -37,6 +39,13 @@ class ASGIWorkerRegistry:
         return list(self._data.keys())
 
 
+def _is_installed(package: str) -> bool:
+    try:
+        return importlib.util.find_spec(package) is not None
+    except (ImportError, ValueError):
+        return False
+
+
 asgi_worker_registry = ASGIWorkerRegistry()
 
 
@@ -47,7 +56,17 @@ class ASGIWorkerType(str, Enum):
     auto = "auto"
 
 
-def get_asgi_worker_class(worker_type: ASGIWorkerType) -> type[BaseAsgiWorker]:
+# Adapters register themselves on import; they are cheap since servers are imported on run()
+_WORKER_MODULES = (
+    "temporal_boost.workers.uvicorn_worker",
+    "temporal_boost.workers.hypercorn_worker",
+    "temporal_boost.workers.granian_worker",
+)
+
+
+def get_asgi_worker_class(worker_type: ASGIWorkerType) -> type["BaseAsgiWorker"]:
+    for module in _WORKER_MODULES:
+        importlib.import_module(module)
     if worker_type == ASGIWorkerType.auto:
         if ASGIWorkerType.uvicorn.value in asgi_worker_registry.available_keys():
             return asgi_worker_registry.get(ASGIWorkerType.uvicorn.value)
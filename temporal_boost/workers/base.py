@@ -1,5 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from temporal_boost.asgi.admission import AdmissionControl, AdmissionOptions
+    from temporal_boost.asgi.lifespan import TemporalClientLifespan
+    from temporal_boost.temporal.client import TemporalClientBuilder
+    from temporal_boost.temporal.query_cache import QueryCacheOptions
 
 
 class BaseBoostWorker(ABC):
@@ -15,7 +22,7 @@ class BaseBoostWorker(ABC):
 
 
 class BaseAsgiWorker(BaseBoostWorker):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         app: Any,
         host: str,
@@ -23,9 +30,36 @@ class BaseAsgiWorker(BaseBoostWorker):
         *,
         log_level: str | int | None = None,
         log_config: dict[str, Any] | None = None,
+        client_builder: "TemporalClientBuilder | None" = None,
+        client_pool_size: int = 1,
+        client_query_cache: "QueryCacheOptions | None" = None,
+        admission_control: "AdmissionOptions | None" = None,
         **kwargs: Any,
     ) -> None:
         self.name: str = ""  # Will be set by BoostApp
+        self._client_lifespan: TemporalClientLifespan | None = None
+        if client_builder is not None:
+            # Imported only when used, so a plain ASGI worker process does not load the Temporal SDK
+            from temporal_boost.asgi import lifespan  # noqa: PLC0415
+
+            self._client_lifespan = lifespan.TemporalClientLifespan(
+                app,
+                client_builder,
+                pool_size=client_pool_size,
+                query_cache=client_query_cache,
+            )
+            app = self._client_lifespan
+        self._admission_control: AdmissionControl | None = None
+        if admission_control is not None:
+            from temporal_boost.asgi import admission  # noqa: PLC0415
+
+            # With a Temporal client the middleware watches its RPCs, otherwise the requests it admits
+            tracker = None
+            if client_builder is not None:
+                tracker = admission.RpcLoadTracker(window=admission_control.window)
+                client_builder.add_interceptor(admission.AdmissionInterceptor(tracker))
+            self._admission_control = admission.AdmissionControl(app, admission_control, tracker=tracker)
+            app = self._admission_control
         self._app = app
         self._host = host
         self._port = port
@@ -33,6 +67,14 @@ class BaseAsgiWorker(BaseBoostWorker):
         self._log_config = log_config
         self._asgi_worker_kwargs = kwargs
 
+    @property
+    def client_lifespan(self) -> "TemporalClientLifespan | None":
+        return self._client_lifespan
+
+    @property
+    def admission_control(self) -> "AdmissionControl | None":
+        return self._admission_control
+
     @abstractmethod
     def run(self) -> None:
         """Run the ASGI server. Must be implemented by subclasses."""
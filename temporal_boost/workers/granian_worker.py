@@ -22,6 +22,16 @@ class GranianBoostWorker(BaseAsgiWorker):
         **asgi_worker_kwargs: Any,
     ) -> None:
         self.name = "granian"
+        # Granian imports its target by path in every worker process, so it cannot serve
+        # the app instance wrapped with the Temporal client lifespan or admission control
+        wrapped = [
+            option for option in ("client_builder", "admission_control") if asgi_worker_kwargs.get(option) is not None
+        ]
+        if wrapped:
+            raise RuntimeError(
+                f"Granian worker does not support {', '.join(wrapped)}: granian loads the ASGI app "
+                "from its import string. Use uvicorn or hypercorn instead.",
+            )
         super().__init__(
             app,
             host,
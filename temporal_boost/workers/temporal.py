@@ -1,10 +1,10 @@
 import asyncio
 import logging
-import uuid
 from collections.abc import Callable, Mapping
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from temporalio.client import Client
+from temporalio.converter import DataConverter
 from temporalio.runtime import LoggingConfig, MetricBuffer, OpenTelemetryConfig, PrometheusConfig, Runtime
 from temporalio.types import MethodAsyncNoParam
 from temporalio.worker import Worker
@@ -12,11 +12,25 @@ from temporalio.worker._interceptor import Interceptor
 
 from temporal_boost.temporal import config
 from temporal_boost.temporal.client import TemporalClientBuilder
+from temporal_boost.temporal.colocation import local_worker_registry
+from temporal_boost.temporal.converter import DataConverterType
+from temporal_boost.temporal.definitions import Definition
 from temporal_boost.temporal.runtime import TemporalRuntimeBuilder
 from temporal_boost.temporal.worker import TemporalWorkerBuilder
 from temporal_boost.workers.base import BaseBoostWorker
 
 
+# Feature modules are imported by the methods using them, so a worker process only loads
+# what its worker is configured for
+if TYPE_CHECKING:
+    from temporal_boost.asgi.health import HealthServer
+    from temporal_boost.temporal.bulk import BulkWorkflowStarter
+    from temporal_boost.temporal.health import WorkerHealth
+    from temporal_boost.temporal.schedule import CronScheduleOptions
+    from temporal_boost.temporal.signals import SignalDispatcher
+    from temporal_boost.temporal.update import UpdateWithStartCaller
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,12 +40,16 @@ class TemporalBoostWorker(BaseBoostWorker):
         worker_name: str,
         task_queue: str,
         *,
-        activities: list[Callable[..., Any]] | None = None,
-        workflows: list[type] | None = None,
-        interceptors: list[Interceptor] | None = None,
+        activities: list[Definition[Callable[..., Any]]] | None = None,
+        workflows: list[Definition[type]] | None = None,
+        interceptors: list[Definition[Interceptor]] | None = None,
         cron_schedule: str | None = None,
         cron_runner: MethodAsyncNoParam[Any, Any] | None = None,
+        cron_options: "CronScheduleOptions | None" = None,
         debug_mode: bool = False,
+        colocated: bool = False,
+        health_port: int | None = None,
+        health_host: str | None = None,
         **worker_kwargs: Any,
     ) -> None:
         self.name = worker_name
@@ -42,6 +60,10 @@ class TemporalBoostWorker(BaseBoostWorker):
         if not workflows and not activities:
             raise RuntimeError("BoostWorker must have at least one workflow or activity defined")
 
+        if colocated and worker_kwargs.get("disable_eager_activity_execution"):
+            raise RuntimeError("Co-located workers require eager activity execution to be enabled")
+        self._colocated = colocated
+
         self._worker_builder = TemporalWorkerBuilder(
             task_queue=task_queue,
             debug_mode=debug_mode,
@@ -54,6 +76,7 @@ class TemporalBoostWorker(BaseBoostWorker):
 
         self._cron_schedule = cron_schedule or ""
         self._cron_runner = cron_runner
+        self._cron_options = cron_options
 
         self._client_builder: TemporalClientBuilder | None = None
         self._client: Client | None = None
@@ -61,7 +84,22 @@ class TemporalBoostWorker(BaseBoostWorker):
         self._runtime_builder: TemporalRuntimeBuilder | None = None
         self._runtime: Runtime | None = None
 
-        self._cron_future: asyncio.Future[Any] | None = None
+        self._health: WorkerHealth | None = None
+        self._health_server: HealthServer | None = None
+        if health_port is not None:
+            self.enable_health(port=health_port, host=health_host)
+
+    @property
+    def task_queue(self) -> str:
+        return self._worker_builder.task_queue
+
+    @property
+    def workflows(self) -> list[type]:
+        return list(self._worker_builder.workflows)
+
+    @property
+    def health(self) -> "WorkerHealth | None":
+        return self._health
 
     @property
     def temporal_client(self) -> Client:
@@ -93,7 +131,82 @@ class TemporalBoostWorker(BaseBoostWorker):
 
         return self._runtime
 
-    def configure_temporal_client(  # noqa: PLR0913
+    def bulk_starter(
+        self,
+        *,
+        concurrency: int = 100,
+        checkpoint_path: str | None = None,
+        **start_kwargs: Any,
+    ) -> "BulkWorkflowStarter":
+        from temporal_boost.temporal.bulk import BulkWorkflowStarter  # noqa: PLC0415
+
+        return BulkWorkflowStarter(
+            self.temporal_client,
+            self._worker_builder.task_queue,
+            concurrency=concurrency,
+            checkpoint_path=checkpoint_path,
+            **start_kwargs,
+        )
+
+    def signal_dispatcher(
+        self,
+        *,
+        coalesce_window: float = 0.05,
+        concurrency: int = 100,
+        max_attempts: int = 3,
+    ) -> "SignalDispatcher":
+        from temporal_boost.temporal.signals import SignalDispatcher  # noqa: PLC0415
+
+        return SignalDispatcher(
+            self.temporal_client,
+            coalesce_window=coalesce_window,
+            concurrency=concurrency,
+            max_attempts=max_attempts,
+        )
+
+    def update_with_start_caller(
+        self,
+        *,
+        wait_for_stage: str | None = None,
+        timeout: float | None = None,
+        **start_kwargs: Any,
+    ) -> "UpdateWithStartCaller":
+        from temporal_boost.temporal.update import UpdateWithStartCaller  # noqa: PLC0415
+
+        return UpdateWithStartCaller(
+            self.temporal_client,
+            self._worker_builder.task_queue,
+            wait_for_stage=wait_for_stage,
+            timeout=timeout,
+            **start_kwargs,
+        )
+
+    def enable_health(
+        self,
+        *,
+        port: int | None = None,
+        host: str | None = None,
+        check_interval: float | None = None,
+        max_loop_lag: float | None = None,
+    ) -> "WorkerHealth":
+        # Without a port the health is only reported through an ASGI app, see BoostApp.create_health_app()
+        if self._health is None:
+            from temporal_boost.temporal.health import WorkerHealth  # noqa: PLC0415
+
+            self._health = WorkerHealth(
+                self.name,
+                self._worker_builder.task_queue,
+                check_interval=check_interval,
+                max_loop_lag=max_loop_lag,
+            )
+            self._worker_builder.set_health(self._health)
+        if port is not None:
+            from temporal_boost.asgi.health import HealthServer, WorkerHealthApp  # noqa: PLC0415
+
+            self._health_server = HealthServer(WorkerHealthApp([self._health]), host, port)
+        return self._health
+
+    def configure_temporal_client(  # noqa: C901, PLR0913
         self,
         *,
         target_host: str | None = None,
@@ -102,6 +215,9 @@ class TemporalBoostWorker(BaseBoostWorker):
         identity: str | None = None,
         tls: bool | None = None,
         use_pydantic_data_converter: bool | None = None,
+        data_converter: DataConverter | DataConverterType | str | None = None,
+        connect_attempts: int | None = None,
+        connect_backoff: float | None = None,
         **kwargs: Any,
     ) -> None:
         if not self._client_builder:
@@ -112,6 +228,9 @@ class TemporalBoostWorker(BaseBoostWorker):
                 identity=identity,
                 tls=tls,
                 use_pydantic_data_converter=use_pydantic_data_converter,
+                data_converter=data_converter,
+                connect_attempts=connect_attempts,
+                connect_backoff=connect_backoff,
                 **kwargs,
             )
 
@@ -133,6 +252,12 @@ class TemporalBoostWorker(BaseBoostWorker):
         if use_pydantic_data_converter is not None:
             self._client_builder.set_pydantic_data_converter()
 
+        if data_converter is not None:
+            self._client_builder.set_data_converter(data_converter)
+
+        if connect_attempts is not None:
+            self._client_builder.set_connect_retries(connect_attempts, connect_backoff)
+
         if kwargs:
             self._client_builder.set_kwargs(**kwargs)
 
@@ -167,14 +292,36 @@ class TemporalBoostWorker(BaseBoostWorker):
             self._client_builder = cast("TemporalClientBuilder", self._client_builder)
 
         self._client_builder.set_runtime(self.temporal_client_runtime)
-        self._client = await self._client_builder.build()
+        # The SDK refuses lazy clients for workers, so the worker connection is always eager
+        self._client = await self._client_builder.build(lazy=False)
 
         self._worker_builder.set_client(self._client)
         self._worker = self._worker_builder.build()
 
+        if self._colocated:
+            local_worker_registry.register(self._worker_builder.task_queue, self._client)
+
+    @property
+    def has_cron_schedule(self) -> bool:
+        return bool(self._cron_schedule and self._cron_runner)
+
+    async def reconcile_cron_schedule(self) -> None:
+        from temporal_boost.temporal.schedule import reconcile_cron_schedule  # noqa: PLC0415
+
+        await reconcile_cron_schedule(
+            self.temporal_client,
+            self._cron_schedule,
+            self.temporal_cron_runner,
+            self._worker_builder.task_queue,
+            self._cron_options,
+        )
+
     async def _run_worker(self) -> None:
         await self._build_worker()
+        if self.has_cron_schedule:
+            await self.reconcile_cron_schedule()
         try:
+            await self._start_health()
             self._log_worker_start()
             await self.temporal_worker.run()
         except asyncio.CancelledError:
@@ -185,24 +332,6 @@ class TemporalBoostWorker(BaseBoostWorker):
         finally:
             await self.shutdown()
 
-    async def _run_with_cron(self) -> None:
-        await self._build_worker()
-        async with self.temporal_worker:
-            workflow_id = str(uuid.uuid4())
-            await self.temporal_client.start_workflow(
-                self.temporal_cron_runner,
-                id=workflow_id,
-                task_queue=self._worker_builder.task_queue,
-                cron_schedule=self._cron_schedule,
-            )
-
-            self._cron_future = asyncio.Future()
-            try:
-                await self._cron_future
-            except asyncio.CancelledError:
-                logger.info(f"Cron worker {self.name} cancelled during shutdown")
-                raise
-
     def run(self) -> None:
         try:
             asyncio.run(self._run_worker())
@@ -210,24 +339,43 @@ class TemporalBoostWorker(BaseBoostWorker):
             logger.exception(f"Worker {self.name} failed")
             raise
 
+    async def _start_health(self) -> None:
+        if self._health is not None:
+            self._health.start(self.temporal_worker)
+        if self._health_server is not None:
+            await self._health_server.start()
+            logger.info(f"Health of worker {self.name} served on port {self._health_server.port}")
+
+    async def _stop_health(self) -> None:
+        if self._health_server is not None:
+            await self._health_server.stop()
+        if self._health is not None:
+            await self._health.stop()
+
     async def shutdown(self) -> None:
+        if self._colocated and self._client:
+            local_worker_registry.unregister(self._worker_builder.task_queue, self._client)
         await self.temporal_worker.shutdown()
+        self._worker_builder.shutdown()
+        await self._stop_health()
         logger.info(f"Worker {self.name} shutdown completed")
 
     def cron(self) -> None:
+        # Kept for the `cron <name>` command: the schedule is reconciled by run() as well,
+        # so cron workers also start under `run <name>` and `run all`
         logger.info(
             f"Cron worker {self.name} started on {self._worker_builder.task_queue} queue "
             f"with schedule {self._cron_schedule}",
         )
         try:
-            asyncio.run(self._run_with_cron())
+            asyncio.run(self._run_worker())
         except Exception:
             logger.exception(f"Cron worker {self.name} failed")
             raise
 
     def _log_worker_start(self) -> None:
-        activity_names = [f"{act.__name__}" for act in self._worker_builder._activities]  # noqa: SLF001
-        workflow_names = [f"{wf.__name__}" for wf in self._worker_builder._workflows]  # noqa: SLF001
+        activity_names = [f"{act.__name__}" for act in self._worker_builder.activities]
+        workflow_names = [f"{wf.__name__}" for wf in self._worker_builder.workflows]
 
         logger.info(
             f"Worker '{self.name}' started on task queue '{self._worker_builder.task_queue}' with "
@@ -0,0 +1,206 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from temporalio.client import WorkflowUpdateStage
+
+from temporal_boost.asgi.admission import (
+    AdmissionControl,
+    AdmissionInterceptor,
+    AdmissionOptions,
+    RpcLoadTracker,
+)
+from temporal_boost.asgi.lifespan import TemporalClientLifespan
+from temporal_boost.temporal.client import TemporalClientBuilder
+from temporal_boost.workers.base import BaseAsgiWorker
+
+
+class App:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        await self.release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def call(app, path="/orders"):
+    sent = []
+
+    async def send(message) -> None:
+        sent.append(message)
+
+    await app({"type": "http", "method": "POST", "path": path}, AsyncMock(), send)
+    return sent[0]
+
+
+class TestRpcLoadTracker:
+    def test_latency_average_expires(self) -> None:
+        tracker = RpcLoadTracker(window=10, smoothing=0.5)
+
+        with patch("temporal_boost.asgi.admission.time") as mock_time:
+            mock_time.monotonic.side_effect = [0.0, 2.0, 2.0, 2.0, 3.0, 3.0, 20.0]
+            with tracker.track():
+                assert tracker.in_flight == 1
+            assert tracker.latency == 2.0
+            tracker.observe(1.0)
+            assert tracker.latency == 1.5
+            assert tracker.latency == 0.0
+
+    def test_stalled_call_counts_with_its_age(self) -> None:
+        tracker = RpcLoadTracker()
+
+        with patch("temporal_boost.asgi.admission.time") as mock_time:
+            mock_time.monotonic.side_effect = [0.0, 5.0, 5.0, 5.0]
+            with tracker.track():
+                assert tracker.latency == 5.0
+
+    def test_single_stalled_call_ignored_among_fast_ones(self) -> None:
+        tracker = RpcLoadTracker()
+
+        with patch("temporal_boost.asgi.admission.time") as mock_time:
+            mock_time.monotonic.side_effect = [0.0, 4.9, 5.0, 5.0, 5.0, 5.0, 5.0]
+            with tracker.track(), tracker.track():
+                assert tracker.in_flight == 2
+                assert tracker.latency == pytest.approx(0.1)
+
+
+class TestAdmissionInterceptor:
+    @pytest.mark.asyncio
+    async def test_times_rpcs(self) -> None:
+        tracker = RpcLoadTracker()
+        release = asyncio.Event()
+
+        async def query_workflow(input) -> str:
+            assert tracker.in_flight == 1
+            await release.wait()
+            return "done"
+
+        next_interceptor = MagicMock()
+        next_interceptor.query_workflow = query_workflow
+        outbound = AdmissionInterceptor(tracker).intercept_client(next_interceptor)
+
+        query = asyncio.create_task(outbound.query_workflow(MagicMock()))
+        await asyncio.sleep(0)
+        assert tracker.in_flight == 1
+        release.set()
+
+        assert await query == "done"
+        assert tracker.in_flight == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("stage", "timed"), [(WorkflowUpdateStage.COMPLETED, False), (WorkflowUpdateStage.ACCEPTED, True)]
+    )
+    async def test_completed_updates_not_timed(self, stage, timed) -> None:
+        tracker = RpcLoadTracker()
+        in_flight = []
+
+        async def start_update(input) -> str:
+            in_flight.append(tracker.in_flight)
+            return "handle"
+
+        next_interceptor = MagicMock()
+        next_interceptor.start_workflow_update = start_update
+        next_interceptor.start_update_with_start_workflow = start_update
+        outbound = AdmissionInterceptor(tracker).intercept_client(next_interceptor)
+
+        await outbound.start_workflow_update(MagicMock(wait_for_stage=stage))
+        await outbound.start_update_with_start_workflow(
+            MagicMock(update_workflow_input=MagicMock(wait_for_stage=stage))
+        )
+
+        assert in_flight == [int(timed), int(timed)]
+
+    @pytest.mark.asyncio
+    async def test_stuck_query_does_not_shed_starts(self) -> None:
+        tracker = RpcLoadTracker()
+        stuck = asyncio.Event()
+
+        async def query_workflow(input) -> str:
+            await stuck.wait()
+            return "done"
+
+        next_interceptor = MagicMock()
+        next_interceptor.query_workflow = query_workflow
+        next_interceptor.start_workflow = AsyncMock(return_value="handle")
+        outbound = AdmissionInterceptor(tracker).intercept_client(next_interceptor)
+        control = AdmissionControl(App(), AdmissionOptions(max_in_flight=0, max_latency=0.01), tracker=tracker)
+
+        query = asyncio.create_task(outbound.query_workflow(MagicMock()))
+        await asyncio.sleep(0.05)
+        for _ in range(3):
+            await outbound.start_workflow(MagicMock())
+
+        assert tracker.in_flight == 1
+        assert (await call(control))["status"] == 200
+        stuck.set()
+        await query
+
+
+class TestAdmissionControl:
+    @pytest.mark.asyncio
+    async def test_rejects_at_in_flight_limit(self) -> None:
+        app = App()
+        app.release.clear()
+        control = AdmissionControl(app, AdmissionOptions(max_in_flight=2, max_latency=0, retry_after=2.5))
+
+        admitted = [asyncio.create_task(call(control)) for _ in range(2)]
+        await asyncio.sleep(0)
+        response = await call(control)
+        app.release.set()
+
+        assert response["status"] == 429
+        assert (b"retry-after", b"3") in response["headers"]
+        assert [message["status"] for message in await asyncio.gather(*admitted)] == [200, 200]
+        assert app.calls == 2
+        assert (control.stats.admitted, control.stats.rejected_in_flight) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_rejects_on_rpc_latency(self) -> None:
+        tracker = RpcLoadTracker()
+        tracker.observe(3.0)
+        app = App()
+        control = AdmissionControl(app, AdmissionOptions(max_in_flight=0, max_latency=2), tracker=tracker)
+
+        assert (await call(control))["status"] == 429
+        assert control.stats.rejected_latency == 1
+        assert app.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_unguarded_paths_and_lifespan_pass_through(self) -> None:
+        tracker = RpcLoadTracker()
+        tracker.observe(3.0)
+        app = App()
+        control = AdmissionControl(app, AdmissionOptions(max_latency=2, paths=("/orders",)), tracker=tracker)
+
+        assert (await call(control, "/health"))["status"] == 200
+        assert (await call(control, "/orders/1"))["status"] == 429
+        await control({"type": "lifespan"}, AsyncMock(), AsyncMock())
+        assert app.calls == 2
+
+
+class TestAsgiWorkerAdmission:
+    class Worker(BaseAsgiWorker):
+        def run(self) -> None:
+            pass
+
+    def test_interceptor_added_to_client(self) -> None:
+        builder = TemporalClientBuilder(target_host="localhost:7233")
+        worker = self.Worker(
+            App(),
+            "127.0.0.1",
+            8000,
+            client_builder=builder,
+            admission_control=AdmissionOptions(max_in_flight=10),
+        )
+
+        assert worker._app is worker.admission_control
+        assert isinstance(worker.admission_control.app, TemporalClientLifespan)
+        (interceptor,) = builder._client_kwargs["interceptors"]
+        assert isinstance(interceptor, AdmissionInterceptor)
+        assert interceptor._tracker is worker.admission_control.tracker
@@ -0,0 +1,367 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from temporalio import workflow
+from temporalio.converter import DataConverter
+from temporalio.exceptions import WorkflowAlreadyStartedError
+from temporalio.service import RPCError, RPCStatusCode
+
+from temporal_boost.asgi.gateway import GatewayWorkflow, WorkflowGateway
+from temporal_boost.boost_app import BoostApp
+from temporal_boost.temporal.query_cache import QueryCache, QueryCacheOptions
+from temporal_boost.temporal.result_waiter import ResultWaiter
+
+
+@dataclass
+class Order:
+    order_id: str
+    amount: int
+
+
+@workflow.defn(name="OrderWorkflow")
+class OrderWorkflow:
+    @workflow.run
+    async def run(self, order: Order) -> str:
+        return order.order_id
+
+    @workflow.signal
+    async def cancel(self, reason: str) -> None:
+        pass
+
+    @workflow.query
+    def status(self) -> dict:
+        return {}
+
+    @workflow.update
+    async def add_item(self, sku: str, quantity: int) -> int:
+        return quantity
+
+
+async def call(app, method, path, body=None, *, client=None, query_string=b"", state=None):
+    chunks = [json.dumps(body).encode()] if body is not None else [b""]
+    messages = [{"type": "http.request", "body": chunk, "more_body": False} for chunk in chunks]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query_string,
+        "state": {"temporal_client": client or MagicMock(), **(state or {})},
+    }
+    await app(scope, receive, send)
+    status = sent[0]["status"]
+    payload = b"".join(message.get("body", b"") for message in sent[1:])
+    return status, payload
+
+
+def make_gateway(**kwargs):
+    return WorkflowGateway([GatewayWorkflow.from_class(OrderWorkflow, "orders")], **kwargs)
+
+
+class TestGatewayWorkflow:
+    def test_from_class(self):
+        definition = GatewayWorkflow.from_class(OrderWorkflow, "orders")
+        assert definition.name == "OrderWorkflow"
+        assert definition.task_queue == "orders"
+        assert definition.arg_types == [Order]
+        assert definition.ret_type is str
+        assert definition.signals == {"cancel": [str]}
+        assert definition.queries == {"status": ([], dict)}
+        assert definition.updates == {"add_item": ([str, int], int)}
+
+
+class TestWorkflowGateway:
+    @pytest.mark.asyncio
+    async def test_list_workflows(self):
+        status, body = await call(make_gateway(), "GET", "/")
+        assert status == 200
+        assert json.loads(body) == {
+            "workflows": {
+                "OrderWorkflow": {
+                    "task_queue": "orders",
+                    "signals": ["cancel"],
+                    "queries": ["status"],
+                    "updates": ["add_item"],
+                },
+            },
+        }
+
+    @pytest.mark.asyncio
+    async def test_start_validates_and_converts_args(self):
+        client = MagicMock()
+        client.start_workflow = AsyncMock(return_value=MagicMock(id="order-1", result_run_id="run-1"))
+
+        status, body = await call(
+            make_gateway(),
+            "POST",
+            "/OrderWorkflow/start",
+            {"id": "order-1", "args": [{"order_id": "o1", "amount": "5"}]},
+            client=client,
+        )
+
+        assert status == 201
+        assert json.loads(body) == {"workflow_id": "order-1", "run_id": "run-1"}
+        client.start_workflow.assert_awaited_once_with(
+            "OrderWorkflow",
+            args=[Order(order_id="o1", amount=5)],
+            id="order-1",
+            task_queue="orders",
+        )
+
+    @pytest.mark.asyncio
+    async def test_start_invalid_args(self):
+        client = MagicMock()
+        client.start_workflow = AsyncMock()
+
+        status, body = await call(
+            make_gateway(),
+            "POST",
+            "/OrderWorkflow/start",
+            {"args": [{"order_id": "o1", "amount": "many"}]},
+            client=client,
+        )
+
+        assert status == 422
+        assert json.loads(body)["error"][0]["loc"] == ["args", 0, "amount"]
+        client.start_workflow.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_start_wrong_arg_count(self):
+        status, body = await call(make_gateway(), "POST", "/OrderWorkflow/start", {"args": []})
+        assert status == 422
+        assert "Expected 1 argument" in json.loads(body)["error"]
+
+    @pytest.mark.asyncio
+    async def test_start_already_started(self):
+        client = MagicMock()
+        client.start_workflow = AsyncMock(side_effect=WorkflowAlreadyStartedError("order-1", "OrderWorkflow"))
+
+        status, _ = await call(
+            make_gateway(),
+            "POST",
+            "/OrderWorkflow/start",
+            {"id": "order-1", "args": [{"order_id": "o1", "amount": 1}]},
+            client=client,
+        )
+        assert status == 409
+
+    @pytest.mark.asyncio
+    async def test_start_batch_streams_results(self):
+        client = MagicMock()
+
+        async def start_workflow(workflow_name, *, args, id, task_queue):
+            if id == "dup":
+                raise WorkflowAlreadyStartedError(id, workflow_name)
+            return MagicMock(id=id)
+
+        client.start_workflow = start_workflow
+        items = [
+            {"id": "a", "args": [{"order_id": "a", "amount": 1}]},
+            {"id": "dup", "args": [{"order_id": "b", "amount": 2}]},
+        ]
+
+        status, body = await call(make_gateway(), "POST", "/OrderWorkflow/start-batch", {"items": items}, client=client)
+
+        assert status == 200
+        lines = sorted((json.loads(line) for line in body.splitlines()), key=lambda line: line["index"])
+        assert lines == [
+            {"index": 0, "workflow_id": "a", "status": "started"},
+            {"index": 1, "workflow_id": "dup", "status": "already_started"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_start_batch_rejects_invalid_items(self):
+        client = MagicMock()
+        client.start_workflow = AsyncMock()
+        items = [{"args": [{"order_id": "a", "amount": 1}]}, {"args": ["nope"]}]
+
+        status, body = await call(make_gateway(), "POST", "/OrderWorkflow/start-batch", {"items": items}, client=client)
+
+        assert status == 422
+        assert [error["index"] for error in json.loads(body)["error"]] == [1]
+        client.start_workflow.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_result(self):
+        handle = MagicMock()
+        handle.result = AsyncMock(return_value="o1")
+        client = MagicMock()
+        client.get_workflow_handle.return_value = handle
+
+        status, body = await call(make_gateway(), "GET", "/OrderWorkflow/order-1/result", client=client)
+
+        assert status == 200
+        assert json.loads(body) == {"workflow_id": "order-1", "result": "o1"}
+        client.get_workflow_handle.assert_called_once_with("order-1", run_id=None, result_type=str)
+
+    @pytest.mark.asyncio
+    async def test_result_shares_long_poll(self):
+        handle = MagicMock()
+        handle.result = AsyncMock(return_value="o1")
+        client = MagicMock()
+        client.get_workflow_handle.return_value = handle
+        state = {"temporal_result_waiter": ResultWaiter(client)}
+
+        responses = await asyncio.gather(
+            *(
+                call(make_gateway(), "GET", "/OrderWorkflow/order-1/result", client=client, state=state)
+                for _ in range(5)
+            ),
+        )
+
+        assert [status for status, _ in responses] == [200] * 5
+        handle.result.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_result_not_found(self):
+        handle = MagicMock()
+        handle.result = AsyncMock(side_effect=RPCError("workflow not found", RPCStatusCode.NOT_FOUND, b""))
+        client = MagicMock()
+        client.get_workflow_handle.return_value = handle
+
+        status, _ = await call(make_gateway(), "GET", "/OrderWorkflow/missing/result", client=client)
+        assert status == 404
+
+    @pytest.mark.asyncio
+    async def test_signal(self):
+        handle = MagicMock()
+        handle.signal = AsyncMock()
+        client = MagicMock()
+        client.get_workflow_handle.return_value = handle
+
+        status, _ = await call(
+            make_gateway(prefix="/api"),
+            "POST",
+            "/api/OrderWorkflow/order-1/signal/cancel",
+            {"args": ["customer request"]},
+            client=client,
+        )
+
+        assert status == 202
+        handle.signal.assert_awaited_once_with("cancel", args=["customer request"])
+
+    @pytest.mark.asyncio
+    async def test_query(self):
+        handle = MagicMock()
+        handle.query = AsyncMock(return_value={"state": "paid"})
+        client = MagicMock()
+        client.get_workflow_handle.return_value = handle
+
+        status, body = await call(make_gateway(), "GET", "/OrderWorkflow/order-1/query/status", client=client)
+
+        assert status == 200
+        assert json.loads(body)["result"] == {"state": "paid"}
+        handle.query.assert_awaited_once_with("status", args=[], result_type=dict)
+
+    @pytest.mark.asyncio
+    async def test_update_with_start(self):
+        handle = MagicMock(workflow_id="order-1", workflow_run_id="run-1", id="update-1")
+        handle.result = AsyncMock(return_value=2)
+        client = MagicMock()
+        client.start_update_with_start_workflow = AsyncMock(return_value=handle)
+
+        status, body = await call(
+            make_gateway(),
+            "POST",
+            "/OrderWorkflow/order-1/update/add_item",
+            {"args": [{"order_id": "o1", "amount": 1}], "update_args": ["sku-1", "2"]},
+            client=client,
+        )
+
+        assert status == 200
+        assert json.loads(body) == {
+            "workflow_id": "order-1",
+            "run_id": "run-1",
+            "update_id": "update-1",
+            "stage": "completed",
+            "result": 2,
+        }
+        kwargs = client.start_update_with_start_workflow.call_args.kwargs
+        assert kwargs["args"] == ["sku-1", 2]
+        assert kwargs["result_type"] is int
+
+    @pytest.mark.asyncio
+    async def test_update_with_start_accepted(self):
+        handle = MagicMock(workflow_id="order-1", workflow_run_id="run-1", id="update-1")
+        client = MagicMock()
+        client.start_update_with_start_workflow = AsyncMock(return_value=handle)
+        body = {"args": [{"order_id": "o1", "amount": 1}], "update_args": ["sku-1", 2], "wait_for_stage": "accepted"}
+
+        status, response = await call(
+            make_gateway(), "POST", "/OrderWorkflow/order-1/update/add_item", body, client=client
+        )
+
+        assert status == 202
+        assert json.loads(response)["stage"] == "accepted"
+
+    @pytest.mark.asyncio
+    async def test_update_with_start_invalid_stage(self):
+        body = {"args": [{"order_id": "o1", "amount": 1}], "update_args": ["sku-1", 2], "wait_for_stage": "admitted"}
+        status, _ = await call(make_gateway(), "POST", "/OrderWorkflow/order-1/update/add_item", body)
+        assert status == 422
+
+    @pytest.mark.asyncio
+    async def test_query_cache_used_and_invalidated_by_signal(self):
+        handle = MagicMock()
+        handle.query = AsyncMock(return_value={"state": "paid"})
+        handle.signal = AsyncMock()
+        client = MagicMock(data_converter=DataConverter.default)
+        client.get_workflow_handle.return_value = handle
+        state = {"temporal_query_cache": QueryCache(client, QueryCacheOptions(ttl=10))}
+        gateway = make_gateway()
+
+        for _ in range(3):
+            status, _ = await call(gateway, "GET", "/OrderWorkflow/order-1/query/status", client=client, state=state)
+            assert status == 200
+        await call(gateway, "POST", "/OrderWorkflow/order-1/signal/cancel", {"args": ["x"]}, client=client, state=state)
+        await call(gateway, "GET", "/OrderWorkflow/order-1/query/status", client=client, state=state)
+
+        assert handle.query.await_count == 2
+        handle.signal.assert_awaited_once_with("cancel", args=("x",))
+
+    @pytest.mark.asyncio
+    async def test_unknown_routes(self):
+        gateway = make_gateway()
+        assert (await call(gateway, "POST", "/Missing/start", {}))[0] == 404
+        assert (await call(gateway, "POST", "/OrderWorkflow/order-1/signal/missing", {}))[0] == 404
+        assert (await call(gateway, "GET", "/OrderWorkflow/start"))[0] == 405
+
+    @pytest.mark.asyncio
+    async def test_body_too_large(self):
+        status, _ = await call(make_gateway(max_body_size=8), "POST", "/OrderWorkflow/start", {"args": []})
+        assert status == 413
+
+
+class TestBoostAppGateway:
+    def test_create_workflow_gateway(self):
+        app = BoostApp()
+        app.add_worker("orders_worker", "orders", workflows=[OrderWorkflow])
+
+        gateway = app.create_workflow_gateway(prefix="/workflows")
+
+        assert list(gateway.workflows) == ["OrderWorkflow"]
+        assert gateway.workflows["OrderWorkflow"].task_queue == "orders"
+
+    def test_add_workflow_gateway(self):
+        app = BoostApp()
+        app.add_worker("orders_worker", "orders", workflows=[OrderWorkflow])
+
+        with patch("temporal_boost.boost_app.get_asgi_worker_class") as mock_get_worker:
+            mock_worker_class = MagicMock()
+            mock_get_worker.return_value = mock_worker_class
+
+            gateway = app.add_workflow_gateway("gateway", "0.0.0.0", 8000)
+
+            kwargs = mock_worker_class.call_args.kwargs
+            assert kwargs["app"] is gateway
+            assert "client_builder" in kwargs
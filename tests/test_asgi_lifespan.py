@@ -0,0 +1,213 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from temporal_boost.asgi.lifespan import (
+    TemporalClientLifespan,
+    get_query_cache,
+    get_result_waiter,
+    get_temporal_client,
+)
+from temporal_boost.temporal.query_cache import QueryCache, QueryCacheInterceptor, QueryCacheOptions
+from temporal_boost.temporal.result_waiter import ResultWaiter
+from temporal_boost.asgi.admission import AdmissionOptions
+from temporal_boost.workers.base import BaseAsgiWorker
+from temporal_boost.workers.granian_worker import GranianBoostWorker
+
+
+class LifespanApp:
+    """Minimal ASGI app implementing lifespan, recording the client each request sees."""
+
+    def __init__(self) -> None:
+        self.state = SimpleNamespace()
+        self.seen_clients = []
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        self.seen_clients.append(get_temporal_client(scope))
+
+
+class HttpOnlyApp:
+    def __init__(self) -> None:
+        self.seen_clients = []
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            raise RuntimeError("Unsupported scope")
+        self.seen_clients.append(get_temporal_client(scope))
+
+
+def make_builder(client=None):
+    builder = MagicMock()
+    builder.build = AsyncMock(return_value=client or MagicMock(name="client"))
+    builder.build_pool = AsyncMock(return_value=MagicMock(name="pool"))
+    return builder
+
+
+async def run_lifespan(app, messages):
+    queue: asyncio.Queue = asyncio.Queue()
+    for message in messages:
+        queue.put_nowait(message)
+    sent = []
+
+    async def send(message) -> None:
+        sent.append(message)
+
+    scope = {"type": "lifespan", "state": {}}
+    await app(scope, queue.get, send)
+    return scope, sent
+
+
+async def run_lifespan_until_startup(app):
+    # Runs startup, then returns the pending task and queue to finish shutdown later
+    queue: asyncio.Queue = asyncio.Queue()
+    started = asyncio.Event()
+    sent = []
+
+    async def send(message) -> None:
+        sent.append(message)
+        if message["type"].startswith("lifespan.startup"):
+            started.set()
+
+    scope = {"type": "lifespan", "state": {}}
+    task = asyncio.create_task(app(scope, queue.get, send))
+    queue.put_nowait({"type": "lifespan.startup"})
+    await started.wait()
+    return scope, queue, task, sent
+
+
+class TestTemporalClientLifespan:
+    @pytest.mark.asyncio
+    async def test_client_shared_across_requests(self) -> None:
+        client = MagicMock(name="client")
+        inner = LifespanApp()
+        app = TemporalClientLifespan(inner, make_builder(client))
+
+        scope, queue, task, sent = await run_lifespan_until_startup(app)
+        assert scope["state"]["temporal_client"] is client
+        assert inner.state.temporal_client is client
+        assert isinstance(get_result_waiter(scope), ResultWaiter)
+
+        for _ in range(3):
+            await app({"type": "http", "state": dict(scope["state"])}, AsyncMock(), AsyncMock())
+        assert inner.seen_clients == [client, client, client]
+
+        queue.put_nowait({"type": "lifespan.shutdown"})
+        await task
+        assert [message["type"] for message in sent] == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        assert not hasattr(inner.state, "temporal_client")
+        with pytest.raises(RuntimeError, match="not connected"):
+            _ = app.client
+
+    @pytest.mark.asyncio
+    async def test_pool(self) -> None:
+        builder = make_builder()
+        app = TemporalClientLifespan(LifespanApp(), builder, pool_size=4)
+
+        await run_lifespan(app, [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+
+        builder.build_pool.assert_awaited_once_with(4)
+        builder.build.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_app_without_lifespan(self) -> None:
+        client = MagicMock(name="client")
+        inner = HttpOnlyApp()
+        app = TemporalClientLifespan(inner, make_builder(client))
+
+        scope, queue, task, sent = await run_lifespan_until_startup(app)
+        await app({"type": "http", "state": dict(scope["state"])}, AsyncMock(), AsyncMock())
+        queue.put_nowait({"type": "lifespan.shutdown"})
+        await task
+
+        assert inner.seen_clients == [client]
+        assert [message["type"] for message in sent] == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+    @pytest.mark.asyncio
+    async def test_startup_failure(self) -> None:
+        builder = make_builder()
+        builder.build.side_effect = RuntimeError("connection refused")
+        app = TemporalClientLifespan(HttpOnlyApp(), builder)
+
+        _, sent = await run_lifespan(app, [{"type": "lifespan.startup"}])
+
+        assert sent == [{"type": "lifespan.startup.failed", "message": "connection refused"}]
+
+    @pytest.mark.asyncio
+    async def test_connects_on_first_request_without_lifespan(self) -> None:
+        builder = make_builder()
+        inner = HttpOnlyApp()
+        app = TemporalClientLifespan(inner, builder)
+
+        await asyncio.gather(*(app({"type": "http"}, AsyncMock(), AsyncMock()) for _ in range(5)))
+
+        builder.build.assert_awaited_once()
+        assert len(inner.seen_clients) == 5
+
+    @pytest.mark.asyncio
+    async def test_query_cache(self) -> None:
+        inner = LifespanApp()
+        builder = make_builder()
+        app = TemporalClientLifespan(inner, builder, query_cache=QueryCacheOptions(ttl=5))
+        interceptor = builder.add_interceptor.call_args.args[0]
+        assert isinstance(interceptor, QueryCacheInterceptor)
+
+        scope, queue, task, _ = await run_lifespan_until_startup(app)
+        cache = get_query_cache(scope)
+        assert isinstance(cache, QueryCache)
+        assert inner.state.temporal_query_cache is cache
+        assert interceptor.cache is cache
+
+        queue.put_nowait({"type": "lifespan.shutdown"})
+        await task
+        assert app.query_cache is None
+        assert interceptor.cache is None
+        assert not hasattr(inner.state, "temporal_query_cache")
+
+    def test_no_query_cache_by_default(self) -> None:
+        assert get_query_cache({"type": "http", "state": {"temporal_client": MagicMock()}}) is None
+
+    def test_get_temporal_client_from_request(self) -> None:
+        client = MagicMock()
+        request = SimpleNamespace(scope={"state": {"temporal_client": client}})
+        assert get_temporal_client(request) is client
+
+    def test_get_temporal_client_missing(self) -> None:
+        with pytest.raises(RuntimeError, match="temporal_client=True"):
+            get_temporal_client({"type": "http", "state": {}})
+
+
+class TestBaseAsgiWorker:
+    class Worker(BaseAsgiWorker):
+        def run(self) -> None:
+            pass
+
+    def test_wraps_app_with_client_builder(self) -> None:
+        app = LifespanApp()
+        worker = self.Worker(app, "127.0.0.1", 8000, client_builder=make_builder(), client_pool_size=2)
+        assert isinstance(worker._app, TemporalClientLifespan)
+        assert worker.client_lifespan is worker._app
+        assert worker.client_lifespan.app is app
+
+    def test_no_wrapping_by_default(self) -> None:
+        app = LifespanApp()
+        worker = self.Worker(app, "127.0.0.1", 8000)
+        assert worker._app is app
+        assert worker.client_lifespan is None
+
+    @pytest.mark.parametrize(
+        ("option", "value"),
+        [("client_builder", make_builder()), ("admission_control", AdmissionOptions())],
+    )
+    def test_granian_rejects_wrapped_app(self, option, value) -> None:
+        with pytest.raises(RuntimeError, match=f"Granian worker does not support {option}"):
+            GranianBoostWorker("app:app", "127.0.0.1", 8000, **{option: value})
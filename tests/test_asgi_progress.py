@@ -0,0 +1,174 @@
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from temporalio.service import RPCError, RPCStatusCode
+
+from temporal_boost.asgi.progress import ProgressEvent, ProgressHub, ProgressSubscription, WorkflowProgressStream
+
+
+class FakeHandle:
+    def __init__(self, workflow_id, progress=None):
+        self.id = workflow_id
+        self.progress = progress if progress is not None else {"step": 1}
+        self.queries = 0
+        self.outcome = asyncio.get_running_loop().create_future()
+        self.result_cancelled = False
+
+    async def query(self, name, args=()):
+        self.queries += 1
+        if isinstance(self.progress, Exception):
+            raise self.progress
+        return self.progress
+
+    async def result(self):
+        try:
+            return await asyncio.shield(self.outcome)
+        except asyncio.CancelledError:
+            self.result_cancelled = True
+            raise
+
+
+def make_client(handle):
+    client = MagicMock()
+    client.get_workflow_handle.return_value = handle
+    return client
+
+
+async def collect(subscription):
+    return [event async for event in subscription]
+
+
+class TestProgressSubscription:
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_keeps_latest_events(self):
+        subscription = ProgressSubscription(buffer_size=2)
+        for step in range(5):
+            subscription.put(ProgressEvent("progress", step))
+        subscription.put(ProgressEvent("completed", "done"))
+
+        assert await collect(subscription) == [ProgressEvent("progress", 4), ProgressEvent("completed", "done")]
+
+
+class TestProgressHub:
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_poller(self):
+        handle = FakeHandle("wf-1")
+        client = make_client(handle)
+        hub = ProgressHub("progress", interval=0.01)
+
+        async with hub.subscribe(client, "wf-1") as first, hub.subscribe(client, "wf-1") as second:
+            assert hub.active_workflows == ["wf-1"]
+            tasks = [asyncio.create_task(collect(first)), asyncio.create_task(collect(second))]
+            await asyncio.sleep(0.05)
+            handle.progress = {"step": 2}
+            await asyncio.sleep(0.05)
+            handle.outcome.set_result("done")
+            first_events, second_events = await asyncio.gather(*tasks)
+
+        expected = [
+            ProgressEvent("progress", {"step": 1}),
+            ProgressEvent("progress", {"step": 2}),
+            ProgressEvent("completed", "done"),
+        ]
+        assert first_events == expected
+        assert second_events == expected
+        client.get_workflow_handle.assert_called_once_with("wf-1")
+        assert hub.active_workflows == []
+
+    @pytest.mark.asyncio
+    async def test_poller_stops_with_last_subscriber(self):
+        handle = FakeHandle("wf-1")
+        hub = ProgressHub("progress", interval=0.01)
+
+        async with hub.subscribe(make_client(handle), "wf-1") as subscription:
+            assert await subscription.get() == ProgressEvent("progress", {"step": 1})
+
+        assert hub.active_workflows == []
+        assert handle.result_cancelled
+        queries = handle.queries
+        await asyncio.sleep(0.03)
+        assert handle.queries == queries
+
+    @pytest.mark.asyncio
+    async def test_not_found(self):
+        handle = FakeHandle("missing", progress=RPCError("not found", RPCStatusCode.NOT_FOUND, b""))
+        hub = ProgressHub("progress", interval=0.01)
+
+        async with hub.subscribe(make_client(handle), "missing") as subscription:
+            events = await collect(subscription)
+
+        assert [event.event for event in events] == ["not_found"]
+
+
+class TestWorkflowProgressStream:
+    @staticmethod
+    async def call(app, scope, messages, handle):
+        queue = asyncio.Queue()
+        for message in messages:
+            queue.put_nowait(message)
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+            # The workflow completes once the first progress went out
+            if not handle.outcome.done():
+                handle.outcome.set_result({"total": 3})
+
+        scope = {"state": {"temporal_client": make_client(handle)}, **scope}
+        await asyncio.wait_for(app(scope, queue.get, send), 1)
+        return sent
+
+    @pytest.mark.asyncio
+    async def test_sse(self):
+        app = WorkflowProgressStream("progress", prefix="/progress", interval=0.01)
+        handle = FakeHandle("wf-1")
+
+        sent = await self.call(app, {"type": "http", "method": "GET", "path": "/progress/wf-1"}, [], handle)
+
+        assert sent[0]["status"] == 200
+        assert (b"content-type", b"text/event-stream") in sent[0]["headers"]
+        body = b"".join(message["body"] for message in sent[1:])
+        assert body == (b'event: progress\ndata: {"step":1}\n\nevent: completed\ndata: {"total":3}\n\n')
+
+    @pytest.mark.asyncio
+    async def test_sse_client_disconnect(self):
+        app = WorkflowProgressStream("progress", interval=0.01)
+        handle = FakeHandle("wf-1")
+        queue = asyncio.Queue()
+        scope = {"type": "http", "method": "GET", "path": "/wf-1", "state": {"temporal_client": make_client(handle)}}
+        task = asyncio.create_task(app(scope, queue.get, MagicMock(side_effect=lambda message: asyncio.sleep(0))))
+
+        await asyncio.sleep(0.03)
+        assert app.hub.active_workflows == ["wf-1"]
+        queue.put_nowait({"type": "http.disconnect"})
+        await asyncio.wait_for(task, 1)
+
+        assert app.hub.active_workflows == []
+        assert handle.result_cancelled
+
+    @pytest.mark.asyncio
+    async def test_websocket(self):
+        app = WorkflowProgressStream("progress", interval=0.01)
+        handle = FakeHandle("wf-1")
+
+        sent = await self.call(app, {"type": "websocket", "path": "/wf-1"}, [{"type": "websocket.connect"}], handle)
+
+        assert sent[0] == {"type": "websocket.accept"}
+        assert [json.loads(message["text"]) for message in sent[1:-1]] == [
+            {"event": "progress", "data": {"step": 1}},
+            {"event": "completed", "data": {"total": 3}},
+        ]
+        assert sent[-1] == {"type": "websocket.close", "code": 1000}
+
+    @pytest.mark.asyncio
+    async def test_unknown_path_and_method(self):
+        app = WorkflowProgressStream("progress")
+        handle = FakeHandle("wf-1")
+
+        sent = await self.call(app, {"type": "http", "method": "GET", "path": "/a/b"}, [], handle)
+        assert sent[0]["status"] == 404
+
+        sent = await self.call(app, {"type": "http", "method": "POST", "path": "/wf-1"}, [], handle)
+        assert sent[0]["status"] == 405
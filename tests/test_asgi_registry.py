@@ -1,3 +1,4 @@
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -47,6 +48,18 @@ class TestASGIWorkerRegistry:
 
         assert "test_worker" not in registry._data
 
+    def test_register_does_not_import_package(self, tmp_path, monkeypatch):
+        (tmp_path / "boost_fake_server.py").write_text("raise RuntimeError('imported')\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        registry = ASGIWorkerRegistry()
+
+        @registry.register("test_worker", packages=["boost_fake_server"])
+        class TestWorker(MockASGIWorker):
+            pass
+
+        assert "test_worker" in registry._data
+        assert "boost_fake_server" not in sys.modules
+
     def test_get_existing(self):
         registry = ASGIWorkerRegistry()
 
@@ -136,4 +149,3 @@ class TestGetASGIWorkerClass:
 
             with pytest.raises(RuntimeError, match="No ASGI worker implementation is available"):
                 get_asgi_worker_class(ASGIWorkerType.auto)
-
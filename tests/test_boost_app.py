@@ -244,6 +244,27 @@ class TestBoostApp:
             assert len(app.get_registered_workers()) == 1
             mock_worker_class.assert_called_once()
 
+    def test_add_asgi_worker_with_temporal_client(self):
+        app = BoostApp(temporal_endpoint="temporal:7233", temporal_namespace="orders")
+
+        with patch("temporal_boost.boost_app.get_asgi_worker_class") as mock_get_worker:
+            mock_worker_class = MagicMock()
+            mock_get_worker.return_value = mock_worker_class
+
+            app.add_asgi_worker(
+                worker_name="asgi_worker",
+                asgi_app=MagicMock(),
+                host="0.0.0.0",
+                port=8000,
+                temporal_client=True,
+                temporal_client_pool_size=3,
+            )
+
+            kwargs = mock_worker_class.call_args.kwargs
+            assert kwargs["client_pool_size"] == 3
+            assert kwargs["client_builder"]._target_host == "temporal:7233"
+            assert kwargs["client_builder"]._namespace == "orders"
+
     def test_add_asgi_worker_with_reserved_name(self):
         app = BoostApp()
 
@@ -292,7 +313,7 @@ class TestBoostApp:
         class MockFastStreamApp:
             pass
 
-        with patch("temporal_boost.boost_app.FastStreamBoostWorker") as mock_worker_class:
+        with patch("temporal_boost.workers.faststream_worker.FastStreamBoostWorker") as mock_worker_class:
             mock_worker_instance = MagicMock()
             mock_worker_instance.name = ""
             mock_worker_class.return_value = mock_worker_instance
@@ -324,7 +345,8 @@ class TestBoostApp:
             return "executed"
 
         app.add_exec_method_sync("test_exec", exec_callback)
-        assert app._exec_typer is not None
+        groups = {group.typer_instance.info.name: group.typer_instance for group in app._root_typer.registered_groups}
+        assert [command.name for command in groups["exec"].registered_commands] == ["test_exec"]
 
     def test_add_async_runtime(self):
         app = BoostApp()
@@ -382,29 +404,53 @@ class TestBoostApp:
 
     def test_run_with_args(self):
         app = BoostApp()
-        with patch.object(app._root_typer, "__call__", return_value=None) as mock_run:
-            try:
-                app.run("test", "args")
-            except SystemExit:
-                pass
-            mock_run.assert_called_once()
+        with patch("typer.Typer.__call__", return_value=None) as mock_run:
+            app.run("test", "args")
+            mock_run.assert_called_once_with(["test", "args"])
 
-    def test_run_with_args(self):
+    def test_run_unknown_worker_reported_by_typer(self, capsys):
         app = BoostApp()
+        app.run("run", "missing")
 
-        def dummy_activity():
-            pass
+        assert "No such command 'missing'" in capsys.readouterr().err
 
-        app.add_worker(
-            worker_name="test_worker",
-            task_queue="test_queue",
-            activities=[dummy_activity],
+    def test_run_worker_skips_typer(self):
+        app = BoostApp()
+        worker = MagicMock()
+        worker.name = "test_worker"
+        app.add_async_runtime("test_worker", worker)
+
+        with patch.object(BoostApp, "_build_typer") as mock_build:
+            app.run(["run", "test_worker"])
+
+        worker.run.assert_called_once_with()
+        mock_build.assert_not_called()
+
+    @pytest.mark.parametrize("args", [["run", "--help"], ["run", "missing"], ["run", "test_worker", "--verbose"]])
+    def test_run_falls_back_to_typer(self, args):
+        app = BoostApp()
+        worker = MagicMock()
+        worker.name = "test_worker"
+        app.add_async_runtime("test_worker", worker)
+
+        with patch("typer.Typer.__call__", return_value=None) as mock_run:
+            app.run(args)
+
+        mock_run.assert_called_once_with(args)
+        worker.run.assert_not_called()
+
+    def test_cron_worker_dispatched_directly(self):
+        app = BoostApp()
+        worker = app.add_worker(
+            "cron_worker",
+            "q",
+            activities=[MagicMock(__name__="act")],
+            cron_schedule="* * * * *",
+            cron_runner=MagicMock(),
         )
+        assert app._commands["cron"] == {"cron_worker": worker.cron}
 
-        with patch.object(app._root_typer, "__call__", return_value=None) as mock_run:
-            try:
-                app.run("run", "test_worker")
-            except (SystemExit, Exception):
-                pass
-            assert mock_run.called or len(app.get_registered_workers()) == 1
+        with patch.dict(app._commands["cron"], cron_worker=(cron := MagicMock())):
+            app.run("cron", "cron_worker")
 
+        cron.assert_called_once_with()
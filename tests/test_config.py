@@ -50,6 +50,14 @@ class TestConfigUtilityFunctions:
         with patch.dict(os.environ, {}, clear=True):
             assert math.isclose(config.get_env_float("NONEXISTENT", default=2.71), 2.71)
 
+    def test_get_env_int_or_auto(self):
+        with patch.dict(os.environ, {"TEST_VAR": "Auto"}, clear=False):
+            assert config.get_env_int_or_auto("TEST_VAR", default=1) == config.AUTO
+        with patch.dict(os.environ, {"TEST_VAR": "12"}, clear=False):
+            assert config.get_env_int_or_auto("TEST_VAR", default=1) == 12
+        with patch.dict(os.environ, {}, clear=True):
+            assert config.get_env_int_or_auto("NONEXISTENT", default=7) == 7
+
     def test_config_constants_exist(self):
         assert hasattr(config, "TARGET_HOST")
         assert hasattr(config, "CLIENT_NAMESPACE")
@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+import pytest
+
+
+# Generous enough for slow CI machines; importing the app eagerly takes several times this
+IMPORT_BUDGET_MS = 100
+
+HEAVY_MODULES = ("typer", "click", "yaml", "temporalio", "pydantic")
+ASGI_SERVERS = ("uvicorn", "hypercorn", "granian")
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    # A fresh interpreter, so modules imported by the test session do not hide the cost
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True)
+
+
+def import_time_ms(statement: str) -> float:
+    # Wall time rather than -X importtime, which does not report modules loaded by importlib
+    code = f"import time; started = time.perf_counter(); {statement}; print((time.perf_counter() - started) * 1000)"
+    return float(run_python("-c", code).stdout)
+
+
+def imported_modules(statement: str) -> set[str]:
+    return set(run_python("-c", f"{statement}; import sys; print(*sys.modules)").stdout.split())
+
+
+class TestImportTime:
+    def test_app_import_within_budget(self):
+        assert import_time_ms("from temporal_boost import BoostApp") < IMPORT_BUDGET_MS
+        modules = imported_modules("from temporal_boost import BoostApp")
+        assert not [module for module in HEAVY_MODULES if module in modules]
+
+    def test_package_import_skips_app(self):
+        assert "temporal_boost.boost_app" not in imported_modules("import temporal_boost")
+
+    @pytest.mark.parametrize("module", ["temporal_boost.temporal.config", "temporal_boost.cli.importer"])
+    def test_submodule_import_skips_app(self, module):
+        modules = imported_modules(f"import {module}")
+
+        assert "temporal_boost.boost_app" not in modules
+        assert "typer" not in modules
+
+    def test_app_import_skips_asgi_servers(self):
+        modules = imported_modules("from temporal_boost import BoostApp")
+
+        assert "temporal_boost.boost_app" in modules
+        assert not [module for module in (*ASGI_SERVERS, "yaml") if module in modules]
+
+    def test_lazy_attributes(self):
+        import temporal_boost  # noqa: PLC0415
+
+        assert temporal_boost.BoostApp.__module__ == "temporal_boost.boost_app"
+        assert "BoostApp" in dir(temporal_boost)
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            temporal_boost.Missing  # noqa: B018
+
+    def test_worker_dispatch_skips_cli(self):
+        modules = imported_modules(
+            "from unittest.mock import MagicMock; from temporal_boost import BoostApp; "
+            "app = BoostApp(logger_config=None); app.add_async_runtime('w', MagicMock()); app.run(['run', 'w'])",
+        )
+
+        assert "temporal_boost.boost_app" in modules
+        assert not [module for module in HEAVY_MODULES if module in modules]
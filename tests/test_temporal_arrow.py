@@ -0,0 +1,95 @@
+import dataclasses
+
+import pytest
+from temporalio.converter import DataConverter, DefaultPayloadConverter
+
+from temporal_boost.temporal.arrow import ARROW_ENCODING, arrow_payload_converter_class, with_arrow_payloads
+from temporal_boost.temporal.client import TemporalClientBuilder
+from temporal_boost.temporal.converter import OrjsonPayloadConverter, resolve_data_converter
+
+
+pa = pytest.importorskip("pyarrow")
+np = pytest.importorskip("numpy")
+
+TABLE = pa.table({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+@pytest.fixture
+def converter():
+    return arrow_payload_converter_class(DefaultPayloadConverter)()
+
+
+class TestArrowPayloadConverter:
+    def test_table_round_trip(self, converter):
+        payload = converter.to_payloads([TABLE])[0]
+        assert payload.metadata["encoding"] == ARROW_ENCODING.encode()
+        assert converter.from_payloads([payload])[0].equals(TABLE)
+
+    def test_record_batch_round_trip(self, converter):
+        batch = TABLE.to_batches()[0]
+        decoded = converter.from_payloads(converter.to_payloads([batch]))[0]
+        assert isinstance(decoded, pa.RecordBatch)
+        assert decoded.equals(batch)
+
+    def test_numpy_round_trip_is_zero_copy(self, converter):
+        array = np.arange(12, dtype=np.float64).reshape(3, 4)
+        decoded = converter.from_payloads(converter.to_payloads([array]))[0]
+        np.testing.assert_array_equal(decoded, array)
+        assert not decoded.flags.writeable
+
+    def test_pandas_round_trip(self, converter):
+        pd = pytest.importorskip("pandas")
+        frame = pd.DataFrame({"a": [1, 2], "b": [0.5, 1.5]}, index=[10, 20])
+        decoded = converter.from_payloads(converter.to_payloads([frame]))[0]
+        pd.testing.assert_frame_equal(decoded, frame)
+
+    def test_type_hint_selects_table(self, converter):
+        pd = pytest.importorskip("pandas")
+        payloads = converter.to_payloads([pd.DataFrame({"a": [1, 2]})])
+        assert isinstance(converter.from_payloads(payloads, [pa.Table])[0], pa.Table)
+
+    def test_other_values_fall_through(self, converter):
+        values = [{"key": "value"}, [1, 2]]
+        payloads = converter.to_payloads([*values, Point(1, 2)])
+        assert all(payload.metadata["encoding"] == b"json/plain" for payload in payloads)
+        assert converter.from_payloads(payloads, [dict, list, Point]) == [*values, Point(1, 2)]
+
+    def test_object_array_falls_through(self, converter):
+        payload = converter.to_payloads([np.array([{"a": 1}], dtype=object)])[0]
+        assert payload.metadata["encoding"] != ARROW_ENCODING.encode()
+
+
+class TestWithArrowPayloads:
+    def test_keeps_base_converter(self):
+        data_converter = with_arrow_payloads(resolve_data_converter("orjson"))
+        assert isinstance(data_converter.payload_converter, OrjsonPayloadConverter)
+        assert data_converter.payload_converter.to_payloads([TABLE])[0].metadata["encoding"] == b"binary/arrow"
+
+    def test_idempotent(self):
+        data_converter = with_arrow_payloads(DataConverter.default)
+        assert with_arrow_payloads(data_converter).payload_converter_class is data_converter.payload_converter_class
+
+    def test_class_cached(self):
+        assert arrow_payload_converter_class(DefaultPayloadConverter) is arrow_payload_converter_class(
+            DefaultPayloadConverter,
+        )
+
+    @pytest.mark.asyncio
+    async def test_data_converter_round_trip(self):
+        data_converter = with_arrow_payloads(DataConverter.default)
+        payloads = await data_converter.encode([TABLE, {"x": 1}])
+        decoded = await data_converter.decode(payloads, [pa.Table, dict])
+        assert decoded[0].equals(TABLE)
+        assert decoded[1] == {"x": 1}
+
+    def test_client_builder(self):
+        builder = TemporalClientBuilder(data_converter="orjson", arrow_payloads=True)
+        data_converter = builder._build_data_converter()
+        assert isinstance(data_converter.payload_converter, OrjsonPayloadConverter)
+        assert data_converter.payload_converter.to_payloads([TABLE])[0].metadata["encoding"] == b"binary/arrow"
@@ -0,0 +1,182 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from temporalio.exceptions import WorkflowAlreadyStartedError
+
+from temporal_boost.temporal.bulk import BulkStartItem, BulkWorkflowStarter, _Checkpoint
+from temporal_boost.workers.temporal import TemporalBoostWorker
+
+
+def make_client() -> MagicMock:
+    client = MagicMock()
+    client.start_workflow = AsyncMock(side_effect=lambda *_, **kwargs: f"handle-{kwargs['id']}")
+    return client
+
+
+async def generate_items(count: int):
+    for index in range(count):
+        yield ("Workflow", [index], f"wf-{index}")
+
+
+class TestBulkWorkflowStarter:
+    def test_invalid_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="must be positive"):
+            BulkWorkflowStarter(MagicMock(), "queue", concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_run_with_async_iterator(self) -> None:
+        client = make_client()
+        starter = BulkWorkflowStarter(client, "queue", concurrency=3, collect_results=True)
+
+        report = await starter.run(generate_items(10))
+
+        assert report.started == 10
+        assert report.failed == 0
+        assert sorted(result.id for result in report.results) == sorted(f"wf-{i}" for i in range(10))
+        call_kwargs = client.start_workflow.call_args[1]
+        assert call_kwargs["task_queue"] == "queue"
+
+    @pytest.mark.asyncio
+    async def test_run_with_items_and_options(self) -> None:
+        client = make_client()
+        starter = BulkWorkflowStarter(client, "queue", execution_timeout=None)
+
+        await starter.run([BulkStartItem("Workflow", ["a"], "wf-a", options={"task_queue": "other"})])
+
+        call_kwargs = client.start_workflow.call_args[1]
+        assert call_kwargs["task_queue"] == "other"
+        assert call_kwargs["args"] == ["a"]
+        assert "execution_timeout" in call_kwargs
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self) -> None:
+        running = 0
+        peak = 0
+
+        async def start_workflow(*_, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return kwargs["id"]
+
+        client = MagicMock()
+        client.start_workflow = start_workflow
+        starter = BulkWorkflowStarter(client, "queue", concurrency=4)
+
+        report = await starter.run(generate_items(50))
+
+        assert report.started == 50
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_and_already_started(self) -> None:
+        async def start_workflow(*_, **kwargs):
+            if kwargs["id"] == "wf-1":
+                raise RuntimeError("boom")
+            if kwargs["id"] == "wf-2":
+                raise WorkflowAlreadyStartedError("wf-2", "Workflow")
+            return kwargs["id"]
+
+        client = MagicMock()
+        client.start_workflow = start_workflow
+        starter = BulkWorkflowStarter(client, "queue")
+
+        report = await starter.run(generate_items(4))
+
+        assert report.started == 2
+        assert report.already_started == 1
+        assert report.failed == 1
+        assert [result.id for result in report.errors] == ["wf-1"]
+        assert len(report.results) == 1
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_resume(self, tmp_path) -> None:
+        checkpoint_path = tmp_path / "import.json"
+        checkpoint_path.write_text(json.dumps({"completed": 6}))
+        client = make_client()
+        starter = BulkWorkflowStarter(client, "queue", checkpoint_path=checkpoint_path, checkpoint_every=2)
+
+        report = await starter.run(generate_items(10))
+
+        assert report.resumed_from == 6
+        assert report.started == 4
+        assert json.loads(checkpoint_path.read_text()) == {"completed": 10, "failed": []}
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_resume_retries_failures(self, tmp_path) -> None:
+        checkpoint_path = tmp_path / "import.json"
+        started = set()
+        unavailable = {"wf-1", "wf-3"}
+
+        async def start_workflow(*_, **kwargs):
+            if kwargs["id"] in unavailable:
+                raise RuntimeError("frontend unavailable")
+            if kwargs["id"] in started:
+                raise WorkflowAlreadyStartedError(kwargs["id"], "Workflow")
+            started.add(kwargs["id"])
+            return kwargs["id"]
+
+        client = MagicMock()
+        client.start_workflow = start_workflow
+        starter = BulkWorkflowStarter(client, "queue", concurrency=2, checkpoint_path=checkpoint_path)
+
+        report = await starter.run(generate_items(6))
+        assert (report.started, report.failed) == (4, 2)
+        assert json.loads(checkpoint_path.read_text()) == {"completed": 6, "failed": [1, 3]}
+
+        unavailable.discard("wf-1")
+        report = await starter.run(generate_items(6))
+
+        assert report.resumed_from == 6
+        assert (report.started, report.already_started, report.failed) == (1, 0, 1)
+        assert json.loads(checkpoint_path.read_text()) == {"completed": 6, "failed": [3]}
+
+        unavailable.clear()
+        report = await starter.run(generate_items(6))
+
+        assert (report.started, report.failed) == (1, 0)
+        assert json.loads(checkpoint_path.read_text()) == {"completed": 6, "failed": []}
+
+    def test_failure_does_not_pin_checkpoint(self) -> None:
+        checkpoint = _Checkpoint(None, every=1000)
+
+        checkpoint.mark(0, failed=True)
+        for index in range(1, 10_000):
+            checkpoint.mark(index)
+
+        assert checkpoint.watermark == 10_000
+        assert checkpoint.failed == {0}
+        assert not checkpoint._finished
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_saved_on_interrupt(self, tmp_path) -> None:
+        checkpoint_path = tmp_path / "import.json"
+        client = make_client()
+        starter = BulkWorkflowStarter(client, "queue", concurrency=1, checkpoint_path=checkpoint_path)
+
+        stream = starter.stream(generate_items(10))
+        async for result in stream:
+            if result.index == 2:
+                break
+        await stream.aclose()
+
+        assert json.loads(checkpoint_path.read_text()) == {"completed": 3, "failed": []}
+
+
+class TestTemporalBoostWorkerBulkStarter:
+    def test_bulk_starter_uses_worker_queue(self) -> None:
+        def dummy_activity() -> None:
+            pass
+
+        worker = TemporalBoostWorker(worker_name="test_worker", task_queue="test_queue", activities=[dummy_activity])
+        worker._client = MagicMock()
+
+        starter = worker.bulk_starter(concurrency=5)
+
+        assert starter._task_queue == "test_queue"
+        assert starter._concurrency == 5
+        assert starter._client is worker._client
@@ -0,0 +1,157 @@
+import hashlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import DataConverter
+
+from temporal_boost.temporal.claim_check import (
+    CLAIM_CHECK_ENCODING,
+    BlobNotFoundError,
+    ClaimCheckPayloadCodec,
+    FileSystemBlobStore,
+    S3BlobStore,
+    blob_store_from_url,
+)
+from temporal_boost.temporal.client import TemporalClientBuilder
+from temporal_boost.temporal.codec import CompressionPayloadCodec, PayloadCodecChain
+
+
+def _payload(size: int, fill: bytes = b"x") -> Payload:
+    return Payload(metadata={"encoding": b"json/plain"}, data=b'"' + fill * size + b'"')
+
+
+class TestFileSystemBlobStore:
+    @pytest.mark.asyncio
+    async def test_put_get_exists(self, tmp_path):
+        store = FileSystemBlobStore(tmp_path)
+
+        assert await store.exists("abcdef") is False
+        await store.put("abcdef", b"data")
+
+        assert await store.exists("abcdef") is True
+        assert await store.get("abcdef") == b"data"
+        assert (tmp_path / "ab" / "abcdef").exists()
+        assert [path.name for path in (tmp_path / "ab").iterdir()] == ["abcdef"]
+
+    @pytest.mark.asyncio
+    async def test_get_missing(self, tmp_path):
+        with pytest.raises(BlobNotFoundError):
+            await FileSystemBlobStore(tmp_path).get("missing")
+
+
+class TestS3BlobStore:
+    @pytest.mark.asyncio
+    async def test_put_and_get_use_prefix(self):
+        client = MagicMock()
+        client.get_object.return_value = {"Body": MagicMock(read=MagicMock(return_value=b"data"))}
+        store = S3BlobStore("bucket", "/payloads/", client=client)
+
+        await store.put("key", b"data")
+        assert await store.get("key") == b"data"
+
+        client.put_object.assert_called_once_with(Bucket="bucket", Key="payloads/key", Body=b"data")
+        client.get_object.assert_called_once_with(Bucket="bucket", Key="payloads/key")
+
+
+class TestBlobStoreFromUrl:
+    def test_file_url(self, tmp_path):
+        store = blob_store_from_url(f"file://{tmp_path}")
+        assert isinstance(store, FileSystemBlobStore)
+        assert store.root == tmp_path
+
+    def test_plain_path(self, tmp_path):
+        assert blob_store_from_url(str(tmp_path)).root == tmp_path
+
+    def test_unsupported_scheme(self):
+        with pytest.raises(ValueError, match="Unsupported blob store URL"):
+            blob_store_from_url("ftp://host/path")
+
+
+class TestClaimCheckPayloadCodec:
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path):
+        codec = ClaimCheckPayloadCodec(FileSystemBlobStore(tmp_path / "store"), threshold=1024)
+        original = _payload(10_000)
+
+        encoded = await codec.encode([original])
+        assert encoded[0].metadata["encoding"] == CLAIM_CHECK_ENCODING
+        assert encoded[0].data.decode() == hashlib.sha256(original.SerializeToString()).hexdigest()
+        assert len(encoded[0].data) < 100
+
+        fresh_codec = ClaimCheckPayloadCodec(FileSystemBlobStore(tmp_path / "store"))
+        assert await fresh_codec.decode(encoded) == [original]
+
+    @pytest.mark.asyncio
+    async def test_small_payload_stays_inline(self):
+        store = AsyncMock()
+        codec = ClaimCheckPayloadCodec(store, threshold=1024)
+        original = _payload(10)
+
+        assert await codec.encode([original]) == [original]
+        store.put.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_identical_payloads(self, tmp_path):
+        store = FileSystemBlobStore(tmp_path)
+        codec = ClaimCheckPayloadCodec(store, threshold=10)
+
+        first = await codec.encode([_payload(100)])
+        second = await codec.encode([_payload(100)])
+        other_codec = ClaimCheckPayloadCodec(store, threshold=10)
+        third = await other_codec.encode([_payload(100)])
+
+        assert first == second == third
+        assert codec.stats.offloaded == 1
+        assert codec.stats.deduplicated == 1
+        assert other_codec.stats.deduplicated == 1
+
+    @pytest.mark.asyncio
+    async def test_read_cache(self, tmp_path):
+        store = FileSystemBlobStore(tmp_path / "store")
+        encoded = await ClaimCheckPayloadCodec(store, threshold=10).encode([_payload(100)])
+
+        codec = ClaimCheckPayloadCodec(store, cache_dir=tmp_path / "cache", memory_cache_size=0)
+        await codec.decode(encoded)
+        with patch.object(store, "get", side_effect=AssertionError("store should not be read")):
+            assert await codec.decode(encoded) == [_payload(100)]
+
+        assert codec.stats.fetched == 1
+        assert codec.stats.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_tampered_blob(self, tmp_path):
+        store = FileSystemBlobStore(tmp_path)
+        codec = ClaimCheckPayloadCodec(store, threshold=10)
+        encoded = await codec.encode([_payload(100)])
+        await store.put(encoded[0].data.decode(), _payload(100, b"y").SerializeToString())
+
+        with pytest.raises(RuntimeError, match="does not match"):
+            await ClaimCheckPayloadCodec(store).decode(encoded)
+
+    @pytest.mark.asyncio
+    async def test_after_compression(self, tmp_path):
+        codec = ClaimCheckPayloadCodec(FileSystemBlobStore(tmp_path), threshold=100)
+        data_converter = DataConverter(
+            payload_codec=PayloadCodecChain([CompressionPayloadCodec(threshold=100), codec]),
+        )
+        value = {"items": list(range(10_000))}
+
+        payloads = await data_converter.encode([value])
+        assert payloads[0].metadata["encoding"] == CLAIM_CHECK_ENCODING
+        assert codec.stats.bytes_offloaded < len(str(value))
+        assert await data_converter.decode(payloads) == [value]
+
+
+class TestClientBuilderClaimCheck:
+    def test_claim_check_runs_last(self, tmp_path):
+        builder = TemporalClientBuilder()
+        builder.set_claim_check(str(tmp_path), threshold=1000)
+        builder.set_compression("zlib")
+
+        payload_codec = builder._build_data_converter().payload_codec
+
+        assert isinstance(payload_codec, PayloadCodecChain)
+        assert isinstance(payload_codec.codecs[0], CompressionPayloadCodec)
+        assert isinstance(payload_codec.codecs[-1], ClaimCheckPayloadCodec)
+        assert payload_codec.codecs[-1].threshold == 1000
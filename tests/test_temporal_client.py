@@ -3,6 +3,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from temporal_boost.temporal.client import TemporalClientBuilder
+from temporal_boost.temporal.codec import CompressionPayloadCodec
+from temporal_boost.temporal.converter import MsgpackPayloadConverter, OrjsonPayloadConverter, pydantic_data_converter
 
 
 class TestTemporalClientBuilder:
@@ -37,6 +39,21 @@ class TestTemporalClientBuilder:
         builder = TemporalClientBuilder(use_pydantic_data_converter=True)
         assert builder._data_converter is not None
 
+    def test_init_with_data_converter_name(self):
+        builder = TemporalClientBuilder(data_converter="orjson")
+        assert isinstance(builder._data_converter.payload_converter, OrjsonPayloadConverter)
+
+    def test_data_converter_from_env(self):
+        with patch("temporal_boost.temporal.client.config.DATA_CONVERTER", "msgpack"):
+            builder = TemporalClientBuilder()
+        assert isinstance(builder._data_converter.payload_converter, MsgpackPayloadConverter)
+
+    def test_set_kwargs_data_converter(self):
+        builder = TemporalClientBuilder()
+        builder.set_kwargs(data_converter="orjson")
+        assert "data_converter" not in builder._client_kwargs
+        assert isinstance(builder._data_converter.payload_converter, OrjsonPayloadConverter)
+
     def test_init_with_kwargs(self):
         builder = TemporalClientBuilder(custom_param="value")
         assert builder._client_kwargs["custom_param"] == "value"
@@ -137,6 +154,49 @@ class TestTemporalClientBuilder:
             assert "data_converter" in call_kwargs
             assert call_kwargs["data_converter"] is not None
 
+    @pytest.mark.asyncio
+    async def test_build_with_compression(self):
+        builder = TemporalClientBuilder(target_host="localhost:7233", compression="zlib", compression_threshold=256)
+        builder.set_pydantic_data_converter()
+
+        with patch("temporalio.client.Client.connect", new_callable=AsyncMock) as mock_connect:
+            await builder.build()
+
+        data_converter = mock_connect.call_args[1]["data_converter"]
+        assert isinstance(data_converter.payload_codec, CompressionPayloadCodec)
+        assert data_converter.payload_codec.threshold == 256
+        assert data_converter.payload_converter_class is pydantic_data_converter.payload_converter_class
+
+    def test_set_compression_replaces_previous(self):
+        builder = TemporalClientBuilder()
+        custom_codec = MagicMock()
+        builder.add_payload_codec(custom_codec)
+        builder.set_compression("zlib")
+        builder.set_compression("zlib", threshold=10)
+
+        assert len(builder._payload_codecs) == 2
+        assert builder._payload_codecs[0].threshold == 10
+        assert builder._payload_codecs[1] is custom_codec
+
+    def test_set_kwargs_compression_threshold_applies_to_codec(self):
+        builder = TemporalClientBuilder(compression="zlib")
+        custom_codec = MagicMock()
+        builder.add_payload_codec(custom_codec)
+
+        builder.set_kwargs(compression_threshold=128)
+
+        assert builder._payload_codecs[0].threshold == 128
+        assert builder._payload_codecs[1] is custom_codec
+        assert "compression_threshold" not in builder._client_kwargs
+
+    def test_compression_threshold_without_compression(self):
+        builder = TemporalClientBuilder()
+
+        with pytest.raises(ValueError, match="requires compression"):
+            builder.set_kwargs(compression_threshold=128)
+        with pytest.raises(ValueError, match="requires compression"):
+            TemporalClientBuilder(compression_threshold=128)
+
     @pytest.mark.asyncio
     async def test_build_with_all_parameters(self):
         builder = TemporalClientBuilder(
@@ -167,3 +227,59 @@ class TestTemporalClientBuilder:
             assert call_kwargs["custom_param"] == "value"
             assert call_kwargs["runtime"] == mock_runtime
 
+    @pytest.mark.asyncio
+    async def test_build_lazy(self):
+        builder = TemporalClientBuilder(target_host="localhost:7233", lazy=True)
+
+        with patch("temporalio.client.Client.connect", new_callable=AsyncMock) as mock_connect:
+            await builder.build()
+
+            assert mock_connect.call_args[1]["lazy"] is True
+
+    @pytest.mark.asyncio
+    async def test_build_lazy_override(self):
+        builder = TemporalClientBuilder(target_host="localhost:7233")
+        builder.set_kwargs(lazy=True)
+
+        with patch("temporalio.client.Client.connect", new_callable=AsyncMock) as mock_connect:
+            await builder.build(lazy=False)
+
+            assert mock_connect.call_args[1]["lazy"] is False
+            assert builder._lazy is True
+
+    @pytest.mark.asyncio
+    async def test_build_retries_connect(self):
+        builder = TemporalClientBuilder(target_host="localhost:7233", connect_attempts=3, connect_backoff=0)
+
+        mock_client = AsyncMock()
+        with patch("temporalio.client.Client.connect", new_callable=AsyncMock) as mock_connect:
+            mock_connect.side_effect = [RuntimeError("Failed client connect"), RuntimeError("again"), mock_client]
+
+            client = await builder.build()
+
+            assert client == mock_client
+            assert mock_connect.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_build_gives_up_after_attempts(self):
+        builder = TemporalClientBuilder(target_host="localhost:7233", connect_attempts=2, connect_backoff=0)
+
+        with patch("temporalio.client.Client.connect", new_callable=AsyncMock) as mock_connect:
+            mock_connect.side_effect = RuntimeError("Failed client connect")
+
+            with pytest.raises(RuntimeError, match="Failed client connect"):
+                await builder.build()
+
+            assert mock_connect.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_build_lazy_does_not_retry(self):
+        builder = TemporalClientBuilder(target_host="localhost:7233", lazy=True, connect_attempts=3)
+
+        with patch("temporalio.client.Client.connect", new_callable=AsyncMock) as mock_connect:
+            mock_connect.side_effect = RuntimeError("bad config")
+
+            with pytest.raises(RuntimeError):
+                await builder.build()
+
+            assert mock_connect.call_count == 1
@@ -0,0 +1,94 @@
+import os
+
+import pytest
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import DataConverter
+
+from temporal_boost.temporal.codec import (
+    COMPRESSED_ENCODING,
+    CompressionAlgorithm,
+    CompressionPayloadCodec,
+    PayloadCodecChain,
+)
+
+
+def _payload(size: int) -> Payload:
+    return Payload(metadata={"encoding": b"json/plain"}, data=b'{"value": "' + b"x" * size + b'"}')
+
+
+@pytest.fixture(params=list(CompressionAlgorithm))
+def algorithm(request):
+    try:
+        CompressionPayloadCodec(request.param)
+    except RuntimeError as exc:
+        pytest.skip(str(exc))
+    return request.param
+
+
+class TestCompressionPayloadCodec:
+    @pytest.mark.asyncio
+    async def test_round_trip(self, algorithm):
+        codec = CompressionPayloadCodec(algorithm, threshold=1024)
+        original = _payload(10_000)
+
+        encoded = await codec.encode([original])
+        assert encoded[0].metadata["encoding"] == COMPRESSED_ENCODING
+        assert encoded[0].metadata["compression"] == algorithm.value.encode()
+        assert len(encoded[0].data) < len(original.data)
+
+        assert await codec.decode(encoded) == [original]
+
+    @pytest.mark.asyncio
+    async def test_small_payload_passes_through(self):
+        codec = CompressionPayloadCodec(threshold=1024)
+        original = _payload(10)
+
+        assert await codec.encode([original]) == [original]
+        assert codec.stats.skipped == 1
+        assert codec.stats.compressed == 0
+
+    @pytest.mark.asyncio
+    async def test_incompressible_payload_passes_through(self):
+        codec = CompressionPayloadCodec(threshold=16)
+        original = Payload(metadata={"encoding": b"binary/plain"}, data=os.urandom(2048))
+
+        assert await codec.encode([original]) == [original]
+        assert codec.stats.skipped == 1
+
+    @pytest.mark.asyncio
+    async def test_decodes_any_algorithm(self, algorithm):
+        encoded = await CompressionPayloadCodec(algorithm, threshold=0).encode([_payload(5000)])
+        assert await CompressionPayloadCodec("zlib").decode(encoded) == [_payload(5000)]
+
+    @pytest.mark.asyncio
+    async def test_stats(self):
+        codec = CompressionPayloadCodec(threshold=1024)
+        await codec.encode([_payload(10_000), _payload(10)])
+
+        assert codec.stats.encoded == 2
+        assert codec.stats.compressed == 1
+        assert codec.stats.ratio > 10
+
+    @pytest.mark.asyncio
+    async def test_unknown_algorithm_tag(self):
+        payload = Payload(metadata={"encoding": COMPRESSED_ENCODING, "compression": b"brotli"}, data=b"")
+        with pytest.raises(RuntimeError, match="brotli"):
+            await CompressionPayloadCodec().decode([payload])
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(ValueError, match="brotli"):
+            CompressionPayloadCodec("brotli")
+
+
+class TestPayloadCodecChain:
+    @pytest.mark.asyncio
+    async def test_round_trip_through_data_converter(self):
+        chain = PayloadCodecChain([
+            CompressionPayloadCodec("zlib", threshold=100),
+            CompressionPayloadCodec("zlib", threshold=100),
+        ])
+        data_converter = DataConverter(payload_codec=chain)
+        value = {"items": list(range(1000))}
+
+        payloads = await data_converter.encode([value])
+        assert await data_converter.decode(payloads) == [value]
@@ -0,0 +1,107 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from temporal_boost.temporal.colocation import LocalWorkerRegistry, start_workflow_colocated
+from temporal_boost.workers.temporal import TemporalBoostWorker
+
+
+class TestLocalWorkerRegistry:
+    def test_register_and_get(self):
+        registry = LocalWorkerRegistry()
+        client = MagicMock()
+
+        registry.register("queue", client)
+
+        assert registry.get("queue") is client
+        assert registry.task_queues() == ["queue"]
+
+    def test_unregister_only_own_client(self):
+        registry = LocalWorkerRegistry()
+        first, second = MagicMock(), MagicMock()
+        registry.register("queue", first)
+        registry.register("queue", second)
+
+        registry.unregister("queue", first)
+        assert registry.get("queue") is second
+
+        registry.unregister("queue", second)
+        assert registry.get("queue") is None
+
+
+class TestStartWorkflowColocated:
+    @pytest.mark.asyncio
+    async def test_uses_local_worker_client_with_eager_start(self):
+        local_client = MagicMock()
+        local_client.start_workflow = AsyncMock()
+        remote_client = MagicMock()
+        remote_client.start_workflow = AsyncMock()
+        registry = LocalWorkerRegistry()
+        registry.register("queue", local_client)
+
+        with patch("temporal_boost.temporal.colocation.local_worker_registry", registry):
+            await start_workflow_colocated(remote_client, "Workflow", "arg", id="wf", task_queue="queue")
+
+        remote_client.start_workflow.assert_not_called()
+        call_kwargs = local_client.start_workflow.call_args[1]
+        assert call_kwargs["request_eager_start"] is True
+        assert call_kwargs["args"] == ("arg",)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_given_client(self):
+        client = MagicMock()
+        client.start_workflow = AsyncMock()
+
+        with patch("temporal_boost.temporal.colocation.local_worker_registry", LocalWorkerRegistry()):
+            await start_workflow_colocated(client, "Workflow", id="wf", task_queue="queue")
+
+        assert "request_eager_start" not in client.start_workflow.call_args[1]
+
+    @pytest.mark.asyncio
+    async def test_no_client_and_no_local_worker(self):
+        with patch("temporal_boost.temporal.colocation.local_worker_registry", LocalWorkerRegistry()):
+            with pytest.raises(RuntimeError, match="No co-located worker"):
+                await start_workflow_colocated(None, "Workflow", id="wf", task_queue="queue")
+
+
+class TestColocatedTemporalBoostWorker:
+    def test_rejects_disabled_eager_activities(self):
+        def dummy_activity():
+            pass
+
+        with pytest.raises(RuntimeError, match="require eager activity execution"):
+            TemporalBoostWorker(
+                worker_name="test_worker",
+                task_queue="test_queue",
+                activities=[dummy_activity],
+                colocated=True,
+                disable_eager_activity_execution=True,
+            )
+
+    @pytest.mark.asyncio
+    async def test_registers_on_build_and_unregisters_on_shutdown(self):
+        def dummy_activity():
+            pass
+
+        worker = TemporalBoostWorker(
+            worker_name="test_worker",
+            task_queue="colocated_queue",
+            activities=[dummy_activity],
+            colocated=True,
+        )
+        worker.configure_temporal_client(target_host="localhost:7233")
+        mock_client = MagicMock()
+        mock_worker = MagicMock()
+        mock_worker.shutdown = AsyncMock()
+        registry = LocalWorkerRegistry()
+
+        with (
+            patch("temporal_boost.workers.temporal.local_worker_registry", registry),
+            patch.object(worker._client_builder, "build", new_callable=AsyncMock, return_value=mock_client),
+            patch.object(worker._worker_builder, "build", return_value=mock_worker),
+        ):
+            await worker._build_worker()
+            assert registry.get("colocated_queue") is mock_client
+
+            await worker.shutdown()
+            assert registry.get("colocated_queue") is None
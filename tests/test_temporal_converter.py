@@ -0,0 +1,210 @@
+import dataclasses
+import datetime
+import importlib.util
+import sys
+import uuid
+
+import pytest
+from pydantic import BaseModel
+from temporalio import activity, workflow
+from temporalio.converter import DataConverter, DefaultPayloadConverter
+
+from temporal_boost.temporal import converter as converter_module
+from temporal_boost.temporal.converter import (
+    CachedPydanticPayloadConverter,
+    MsgpackPayloadConverter,
+    OrjsonPayloadConverter,
+    get_type_adapter,
+    model_modules,
+    precompile_type_adapters,
+    pydantic_data_converter,
+    resolve_data_converter,
+    uses_shared_type_adapters,
+)
+
+
+class Order(BaseModel):
+    id: uuid.UUID
+    amount: float
+    created_at: datetime.datetime
+    tags: list[str] = []
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+ORDER = Order(
+    id=uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    amount=10.5,
+    created_at=datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+    tags=["a", "b"],
+)
+
+
+class ApprovalRequest(BaseModel):
+    approver: str
+
+
+class OrderStatus(BaseModel):
+    state: str
+
+
+class Refund(BaseModel):
+    amount: float
+
+
+@workflow.defn
+class OrderWorkflow:
+    @workflow.run
+    async def run(self, order: Order) -> OrderStatus:
+        return OrderStatus(state="done")
+
+    @workflow.signal
+    def approve(self, request: ApprovalRequest) -> None:
+        pass
+
+    @workflow.query
+    def status(self) -> OrderStatus:
+        return OrderStatus(state="running")
+
+    @workflow.update
+    def refund(self, refund: Refund) -> float:
+        return refund.amount
+
+
+@activity.defn
+async def charge(order: Order, point: Point) -> bool:
+    return True
+
+
+@pytest.fixture(params=[OrjsonPayloadConverter, MsgpackPayloadConverter, CachedPydanticPayloadConverter])
+def converter(request):
+    return request.param()
+
+
+class TestFastPayloadConverters:
+    def test_pydantic_model_round_trip(self, converter):
+        payloads = converter.to_payloads([ORDER])
+        assert converter.from_payloads(payloads, [Order]) == [ORDER]
+
+    def test_dataclass_round_trip(self, converter):
+        payloads = converter.to_payloads([Point(1, 2)])
+        assert converter.from_payloads(payloads, [Point]) == [Point(1, 2)]
+
+    def test_untyped_values(self, converter):
+        values = [None, b"raw", {"key": [1, 2.5, "three"]}, 42]
+        payloads = converter.to_payloads(values)
+        assert converter.from_payloads(payloads) == values
+
+    def test_nested_models_without_hint(self, converter):
+        payloads = converter.to_payloads([{"order": ORDER}])
+        decoded = converter.from_payloads(payloads)[0]
+        assert decoded["order"]["amount"] == 10.5
+
+    def test_msgpack_encoding(self):
+        payload = MsgpackPayloadConverter().to_payloads([{"key": "value"}])[0]
+        assert payload.metadata["encoding"] == b"binary/msgpack"
+
+
+class TestWireCompatibility:
+    def test_orjson_reads_default_json(self):
+        payloads = DefaultPayloadConverter().to_payloads([{"x": 1, "y": 2}])
+        assert OrjsonPayloadConverter().from_payloads(payloads, [Point]) == [Point(1, 2)]
+
+    def test_default_reads_orjson(self):
+        payloads = OrjsonPayloadConverter().to_payloads([{"x": 1, "y": 2}])
+        assert payloads[0].metadata["encoding"] == b"json/plain"
+        assert DefaultPayloadConverter().from_payloads(payloads, [Point]) == [Point(1, 2)]
+
+    def test_msgpack_reads_legacy_json(self):
+        payloads = DefaultPayloadConverter().to_payloads([ORDER.model_dump(mode="json")])
+        assert MsgpackPayloadConverter().from_payloads(payloads, [Order]) == [ORDER]
+
+
+class TestResolveDataConverter:
+    def test_by_name(self):
+        assert isinstance(resolve_data_converter("orjson").payload_converter, OrjsonPayloadConverter)
+        assert isinstance(resolve_data_converter("MSGPACK").payload_converter, MsgpackPayloadConverter)
+        assert resolve_data_converter("default") is DataConverter.default
+
+    def test_instance_passthrough(self):
+        data_converter = DataConverter()
+        assert resolve_data_converter(data_converter) is data_converter
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError, match="Unknown data converter"):
+            resolve_data_converter("yaml")
+
+    def test_type_adapter_cached(self):
+        assert get_type_adapter(Order) is get_type_adapter(Order)
+
+    def test_pydantic_by_name(self):
+        assert resolve_data_converter("pydantic") is pydantic_data_converter
+
+
+class TestPrecompiledTypeAdapters:
+    def test_precompiles_workflow_and_activity_hints(self, monkeypatch):
+        precompiled = {}
+        monkeypatch.setattr(converter_module, "_precompiled_type_adapters", precompiled)
+
+        compiled = precompile_type_adapters([OrderWorkflow], [charge])
+
+        assert set(precompiled) == {Order, OrderStatus, ApprovalRequest, Refund, float, Point, bool}
+        assert compiled == len(precompiled)
+        assert get_type_adapter(Refund) is precompiled[Refund]
+        assert precompile_type_adapters([OrderWorkflow], [charge]) == 0
+
+    def test_shared_across_converter_instances(self):
+        payloads = CachedPydanticPayloadConverter().to_payloads([ORDER])
+        assert CachedPydanticPayloadConverter().from_payloads(payloads, [Order]) == [ORDER]
+        assert get_type_adapter(Order) is get_type_adapter(Order)
+
+    def test_sandbox_reimported_class(self, tmp_path, monkeypatch):
+        (tmp_path / "boost_sandbox_models.py").write_text(
+            "from pydantic import BaseModel\n\n\nclass Invoice(BaseModel):\n    total: float\n"
+        )
+        (tmp_path / "boost_sandbox_workflows.py").write_text(
+            "from temporalio import workflow\n"
+            "from boost_sandbox_models import Invoice\n\n\n"
+            "@workflow.defn\n"
+            "class InvoiceWorkflow:\n"
+            "    @workflow.run\n"
+            "    async def run(self, invoice: Invoice) -> None:\n"
+            "        pass\n"
+        )
+
+        def load(name):
+            spec = importlib.util.spec_from_file_location(name, tmp_path / f"{name}.py")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module
+
+        host = load("boost_sandbox_models")
+        monkeypatch.setitem(sys.modules, "boost_sandbox_models", host)
+        workflows = load("boost_sandbox_workflows")
+        # A sandboxed run re-imports modules that are not passed through and gets copies
+        sandboxed = load("boost_sandbox_models")
+
+        assert model_modules([workflows.InvoiceWorkflow], []) == ["boost_sandbox_models"]
+        assert model_modules([OrderWorkflow], [charge]) == []
+
+        cached = converter_module._cached_type_adapter.cache_info().currsize
+        payloads = CachedPydanticPayloadConverter().to_payloads([host.Invoice(total=1.5)])
+        [invoice] = CachedPydanticPayloadConverter().from_payloads(payloads, [sandboxed.Invoice])
+        [invoices] = CachedPydanticPayloadConverter().from_payloads(
+            CachedPydanticPayloadConverter().to_payloads([[invoice]]), [list[sandboxed.Invoice]]
+        )
+
+        assert isinstance(invoice, sandboxed.Invoice)
+        assert invoice.total == 1.5
+        assert isinstance(invoices[0], sandboxed.Invoice)
+        # Copies are not cached, so finished runs do not stay alive in the LRU
+        assert converter_module._cached_type_adapter.cache_info().currsize == cached
+
+    def test_uses_shared_type_adapters(self):
+        assert uses_shared_type_adapters(pydantic_data_converter)
+        assert uses_shared_type_adapters(resolve_data_converter("orjson"))
+        assert not uses_shared_type_adapters(DataConverter.default)
@@ -0,0 +1,173 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from temporalio.worker import WorkerTuner
+
+from temporal_boost.asgi.health import HealthServer, WorkerHealthApp
+from temporal_boost.temporal.health import SlotUsage, TrackingSlotSupplier, WorkerHealth
+from temporal_boost.temporal.worker import TemporalWorkerBuilder
+from temporal_boost.workers.temporal import TemporalBoostWorker
+
+
+def used(permit):
+    return SimpleNamespace(permit=permit, slot_info=None)
+
+
+def running_worker():
+    return MagicMock(is_running=True, is_shutdown=False)
+
+
+class TestTrackingSlotSupplier:
+    @pytest.mark.asyncio
+    async def test_counts_polls_and_tasks(self):
+        supplier = TrackingSlotSupplier(2)
+
+        first = await supplier.reserve_slot(MagicMock())
+        await supplier.reserve_slot(MagicMock())
+        assert supplier.try_reserve_slot(MagicMock()) is None
+        supplier.mark_slot_used(used(first))
+
+        assert supplier.usage == SlotUsage(capacity=2, reserved=2, used=1)
+        assert (supplier.usage.available, supplier.usage.polling) == (1, 1)
+        assert supplier.last_task_at is not None
+
+        supplier.release_slot(used(first))
+        assert supplier.usage == SlotUsage(capacity=2, reserved=1, used=0)
+
+    @pytest.mark.asyncio
+    async def test_empty_polls_do_not_count_as_tasks(self):
+        supplier = TrackingSlotSupplier(1)
+
+        permit = await supplier.reserve_slot(MagicMock())
+        supplier.release_slot(used(permit))
+
+        assert supplier.last_task_at is None
+
+    @pytest.mark.asyncio
+    async def test_reserve_waits_for_release(self):
+        supplier = TrackingSlotSupplier(1)
+        permit = await supplier.reserve_slot(MagicMock())
+
+        waiting = asyncio.create_task(supplier.reserve_slot(MagicMock()))
+        await asyncio.sleep(0)
+        assert not waiting.done()
+        supplier.release_slot(used(permit))
+
+        await asyncio.wait_for(waiting, 1)
+        assert supplier.usage.reserved == 1
+
+
+class TestWorkerHealth:
+    @pytest.mark.asyncio
+    async def test_ready_once_polling(self):
+        health = WorkerHealth("orders", "order_queue")
+        tuner = health.tuner(
+            {
+                "max_concurrent_workflow_tasks": 10,
+                "max_concurrent_activities": 20,
+                "max_concurrent_local_activities": 5,
+            },
+        )
+        assert isinstance(tuner, WorkerTuner)
+        health.start(running_worker())
+        assert not health.ready
+
+        await tuner._get_workflow_task_slot_supplier().reserve_slot(MagicMock())
+        assert health.ready
+        snapshot = health.snapshot()
+        assert snapshot["slots"]["workflow"] == {"capacity": 10, "used": 0, "available": 10, "pollers": 1}
+        assert snapshot["slots"]["activity"]["capacity"] == 20
+        assert snapshot["seconds_since_last_task"] is None
+        await health.stop()
+
+    def test_blocked_loop_reported_from_check_age(self):
+        health = WorkerHealth("orders", "order_queue", check_interval=1, max_loop_lag=5)
+
+        with patch("temporal_boost.temporal.health.time") as mock_time:
+            mock_time.monotonic.side_effect = [0.0, 3.0, 3.0, 10.0, 10.0]
+            health._checked_at = mock_time.monotonic()
+            assert health.loop_lag == 2.0
+            assert health.live
+            assert health.loop_lag == 9.0
+            assert not health.live
+
+
+class TestWorkerBuilderHealth:
+    def test_slot_limits_moved_to_tracking_tuner(self):
+        builder = TemporalWorkerBuilder(task_queue="q", max_concurrent_activities=7, max_concurrent_nexus_tasks=3)
+        builder.set_client(MagicMock())
+        builder.set_health(health := WorkerHealth("w", "q"))
+
+        with patch("temporal_boost.temporal.worker.Worker") as mock_worker_class:
+            builder.build()
+
+        kwargs = mock_worker_class.call_args.kwargs
+        assert "max_concurrent_activities" not in kwargs
+        assert "max_concurrent_nexus_tasks" not in kwargs
+        assert kwargs["tuner"]._get_activities_max() is None
+        assert health.slots["activity"].capacity == 7
+
+    def test_custom_tuner_rejected(self):
+        builder = TemporalWorkerBuilder(task_queue="q", tuner=MagicMock())
+        builder.set_client(MagicMock())
+        builder.set_health(WorkerHealth("w", "q"))
+
+        with pytest.raises(RuntimeError, match="tuner"):
+            builder.build()
+
+
+class TestHealthEndpoints:
+    @staticmethod
+    def make_health():
+        health = WorkerHealth("orders", "order_queue")
+        health.tuner(
+            {"max_concurrent_workflow_tasks": 1, "max_concurrent_activities": 1, "max_concurrent_local_activities": 1},
+        )
+        return health
+
+    @pytest.mark.asyncio
+    async def test_ready_route_over_builtin_server(self):
+        health = self.make_health()
+        server = HealthServer(WorkerHealthApp([health]), "127.0.0.1", 0)
+        await server.start()
+
+        async def get(path):
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+            response = await reader.read()
+            writer.close()
+            head, _, body = response.partition(b"\r\n\r\n")
+            return head.split(b"\r\n")[0], json.loads(body)
+
+        try:
+            assert await get("/ready") == (
+                b"HTTP/1.1 503 Service Unavailable",
+                {"ready": False, "workers": {"orders": False}},
+            )
+            health.start(running_worker())
+            await health._suppliers["activity"].reserve_slot(MagicMock())
+            assert (await get("/ready"))[0] == b"HTTP/1.1 200 OK"
+            status, body = await get("/")
+            assert body["workers"][0]["slots"]["activity"]["pollers"] == 1
+            assert (await get("/live"))[1] == {"live": True, "event_loop_lag": {"orders": 0.0}}
+        finally:
+            await server.stop()
+            await health.stop()
+
+
+class TestTemporalBoostWorkerHealth:
+    def test_health_port_enables_tracking(self):
+        worker = TemporalBoostWorker("orders", "order_queue", activities=[MagicMock(__name__="act")], health_port=0)
+
+        assert worker.health is not None
+        assert worker.health.task_queue == "order_queue"
+        assert worker._worker_builder._health is worker.health
+        assert worker.enable_health() is worker.health
+
+    def test_health_disabled_by_default(self):
+        worker = TemporalBoostWorker("orders", "order_queue", activities=[MagicMock(__name__="act")])
+
+        assert worker.health is None
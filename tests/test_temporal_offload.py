@@ -0,0 +1,127 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import DataConverter, PayloadCodec
+
+from temporal_boost.temporal.claim_check import ClaimCheckPayloadCodec, FileSystemBlobStore
+from temporal_boost.temporal.client import TemporalClientBuilder
+from temporal_boost.temporal.codec import CompressionPayloadCodec
+from temporal_boost.temporal.offload import (
+    OffloadingDataConverter,
+    OffloadingPayloadCodec,
+    PayloadOffloader,
+    with_payload_offload,
+)
+
+
+class ThreadRecordingCodec(PayloadCodec):
+    def __init__(self) -> None:
+        self.threads: list[str] = []
+
+    async def encode(self, payloads):
+        self.threads.append(threading.current_thread().name)
+        return list(payloads)
+
+    async def decode(self, payloads):
+        self.threads.append(threading.current_thread().name)
+        return list(payloads)
+
+
+def _payload(size: int) -> Payload:
+    return Payload(metadata={"encoding": b"binary/plain"}, data=b"x" * size)
+
+
+class TestOffloadingPayloadCodec:
+    @pytest.mark.asyncio
+    async def test_small_payloads_stay_inline(self):
+        codec = ThreadRecordingCodec()
+        offloader = PayloadOffloader(1024)
+        wrapped = OffloadingPayloadCodec(codec, offloader)
+
+        await wrapped.encode([_payload(10)])
+        await wrapped.decode([_payload(10)])
+
+        assert codec.threads == [threading.current_thread().name] * 2
+        assert offloader.stats.inline == 2
+        assert offloader.stats.offloaded == 0
+
+    @pytest.mark.asyncio
+    async def test_large_payloads_run_in_executor(self):
+        codec = ThreadRecordingCodec()
+        offloader = PayloadOffloader(1024)
+        wrapped = OffloadingPayloadCodec(codec, offloader)
+
+        assert await wrapped.encode([_payload(600), _payload(600)]) == [_payload(600), _payload(600)]
+        await wrapped.decode([_payload(2000)])
+
+        assert all(name.startswith("temporal-boost-payload") for name in codec.threads)
+        assert offloader.stats.offloaded == 2
+        assert offloader.stats.bytes_offloaded == 3200
+        offloader.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_claim_check_shared_across_threads(self, tmp_path):
+        codec = ClaimCheckPayloadCodec(FileSystemBlobStore(tmp_path), threshold=16, memory_cache_size=2)
+        payloads = [Payload(metadata={"encoding": b"binary/plain"}, data=bytes([index]) * 64) for index in range(8)]
+        encoded = await codec.encode(payloads)
+        wrapped = OffloadingPayloadCodec(codec, PayloadOffloader(0, max_workers=8))
+
+        batches = await asyncio.gather(*(wrapped.decode(encoded) for _ in range(50)))
+
+        assert all(batch == payloads for batch in batches)
+        assert codec.stats.cache_hits + codec.stats.fetched == 50 * len(payloads)
+
+
+class TestOffloadingDataConverter:
+    @pytest.mark.asyncio
+    async def test_round_trip_with_codec(self):
+        codec = ThreadRecordingCodec()
+        offloader = PayloadOffloader(1024)
+        data_converter = with_payload_offload(DataConverter(payload_codec=codec), offloader)
+        value = {"data": "x" * 5000}
+
+        payloads = await data_converter.encode([value])
+        assert await data_converter.decode(payloads, [dict]) == [value]
+
+        assert isinstance(data_converter, OffloadingDataConverter)
+        assert isinstance(data_converter.payload_codec, OffloadingPayloadCodec)
+        # Encode offloads the codec step; decode offloads the whole decode, and the nested
+        # codec call runs inline on the executor thread without a second hop
+        assert offloader.stats.offloaded == 2
+        assert all(name.startswith("temporal-boost-payload") for name in codec.threads)
+        offloader.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_with_context_keeps_offloader(self):
+        offloader = PayloadOffloader(1024)
+        data_converter = with_payload_offload(DataConverter.default, offloader)
+
+        contextual = data_converter.with_context(MagicMock())
+
+        assert isinstance(contextual, OffloadingDataConverter)
+        assert contextual.offloader is offloader
+
+
+class TestClientBuilderPayloadOffload:
+    def test_wraps_codec_chain(self):
+        builder = TemporalClientBuilder()
+        builder.set_compression("zlib")
+        builder.set_payload_offload(1024, max_workers=2)
+
+        data_converter = builder._build_data_converter()
+
+        assert isinstance(data_converter, OffloadingDataConverter)
+        assert data_converter.offloader.threshold == 1024
+        assert isinstance(data_converter.payload_codec.codec, CompressionPayloadCodec)
+
+    def test_without_codecs(self):
+        builder = TemporalClientBuilder()
+        builder.set_payload_offload(1024)
+
+        data_converter = builder._build_data_converter()
+
+        assert isinstance(data_converter, OffloadingDataConverter)
+        assert data_converter.payload_codec is None
@@ -0,0 +1,115 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from temporalio.client import WorkflowHandle
+
+from temporal_boost.temporal.client import TemporalClientBuilder
+from temporal_boost.temporal.pool import ClientPoolStrategy, PooledWorkflowHandle, TemporalClientPool
+
+
+def make_client(name: str) -> MagicMock:
+    client = MagicMock(name=name)
+    client.namespace = "default"
+    client.start_workflow = AsyncMock(return_value=MagicMock(spec=WorkflowHandle))
+    client.count_workflows = AsyncMock(return_value=name)
+    return client
+
+
+class TestTemporalClientPool:
+    def test_init_requires_clients(self):
+        with pytest.raises(ValueError, match="at least one client"):
+            TemporalClientPool([])
+
+    def test_sync_attributes_forwarded(self):
+        pool = TemporalClientPool([make_client("a"), make_client("b")])
+        assert pool.namespace == "default"
+        assert pool.size == 2
+
+    @pytest.mark.asyncio
+    async def test_round_robin(self):
+        clients = [make_client("a"), make_client("b"), make_client("c")]
+        pool = TemporalClientPool(clients, strategy="round_robin")
+
+        results = [await pool.count_workflows() for _ in range(6)]
+
+        assert results == ["a", "b", "c", "a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_least_in_flight(self):
+        clients = [make_client("a"), make_client("b")]
+        release = asyncio.Event()
+
+        async def slow_count() -> str:
+            await release.wait()
+            return "a"
+
+        clients[0].count_workflows = AsyncMock(side_effect=slow_count)
+        pool = TemporalClientPool(clients, strategy=ClientPoolStrategy.least_in_flight)
+
+        pending = asyncio.create_task(pool.count_workflows())
+        await asyncio.sleep(0)
+        assert pool.in_flight == [1, 0]
+
+        assert await pool.count_workflows() == "b"
+        assert await pool.count_workflows() == "b"
+
+        release.set()
+        assert await pending == "a"
+        assert pool.in_flight == [0, 0]
+
+    @pytest.mark.asyncio
+    async def test_start_workflow_returns_tracked_handle(self):
+        pool = TemporalClientPool([make_client("a")])
+
+        handle = await pool.start_workflow("Workflow", id="wf", task_queue="q")
+
+        assert isinstance(handle, PooledWorkflowHandle)
+
+    def test_get_workflow_handle_spreads_connections(self):
+        clients = [make_client("a"), make_client("b")]
+        pool = TemporalClientPool(clients)
+
+        pool.get_workflow_handle("wf-1")
+        pool.get_workflow_handle("wf-2")
+
+        clients[0].get_workflow_handle.assert_called_once_with("wf-1")
+        clients[1].get_workflow_handle.assert_called_once_with("wf-2")
+
+    @pytest.mark.asyncio
+    async def test_handle_rpcs_counted_on_slot(self):
+        client = make_client("a")
+        inner_handle = MagicMock()
+        observed: list[int] = []
+
+        async def signal(*_: object) -> None:
+            observed.append(pool.in_flight[0])
+
+        inner_handle.signal = signal
+        client.get_workflow_handle = MagicMock(return_value=inner_handle)
+        pool = TemporalClientPool([client])
+
+        await pool.get_workflow_handle("wf").signal("approve")
+
+        assert observed == [1]
+        assert pool.in_flight == [0]
+
+
+class TestTemporalClientBuilderPool:
+    @pytest.mark.asyncio
+    async def test_build_pool(self):
+        builder = TemporalClientBuilder(target_host="localhost:7233")
+
+        with patch("temporalio.client.Client.connect", new_callable=AsyncMock) as mock_connect:
+            mock_connect.side_effect = [make_client("a"), make_client("b"), make_client("c")]
+
+            pool = await builder.build_pool(3, strategy="least_in_flight")
+
+        assert pool.size == 3
+        assert mock_connect.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_build_pool_invalid_size(self):
+        builder = TemporalClientBuilder()
+        with pytest.raises(ValueError, match="must be positive"):
+            await builder.build_pool(-1)
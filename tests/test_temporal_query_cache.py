@@ -0,0 +1,212 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+from temporalio.converter import DataConverter
+
+from temporal_boost.temporal.query_cache import QueryCache, QueryCacheInterceptor, QueryCacheOptions
+
+
+def make_client(query=None):
+    client = MagicMock(data_converter=DataConverter.default)
+    handle = MagicMock()
+    handle.query = query or AsyncMock(return_value={"state": "running"})
+    handle.signal = AsyncMock()
+    client.get_workflow_handle.return_value = handle
+    return client, handle
+
+
+class TestQueryCache:
+    @pytest.mark.asyncio
+    async def test_hit_within_ttl(self):
+        client, handle = make_client()
+        cache = QueryCache(client, QueryCacheOptions(ttl=10))
+
+        assert await cache.query("wf-1", "status") == {"state": "running"}
+        assert await cache.query("wf-1", "status") == {"state": "running"}
+
+        handle.query.assert_awaited_once_with("status", args=(), result_type=None)
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert cache.stats.hit_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_result_type_and_arguments_in_key(self):
+        class Status(BaseModel):
+            state: str
+
+        class Opaque:
+            def __repr__(self) -> str:
+                return "Opaque()"
+
+        async def query(name, args, result_type):
+            return Status(state="running") if result_type is Status else {"state": "running"}
+
+        client, handle = make_client(AsyncMock(side_effect=query))
+        cache = QueryCache(client, QueryCacheOptions(ttl=10))
+
+        assert await cache.query("wf-1", "status") == {"state": "running"}
+        assert await cache.query("wf-1", "status", result_type=Status) == Status(state="running")
+        await cache.query("wf-1", "status", {"page": 1})
+        await cache.query("wf-1", "status", {"page": 2})
+        # Not serializable: equal reprs must not share a result, so the cache is bypassed
+        await cache.query("wf-1", "status", Opaque())
+        await cache.query("wf-1", "status", Opaque())
+
+        assert handle.query.await_count == 6
+        assert cache.size == 4
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_refetched(self):
+        client, handle = make_client()
+        cache = QueryCache(client, QueryCacheOptions(ttl=10))
+
+        with patch("temporal_boost.temporal.query_cache.time") as mock_time:
+            mock_time.monotonic.side_effect = [0.0, 5.0, 11.0, 11.0]
+            await cache.query("wf-1", "status")
+            await cache.query("wf-1", "status")
+            await cache.query("wf-1", "status")
+
+        assert handle.query.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_per_query_ttl(self):
+        client, handle = make_client()
+        cache = QueryCache(client, QueryCacheOptions(ttl=10, ttls={"live": 0}))
+
+        await cache.query("wf-1", "live")
+        await cache.query("wf-1", "live")
+
+        assert handle.query.await_count == 2
+        assert cache.size == 0
+
+    @pytest.mark.asyncio
+    async def test_singleflight(self):
+        release = asyncio.Event()
+
+        async def slow_query(*args, **kwargs):
+            await release.wait()
+            return "done"
+
+        client, handle = make_client(AsyncMock(side_effect=slow_query))
+        cache = QueryCache(client, QueryCacheOptions(ttl=10))
+
+        calls = [asyncio.create_task(cache.query("wf-1", "status")) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*calls) == ["done"] * 10
+        assert handle.query.await_count == 1
+        assert cache.stats.coalesced == 9
+
+    @pytest.mark.asyncio
+    async def test_errors_shared_and_not_cached(self):
+        client, handle = make_client(AsyncMock(side_effect=RuntimeError("no poller")))
+        cache = QueryCache(client, QueryCacheOptions(ttl=10))
+
+        results = await asyncio.gather(
+            cache.query("wf-1", "status"),
+            cache.query("wf-1", "status"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert cache.size == 0
+        assert handle.query.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_bound(self):
+        client, _ = make_client()
+        cache = QueryCache(client, QueryCacheOptions(ttl=10, max_entries=2))
+
+        await cache.query("wf-1", "status")
+        await cache.query("wf-2", "status")
+        await cache.query("wf-1", "status")
+        await cache.query("wf-3", "status")
+
+        assert cache.size == 2
+        assert cache.stats.evictions == 1
+        await cache.query("wf-1", "status")
+        assert cache.stats.hits == 2
+
+    @pytest.mark.asyncio
+    async def test_signal_invalidates_workflow(self):
+        client, handle = make_client()
+        cache = QueryCache(client, QueryCacheOptions(ttl=10))
+        await cache.query("wf-1", "status")
+        await cache.query("wf-2", "status")
+
+        await cache.signal("wf-1", "approve", "manager")
+
+        handle.signal.assert_awaited_once_with("approve", args=("manager",))
+        assert cache.stats.invalidations == 1
+        await cache.query("wf-1", "status")
+        await cache.query("wf-2", "status")
+        assert handle.query.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidation_discards_query_in_flight(self):
+        release = asyncio.Event()
+
+        async def slow_query(*args, **kwargs):
+            await release.wait()
+            return "before signal"
+
+        client, handle = make_client(AsyncMock(side_effect=slow_query))
+        cache = QueryCache(client, QueryCacheOptions(ttl=10))
+
+        in_flight = asyncio.create_task(cache.query("wf-1", "status"))
+        await asyncio.sleep(0)
+        cache.invalidate("wf-1")
+        after_signal = asyncio.create_task(cache.query("wf-1", "status"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(in_flight, after_signal)
+
+        assert handle.query.await_count == 2
+        assert cache.stats.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_caller_cancellation_keeps_shared_query(self):
+        release = asyncio.Event()
+
+        async def slow_query(*args, **kwargs):
+            await release.wait()
+            return "done"
+
+        client, _ = make_client(AsyncMock(side_effect=slow_query))
+        cache = QueryCache(client, QueryCacheOptions(ttl=10))
+
+        first = asyncio.create_task(cache.query("wf-1", "status"))
+        second = asyncio.create_task(cache.query("wf-1", "status"))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+
+
+class TestQueryCacheInterceptor:
+    @pytest.mark.asyncio
+    async def test_client_signals_and_updates_invalidate(self):
+        client, handle = make_client()
+        cache = QueryCache(client, QueryCacheOptions(ttl=10))
+        interceptor = QueryCacheInterceptor()
+        next_interceptor = MagicMock()
+        next_interceptor.signal_workflow = AsyncMock()
+        next_interceptor.start_workflow_update = AsyncMock(side_effect=RuntimeError("rejected"))
+        outbound = interceptor.intercept_client(next_interceptor)
+
+        await cache.query("wf-1", "status")
+        await outbound.signal_workflow(MagicMock(id="wf-1"))
+        assert cache.stats.invalidations == 0
+
+        interceptor.cache = cache
+        await outbound.signal_workflow(MagicMock(id="wf-1"))
+        assert cache.stats.invalidations == 1
+
+        await cache.query("wf-1", "status")
+        with pytest.raises(RuntimeError, match="rejected"):
+            await outbound.start_workflow_update(MagicMock(id="wf-1"))
+        assert cache.stats.invalidations == 2
+        assert handle.query.await_count == 2
@@ -0,0 +1,108 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from temporal_boost.temporal.resources import (
+    PROCESS_COUNT_ENV,
+    ContainerResources,
+    auto_process_count,
+    auto_worker_limits,
+    detect_container_resources,
+)
+
+
+class TestDetectContainerResources:
+    def test_cgroup_v2_limits(self, tmp_path):
+        (tmp_path / "cgroup.controllers").write_text("cpu memory")
+        (tmp_path / "cpu.max").write_text("150000 100000\n")
+        (tmp_path / "memory.max").write_text("536870912\n")
+
+        with patch("temporal_boost.temporal.resources._host_cpu_count", return_value=8):
+            resources = detect_container_resources(tmp_path)
+
+        assert resources.source == "cgroup2"
+        assert resources.cpu_limit == 1.5
+        assert resources.memory_limit == 536870912
+
+    def test_cgroup_v2_unlimited(self, tmp_path):
+        (tmp_path / "cgroup.controllers").write_text("cpu memory")
+        (tmp_path / "cpu.max").write_text("max 100000\n")
+        (tmp_path / "memory.max").write_text("max\n")
+
+        with patch("temporal_boost.temporal.resources._host_cpu_count", return_value=4):
+            resources = detect_container_resources(tmp_path)
+
+        assert resources.cpu_limit == 4.0
+        assert resources.memory_limit is None
+
+    def test_cgroup_v1_limits(self, tmp_path):
+        (tmp_path / "cpu").mkdir()
+        (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("200000")
+        (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000")
+        (tmp_path / "memory").mkdir()
+        (tmp_path / "memory" / "memory.limit_in_bytes").write_text("9223372036854771712")
+
+        with patch("temporal_boost.temporal.resources._host_cpu_count", return_value=8):
+            resources = detect_container_resources(tmp_path)
+
+        assert resources.source == "cgroup1"
+        assert resources.cpu_limit == 2.0
+        assert resources.memory_limit is None
+
+    def test_quota_capped_by_host_cpus(self, tmp_path):
+        (tmp_path / "cgroup.controllers").write_text("cpu")
+        (tmp_path / "cpu.max").write_text("1600000 100000")
+
+        with patch("temporal_boost.temporal.resources._host_cpu_count", return_value=4):
+            resources = detect_container_resources(tmp_path)
+
+        assert resources.cpu_limit == 4.0
+
+    def test_no_cgroup(self, tmp_path):
+        with patch("temporal_boost.temporal.resources._host_cpu_count", return_value=3):
+            resources = detect_container_resources(tmp_path / "missing")
+
+        assert resources.source == "host"
+        assert resources.cpu_limit == 3.0
+
+
+class TestAutoSizing:
+    def test_auto_process_count(self):
+        assert auto_process_count(ContainerResources(cpu_limit=0.5, memory_limit=None, source="cgroup2")) == 1
+        assert auto_process_count(ContainerResources(cpu_limit=3.7, memory_limit=None, source="cgroup2")) == 3
+
+    def test_auto_worker_limits_cpu_bound(self):
+        resources = ContainerResources(cpu_limit=2.0, memory_limit=None, source="cgroup2")
+        limits = auto_worker_limits(resources, processes=1)
+
+        assert limits.max_concurrent_workflow_tasks == 200
+        assert limits.max_concurrent_activities == 200
+        assert limits.max_concurrent_local_activities == 66
+        assert limits.max_concurrent_workflow_task_polls == 6
+        assert limits.max_concurrent_activity_task_polls == 6
+        assert limits.activity_executor_workers == 200
+
+    def test_auto_worker_limits_memory_bound(self):
+        resources = ContainerResources(cpu_limit=4.0, memory_limit=256 * 1024 * 1024, source="cgroup2")
+        limits = auto_worker_limits(resources, processes=2)
+
+        assert limits.max_concurrent_activities == 32
+        assert limits.max_concurrent_workflow_task_polls == 2
+        assert limits.max_concurrent_activity_task_polls == 1
+
+    def test_auto_worker_limits_reads_process_count_from_env(self):
+        resources = ContainerResources(cpu_limit=4.0, memory_limit=None, source="cgroup2")
+        with patch.dict(os.environ, {PROCESS_COUNT_ENV: "4"}):
+            limits = auto_worker_limits(resources)
+
+        assert limits.max_concurrent_activities == 100
+
+    @pytest.mark.parametrize("cpu_limit", [0.01, 0.1])
+    def test_auto_worker_limits_minimum(self, cpu_limit):
+        resources = ContainerResources(cpu_limit=cpu_limit, memory_limit=None, source="cgroup2")
+        limits = auto_worker_limits(resources, processes=1)
+
+        assert limits.max_concurrent_activities >= 2
+        assert limits.max_concurrent_local_activities >= 1
+        assert limits.max_concurrent_workflow_task_polls >= 2
@@ -0,0 +1,108 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from temporalio.client import WorkflowFailureError
+from temporalio.exceptions import ApplicationError
+
+from temporal_boost.temporal.result_waiter import ResultWaiter
+
+
+def make_client(result):
+    client = MagicMock()
+    handle = MagicMock()
+    handle.result = result
+    client.get_workflow_handle.return_value = handle
+    return client, handle
+
+
+def gated_result(release, value="done"):
+    async def result():
+        await release.wait()
+        if isinstance(value, BaseException):
+            raise value
+        return value
+
+    return AsyncMock(side_effect=result)
+
+
+class TestResultWaiter:
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_share_one_long_poll(self):
+        release = asyncio.Event()
+        client, handle = make_client(gated_result(release))
+        waiter = ResultWaiter(client)
+
+        waits = [asyncio.create_task(waiter.result("wf-1", result_type=str)) for _ in range(20)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waits) == ["done"] * 20
+        handle.result.assert_awaited_once()
+        client.get_workflow_handle.assert_called_once_with("wf-1", run_id=None, result_type=str)
+        assert (waiter.stats.long_polls, waiter.stats.coalesced) == (1, 19)
+        assert waiter.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_result_cached_briefly(self):
+        client, handle = make_client(AsyncMock(return_value="done"))
+        waiter = ResultWaiter(client, cache_ttl=5)
+
+        with patch("temporal_boost.temporal.result_waiter.time") as mock_time:
+            mock_time.monotonic.side_effect = [0.0, 1.0, 6.0, 6.0]
+            assert await waiter.result("wf-1") == "done"
+            assert await waiter.result("wf-1") == "done"
+            assert await waiter.result("wf-1") == "done"
+
+        assert handle.result.await_count == 2
+        assert waiter.stats.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_fanned_out_and_cached(self):
+        failure = WorkflowFailureError(cause=ApplicationError("boom"))
+        release = asyncio.Event()
+        client, handle = make_client(gated_result(release, failure))
+        waiter = ResultWaiter(client, cache_ttl=5)
+
+        waits = [asyncio.create_task(waiter.result("wf-1")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waits, return_exceptions=True)
+
+        assert all(result is failure for result in results)
+        with pytest.raises(WorkflowFailureError):
+            await waiter.result("wf-1")
+        handle.result.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rpc_errors_not_cached(self):
+        client, handle = make_client(AsyncMock(side_effect=[RuntimeError("unavailable"), "done"]))
+        waiter = ResultWaiter(client, cache_ttl=5)
+
+        with pytest.raises(RuntimeError):
+            await waiter.result("wf-1")
+        assert await waiter.result("wf-1") == "done"
+
+    @pytest.mark.asyncio
+    async def test_waiter_timeout_keeps_shared_poll(self):
+        release = asyncio.Event()
+        client, handle = make_client(gated_result(release))
+        waiter = ResultWaiter(client)
+
+        patient = asyncio.create_task(waiter.result("wf-1"))
+        with pytest.raises(asyncio.TimeoutError):
+            await waiter.result("wf-1", timeout=0.01)
+        release.set()
+
+        assert await patient == "done"
+        handle.result.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_long_poll_cancelled_without_waiters(self):
+        client, _ = make_client(gated_result(asyncio.Event()))
+        waiter = ResultWaiter(client)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await waiter.result("wf-1", timeout=0.01)
+
+        assert waiter.pending == 0
@@ -0,0 +1,171 @@
+import dataclasses
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from temporalio import workflow
+from temporalio.client import ScheduleAlreadyRunningError, ScheduleOverlapPolicy, ScheduleUpdateInput
+
+from temporal_boost.temporal.schedule import (
+    CronScheduleOptions,
+    ReconcileResult,
+    build_cron_schedule,
+    cron_schedule_id,
+    reconcile_cron_schedule,
+)
+from temporal_boost.workers.temporal import TemporalBoostWorker
+
+
+@workflow.defn(name="DailyReport")
+class DailyReportWorkflow:
+    @workflow.run
+    async def run(self) -> None:
+        pass
+
+
+class FakeScheduleHandle:
+    def __init__(self, schedule):
+        self.schedule = schedule
+        self.updates = 0
+
+    async def update(self, updater):
+        description = MagicMock(schedule=self.schedule)
+        update = updater(ScheduleUpdateInput(description=description))
+        if update is not None:
+            self.schedule = update.schedule
+            self.updates += 1
+
+
+class FakeClient:
+    def __init__(self):
+        self.handles: dict[str, FakeScheduleHandle] = {}
+
+    async def create_schedule(self, schedule_id, schedule):
+        if schedule_id in self.handles:
+            raise ScheduleAlreadyRunningError
+        self.handles[schedule_id] = FakeScheduleHandle(schedule)
+
+    def get_schedule_handle(self, schedule_id):
+        return self.handles[schedule_id]
+
+
+class TestBuildCronSchedule:
+    def test_deterministic_id(self):
+        assert cron_schedule_id("reports", DailyReportWorkflow.run) == "cron-reports-DailyReport"
+        assert cron_schedule_id("reports/eu west", "Report") == "cron-reports-eu-west-Report"
+
+    def test_options(self):
+        options = CronScheduleOptions(
+            schedule_id="nightly",
+            overlap="buffer_one",
+            jitter=timedelta(seconds=30),
+            catchup_window=timedelta(minutes=10),
+            time_zone="Europe/Amsterdam",
+        )
+        schedule_id, schedule = build_cron_schedule("0 0 * * *", DailyReportWorkflow.run, "reports", options)
+
+        assert schedule_id == "nightly"
+        assert schedule.action.workflow == "DailyReport"
+        assert schedule.action.id == "nightly"
+        assert schedule.spec.cron_expressions == ["0 0 * * *"]
+        assert schedule.spec.jitter == timedelta(seconds=30)
+        assert schedule.spec.time_zone_name == "Europe/Amsterdam"
+        assert schedule.policy.overlap == ScheduleOverlapPolicy.BUFFER_ONE
+        assert schedule.policy.catchup_window == timedelta(minutes=10)
+
+    def test_defaults(self):
+        _, schedule = build_cron_schedule("0 0 * * *", DailyReportWorkflow.run, "reports")
+        assert schedule.policy.overlap == ScheduleOverlapPolicy.SKIP
+        assert schedule.policy.catchup_window == timedelta(seconds=60)
+        assert schedule.spec.jitter is None
+
+    def test_fingerprint_tracks_configuration(self):
+        _, first = build_cron_schedule("0 0 * * *", DailyReportWorkflow.run, "reports")
+        _, same = build_cron_schedule("0 0 * * *", DailyReportWorkflow.run, "reports")
+        _, other = build_cron_schedule("0 1 * * *", DailyReportWorkflow.run, "reports")
+        assert first.state.note == same.state.note
+        assert first.state.note != other.state.note
+
+    def test_unknown_overlap_policy(self):
+        with pytest.raises(ValueError, match="overlap"):
+            build_cron_schedule("0 0 * * *", "Report", "reports", CronScheduleOptions(overlap="overlap"))
+
+
+class TestReconcileCronSchedule:
+    @pytest.mark.asyncio
+    async def test_created_once_across_replicas(self):
+        client = FakeClient()
+
+        results = [
+            await reconcile_cron_schedule(client, "0 0 * * *", DailyReportWorkflow.run, "reports") for _ in range(3)
+        ]
+
+        assert results == [ReconcileResult.created, ReconcileResult.unchanged, ReconcileResult.unchanged]
+        assert list(client.handles) == ["cron-reports-DailyReport"]
+        assert client.handles["cron-reports-DailyReport"].updates == 0
+
+    @pytest.mark.asyncio
+    async def test_updates_changed_schedule_and_keeps_pause(self):
+        client = FakeClient()
+        await reconcile_cron_schedule(client, "0 0 * * *", DailyReportWorkflow.run, "reports")
+        handle = client.handles["cron-reports-DailyReport"]
+        handle.schedule = dataclasses.replace(
+            handle.schedule,
+            state=dataclasses.replace(handle.schedule.state, paused=True),
+        )
+
+        result = await reconcile_cron_schedule(client, "30 2 * * *", DailyReportWorkflow.run, "reports")
+
+        assert result == ReconcileResult.updated
+        assert handle.schedule.spec.cron_expressions == ["30 2 * * *"]
+        assert handle.schedule.state.paused
+
+
+class TestCronWorker:
+    @pytest.mark.asyncio
+    async def test_run_reconciles_schedule(self):
+        worker = TemporalBoostWorker(
+            "reports_worker",
+            "reports",
+            workflows=[DailyReportWorkflow],
+            cron_schedule="0 0 * * *",
+            cron_runner=DailyReportWorkflow.run,
+            cron_options=CronScheduleOptions(overlap="allow_all"),
+        )
+        client = MagicMock()
+        temporal_worker = MagicMock(run=AsyncMock(), shutdown=AsyncMock())
+
+        async def build_worker():
+            worker._client, worker._worker = client, temporal_worker
+
+        with (
+            patch.object(worker, "_build_worker", side_effect=build_worker),
+            patch("temporal_boost.temporal.schedule.reconcile_cron_schedule", new_callable=AsyncMock) as reconcile,
+        ):
+            await worker._run_worker()
+
+        reconcile.assert_awaited_once_with(
+            client,
+            "0 0 * * *",
+            DailyReportWorkflow.run,
+            "reports",
+            CronScheduleOptions(overlap="allow_all"),
+        )
+        temporal_worker.run.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_without_cron_skips_schedule(self):
+        worker = TemporalBoostWorker("reports_worker", "reports", workflows=[DailyReportWorkflow])
+        temporal_worker = MagicMock(run=AsyncMock(), shutdown=AsyncMock())
+
+        async def build_worker():
+            worker._client, worker._worker = MagicMock(), temporal_worker
+
+        with (
+            patch.object(worker, "_build_worker", side_effect=build_worker),
+            patch("temporal_boost.temporal.schedule.reconcile_cron_schedule", new_callable=AsyncMock) as reconcile,
+        ):
+            await worker._run_worker()
+
+        reconcile.assert_not_awaited()
+        assert not worker.has_cron_schedule
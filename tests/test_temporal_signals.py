@@ -0,0 +1,141 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from temporalio.converter import DataConverter
+from temporalio.service import RPCError, RPCStatusCode
+
+from temporal_boost.temporal.signals import SignalDispatcher
+from temporal_boost.workers.temporal import TemporalBoostWorker
+
+
+def make_client(signal: AsyncMock | None = None) -> MagicMock:
+    client = MagicMock(data_converter=DataConverter.default)
+    handle = MagicMock()
+    handle.signal = signal or AsyncMock(return_value=None)
+    client.get_workflow_handle = MagicMock(return_value=handle)
+    return client
+
+
+class TestSignalDispatcher:
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError, match="must be positive"):
+            SignalDispatcher(MagicMock(), concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_signal_delivered(self):
+        client = make_client()
+        dispatcher = SignalDispatcher(client, coalesce_window=0)
+
+        await dispatcher.signal("wf-1", "approve", "manager")
+
+        client.get_workflow_handle.assert_called_once_with("wf-1", run_id=None)
+        client.get_workflow_handle.return_value.signal.assert_awaited_once_with("approve", args=("manager",))
+        assert dispatcher.stats.sent == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicates_coalesced_within_window(self):
+        client = make_client()
+        dispatcher = SignalDispatcher(client, coalesce_window=0.01)
+
+        await asyncio.gather(
+            dispatcher.signal("wf-1", "approve"),
+            dispatcher.signal("wf-1", "approve"),
+            dispatcher.signal("wf-1", "reject"),
+            dispatcher.signal("wf-2", "approve"),
+        )
+
+        assert client.get_workflow_handle.return_value.signal.await_count == 3
+        assert dispatcher.stats.coalesced == 1
+        assert dispatcher.stats.sent == 3
+
+    @pytest.mark.asyncio
+    async def test_coalesces_on_encoded_arguments(self):
+        class Opaque:
+            def __repr__(self) -> str:
+                return "Opaque()"
+
+        client = make_client()
+        dispatcher = SignalDispatcher(client, coalesce_window=0.01)
+
+        await asyncio.gather(
+            dispatcher.signal("wf-1", "approve", {"amount": 1}),
+            dispatcher.signal("wf-1", "approve", {"amount": 1}),
+            dispatcher.signal("wf-1", "approve", {"amount": 2}),
+            # Not serializable: never coalesced, even with equal reprs
+            dispatcher.signal("wf-1", "note", Opaque()),
+            dispatcher.signal("wf-1", "note", Opaque()),
+            dispatcher.signal("wf-1", "note", Opaque(), dedupe_key="note-1"),
+            dispatcher.signal("wf-1", "note", Opaque(), dedupe_key="note-1"),
+        )
+
+        assert client.get_workflow_handle.return_value.signal.await_count == 5
+        assert dispatcher.stats.coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_on_unavailable(self):
+        signal = AsyncMock(side_effect=[RPCError("down", RPCStatusCode.UNAVAILABLE, b""), None])
+        dispatcher = SignalDispatcher(make_client(signal), coalesce_window=0, retry_backoff=0)
+
+        await dispatcher.signal("wf-1", "approve")
+
+        assert signal.await_count == 2
+        assert dispatcher.stats.retried == 1
+        assert dispatcher.stats.sent == 1
+
+    @pytest.mark.asyncio
+    async def test_no_retry_on_not_found(self):
+        signal = AsyncMock(side_effect=RPCError("gone", RPCStatusCode.NOT_FOUND, b""))
+        dispatcher = SignalDispatcher(make_client(signal), coalesce_window=0, retry_backoff=0)
+
+        with pytest.raises(RPCError):
+            await dispatcher.signal("wf-1", "approve")
+
+        assert signal.await_count == 1
+        assert dispatcher.stats.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_fan_out_report(self):
+        def get_workflow_handle(workflow_id, run_id=None):
+            handle = MagicMock()
+
+            async def handle_signal(name, args):
+                if workflow_id == "wf-3":
+                    raise RuntimeError("boom")
+
+            handle.signal = handle_signal
+            return handle
+
+        client = MagicMock(data_converter=DataConverter.default)
+        client.get_workflow_handle = get_workflow_handle
+        dispatcher = SignalDispatcher(client, coalesce_window=0, concurrency=2)
+
+        report = await dispatcher.fan_out(["wf-1", "wf-2", "wf-2", "wf-3"], "approve")
+
+        assert report.sent == 2
+        assert report.coalesced == 1
+        assert list(report.failures) == ["wf-3"]
+        assert report.throughput > 0
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending(self):
+        client = make_client()
+        dispatcher = SignalDispatcher(client, coalesce_window=60)
+
+        dispatcher.submit("wf-1", "approve")
+        await dispatcher.close()
+
+        client.get_workflow_handle.return_value.signal.assert_awaited_once()
+
+
+class TestTemporalBoostWorkerSignalDispatcher:
+    def test_signal_dispatcher_uses_worker_client(self):
+        def dummy_activity():
+            pass
+
+        worker = TemporalBoostWorker(worker_name="test_worker", task_queue="test_queue", activities=[dummy_activity])
+        worker._client = MagicMock()
+
+        dispatcher = worker.signal_dispatcher(concurrency=10)
+
+        assert dispatcher._client is worker._client
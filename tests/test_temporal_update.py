@@ -0,0 +1,88 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from temporalio.client import WorkflowUpdateStage
+from temporalio.common import WorkflowIDConflictPolicy
+
+from temporal_boost.temporal.update import UpdateWithStartCaller, resolve_update_stage
+from temporal_boost.workers.temporal import TemporalBoostWorker
+
+
+def make_client(result="ok"):
+    handle = MagicMock(workflow_id="cart-1", workflow_run_id="run-1", id="update-1")
+    handle.result = AsyncMock(return_value=result)
+    client = MagicMock()
+    client.start_update_with_start_workflow = AsyncMock(return_value=handle)
+    return client, handle
+
+
+class TestResolveUpdateStage:
+    def test_names(self):
+        assert resolve_update_stage("accepted") == WorkflowUpdateStage.ACCEPTED
+        assert resolve_update_stage("COMPLETED") == WorkflowUpdateStage.COMPLETED
+        assert resolve_update_stage(None) == WorkflowUpdateStage.COMPLETED
+
+    def test_admitted_rejected(self):
+        with pytest.raises(ValueError, match="admitted"):
+            resolve_update_stage(WorkflowUpdateStage.ADMITTED)
+
+    def test_unknown(self):
+        with pytest.raises(ValueError, match="Unknown update wait stage"):
+            resolve_update_stage("finished")
+
+
+class TestUpdateWithStartCaller:
+    @pytest.mark.asyncio
+    async def test_completed_returns_result_in_one_call(self):
+        client, handle = make_client(result=3)
+        caller = UpdateWithStartCaller(client, "carts")
+
+        result = await caller.call("CartWorkflow", "add_item", workflow_id="cart-1", args=["u1"], update_args=["sku"])
+
+        assert result.completed
+        assert result.result == 3
+        assert (result.workflow_id, result.run_id, result.update_id) == ("cart-1", "run-1", "update-1")
+        kwargs = client.start_update_with_start_workflow.call_args.kwargs
+        assert kwargs["args"] == ["sku"]
+        assert kwargs["wait_for_stage"] == WorkflowUpdateStage.COMPLETED
+        operation = kwargs["start_workflow_operation"]
+        assert operation._start_workflow_input.id == "cart-1"
+        assert operation._start_workflow_input.task_queue == "carts"
+        assert operation._start_workflow_input.id_conflict_policy == WorkflowIDConflictPolicy.USE_EXISTING
+        handle.result.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_accepted_skips_result(self):
+        client, handle = make_client()
+        caller = UpdateWithStartCaller(client, "carts", wait_for_stage="accepted")
+
+        result = await caller.call("CartWorkflow", "add_item", workflow_id="cart-1")
+
+        assert not result.completed
+        assert result.result is None
+        handle.result.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        client, _ = make_client()
+
+        async def slow(*args, **kwargs):
+            await asyncio.sleep(1)
+
+        client.start_update_with_start_workflow = slow
+        caller = UpdateWithStartCaller(client, "carts", timeout=0.01)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await caller.call("CartWorkflow", "add_item", workflow_id="cart-1")
+
+    def test_worker_caller_uses_worker_client(self):
+        worker = TemporalBoostWorker("worker", "carts", activities=[MagicMock()])
+        worker._client = MagicMock()
+
+        caller = worker.update_with_start_caller(wait_for_stage="accepted", timeout=5)
+
+        assert caller._client is worker._client
+        assert caller._task_queue == "carts"
+        assert caller._wait_for_stage == WorkflowUpdateStage.ACCEPTED
+        assert caller._timeout == 5
@@ -1,12 +1,23 @@
 import logging
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from temporalio import workflow
 
+from temporal_boost.temporal.bulk import BulkStartItem
+from temporal_boost.temporal.converter import pydantic_data_converter
 from temporal_boost.temporal.worker import TemporalWorkerBuilder
 from temporal_boost.workers.temporal import TemporalBoostWorker
 
 
+@workflow.defn
+class BulkItemWorkflow:
+    @workflow.run
+    async def run(self, item: BulkStartItem) -> None:
+        pass
+
+
 class TestTemporalWorkerBuilder:
     def test_init_with_defaults(self):
         builder = TemporalWorkerBuilder(task_queue="test_queue")
@@ -110,6 +121,88 @@ class TestTemporalWorkerBuilder:
             assert call_kwargs["activities"] == [activity]
             assert call_kwargs["workflows"] == [Workflow]
 
+    def test_build_with_auto_limits(self):
+        builder = TemporalWorkerBuilder(
+            task_queue="test_queue",
+            max_concurrent_activities="auto",
+            max_concurrent_workflow_tasks=50,
+        )
+        builder.set_client(MagicMock())
+
+        def sync_activity():
+            pass
+
+        builder.set_activities([sync_activity])
+        limits = MagicMock(max_concurrent_activities=120, activity_executor_workers=120)
+
+        with (
+            patch("temporal_boost.temporal.worker.auto_worker_limits", return_value=limits),
+            patch("temporal_boost.temporal.worker.Worker") as mock_worker_class,
+        ):
+            builder.build()
+
+        call_kwargs = mock_worker_class.call_args[1]
+        assert call_kwargs["max_concurrent_activities"] == 120
+        assert call_kwargs["max_concurrent_workflow_tasks"] == 50
+        assert call_kwargs["activity_executor"]._max_workers == 120
+
+        builder.shutdown()
+        assert call_kwargs["activity_executor"]._shutdown
+        assert "activity_executor" not in builder._worker_kwargs
+
+    @pytest.mark.parametrize("value", ["Auto", " auto ", "AUTO"])
+    def test_auto_limit_normalized(self, value):
+        builder = TemporalWorkerBuilder(task_queue="test_queue", max_concurrent_workflow_tasks=value)
+        limits = MagicMock(max_concurrent_workflow_tasks=80)
+
+        with patch("temporal_boost.temporal.worker.auto_worker_limits", return_value=limits):
+            assert builder._resolve_limits()["max_concurrent_workflow_tasks"] == 80
+
+    def test_invalid_limit(self):
+        builder = TemporalWorkerBuilder(task_queue="test_queue", max_concurrent_activities="many")
+
+        with pytest.raises(ValueError, match="Expected an integer or 'auto' for max_concurrent_activities"):
+            builder._resolve_limits()
+
+    def test_build_precompiles_type_adapters(self):
+        builder = TemporalWorkerBuilder(task_queue="test_queue")
+        builder.set_client(MagicMock(data_converter=pydantic_data_converter))
+        workflows, activities = [MagicMock()], [MagicMock()]
+        builder.set_workflows(workflows)
+        builder.set_activities(activities)
+
+        with (
+            patch("temporal_boost.temporal.worker.precompile_type_adapters", return_value=3) as mock_precompile,
+            patch("temporal_boost.temporal.worker.Worker"),
+        ):
+            builder.build()
+
+        mock_precompile.assert_called_once_with(workflows, activities)
+
+    def test_build_passes_model_modules_through_sandbox(self):
+        builder = TemporalWorkerBuilder(task_queue="test_queue")
+        builder.set_client(MagicMock(data_converter=pydantic_data_converter))
+        builder.set_workflows([BulkItemWorkflow])
+
+        with patch("temporal_boost.temporal.worker.Worker") as mock_worker_class:
+            builder.build()
+
+        runner = mock_worker_class.call_args[1]["workflow_runner"]
+        assert "temporal_boost.temporal.bulk" in runner.restrictions.passthrough_modules
+        assert __name__ not in runner.restrictions.passthrough_modules
+
+    def test_build_skips_precompile_for_default_converter(self):
+        builder = TemporalWorkerBuilder(task_queue="test_queue")
+        builder.set_client(MagicMock())
+
+        with (
+            patch("temporal_boost.temporal.worker.precompile_type_adapters") as mock_precompile,
+            patch("temporal_boost.temporal.worker.Worker"),
+        ):
+            builder.build()
+
+        mock_precompile.assert_not_called()
+
 
 class TestTemporalBoostWorker:
     def test_init_with_minimal_params(self):
@@ -363,6 +456,7 @@ class TestTemporalBoostWorker:
 
                 assert worker._client == mock_client
                 assert worker._worker == mock_worker
+                mock_client_build.assert_awaited_once_with(lazy=False)
 
     @pytest.mark.asyncio
     async def test_shutdown(self):
@@ -403,3 +497,101 @@ class TestTemporalBoostWorker:
         assert "Worker 'test_worker' started" in caplog.text
         assert "test_queue" in caplog.text
 
+
+LAZY_ACTIVITIES = """
+from temporalio import activity
+
+from boost_lazy_orders.shared import audit
+
+
+@activity.defn
+async def charge(order_id: str) -> str:
+    return order_id
+
+
+@activity.defn
+def refund(order_id: str) -> str:
+    return order_id
+
+
+def helper() -> None:
+    pass
+"""
+
+LAZY_SHARED = """
+from temporalio import activity
+from temporalio.worker import Interceptor
+
+
+@activity.defn
+async def audit() -> None:
+    pass
+
+
+class AuditInterceptor(Interceptor):
+    pass
+
+
+audit_interceptor = AuditInterceptor()
+"""
+
+LAZY_WORKFLOWS = """
+from temporalio import workflow
+
+
+@workflow.defn
+class OrderWorkflow:
+    @workflow.run
+    async def run(self) -> None:
+        pass
+"""
+
+
+class TestLazyDefinitions:
+    @pytest.fixture(autouse=True)
+    def orders_package(self, tmp_path, monkeypatch):
+        package = tmp_path / "boost_lazy_orders"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "activities.py").write_text(LAZY_ACTIVITIES)
+        (package / "shared.py").write_text(LAZY_SHARED)
+        (package / "workflows.py").write_text(LAZY_WORKFLOWS)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        yield
+        for module in [name for name in sys.modules if name.startswith("boost_lazy_orders")]:
+            del sys.modules[module]
+
+    def test_resolved_when_worker_starts(self):
+        worker = TemporalBoostWorker(
+            "orders",
+            "order_queue",
+            activities=["boost_lazy_orders.activities:*", "boost_lazy_orders.shared:audit"],
+            workflows=["boost_lazy_orders.workflows:*"],
+            interceptors=["boost_lazy_orders.shared:audit_interceptor"],
+        )
+        assert "boost_lazy_orders" not in sys.modules
+
+        builder = worker._worker_builder
+        assert [activity.__name__ for activity in builder.activities] == ["charge", "refund", "audit"]
+        assert [workflow.__name__ for workflow in worker.workflows] == ["OrderWorkflow"]
+        assert type(builder.interceptors[0]).__name__ == "AuditInterceptor"
+
+    def test_pattern_filters_names(self):
+        builder = TemporalWorkerBuilder(task_queue="q")
+        builder.set_activities(["boost_lazy_orders.activities:ref*", "boost_lazy_orders.activities:refund"])
+
+        assert [activity.__name__ for activity in builder.activities] == ["refund"]
+
+    def test_pattern_without_matches(self):
+        builder = TemporalWorkerBuilder(task_queue="q")
+        builder.set_workflows(["boost_lazy_orders.activities:*"])
+
+        with pytest.raises(ValueError, match="matched no workflows"):
+            _ = builder.workflows
+
+    def test_missing_module(self):
+        builder = TemporalWorkerBuilder(task_queue="q")
+        builder.set_activities(["boost_lazy_orders.missing:*"])
+
+        with pytest.raises(ValueError, match="Could not import module"):
+            _ = builder.activities